@@ -74,6 +74,21 @@ EV_CHARGER_DEFAULT_CHARGING_EFFICIENCY = 0.9
 
 DEFAULT_COP = 3
 
+# Calculate trade fees and the propagation of the original order info in the grid fee classes
+# with scaled integers instead of Decimal numbers.
+FIXED_POINT_GRID_FEES = False
+
+# Buffer the trade events of the assets that are directly connected (without an aggregator) and
+# publish them once per tick as a single message that contains the list of trades.
+# Set by the --batch-external-trade-events CLI option or the batch_external_trade_events setting
+# of rq jobs.
+BATCH_EXTERNAL_TRADE_EVENTS = False
+
+# Step the heat pumps of an area (single water tank, universal COP model) together in one
+# vectorized pass on the market cycle, instead of stepping each heat pump separately.
+# Set by the --batch-heat-pump-fleet CLI option or the batch_heat_pump_fleet setting of rq jobs.
+BATCH_HEAT_PUMP_FLEET = False
+
 
 class SettlementTemplateStrategiesConstants:
     """Constants related to the configuration of settlement template strategies"""
@@ -0,0 +1,218 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import tempfile
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from logging import getLogger
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from pendulum import duration, today
+
+log = getLogger(__name__)
+
+BENCHMARK_REPORT_VERSION = 1
+BENCHMARK_SETUP_MODULE = "benchmark.scaled_houses"
+BENCHMARK_MARKET_TYPES = ("one-sided", "two-sided", "future", "forward")
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A single grid size / market type combination of the benchmark suite."""
+
+    houses: int
+    market_type: str
+    slots: int = 4
+    slot_length_minutes: int = 15
+    tick_length_seconds: int = 15
+    seed: int = 0
+
+    @property
+    def name(self) -> str:
+        """Stable identifier of the case, used to compare reports between commits."""
+        return f"{self.market_type}-{self.houses}-houses-{self.slots}-slots"
+
+
+def _configure_market_type(market_type: str) -> None:
+    # pylint: disable=import-outside-toplevel
+    from gsy_framework.constants_limits import ConstSettings
+    from gsy_framework.enums import SpotMarketTypeEnum
+
+    if market_type not in BENCHMARK_MARKET_TYPES:
+        raise ValueError(f"Unknown benchmark market type {market_type}.")
+    ConstSettings.MASettings.MARKET_TYPE = (
+        SpotMarketTypeEnum.ONE_SIDED.value
+        if market_type == "one-sided"
+        else SpotMarketTypeEnum.TWO_SIDED.value
+    )
+    if market_type == "future":
+        ConstSettings.FutureMarketSettings.FUTURE_MARKET_DURATION_HOURS = 4
+    if market_type == "forward":
+        ConstSettings.ForwardMarketSettings.ENABLE_FORWARD_MARKETS = True
+        ConstSettings.ForwardMarketSettings.FULLY_AUTO_TRADING = True
+
+
+def _aggregate_tick_profile(tick_profile_path: str) -> Dict[str, Dict[str, float]]:
+    """Sum the per-slot summaries of the tick profiler over the whole run."""
+    totals = {"phases": defaultdict(float), "markets": defaultdict(float)}
+    with open(tick_profile_path, "r", encoding="utf-8") as summary_file:
+        for line in summary_file:
+            slot_summary = json.loads(line)
+            for phase, stats in slot_summary["phases"].items():
+                totals["phases"][phase] += stats["total_s"]
+            for market_key, seconds in slot_summary["markets"].items():
+                totals["markets"][market_key] += seconds
+    return {category: dict(values) for category, values in totals.items()}
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024.0 * 1024.0) if platform.system() == "Darwin" else max_rss / 1024.0
+
+
+def run_benchmark_case(case: BenchmarkCase) -> Dict:
+    """Run a single benchmark case in the current process and return its measurements."""
+    # Imports are deferred so that the market type settings are in place before any
+    # module reads them, and so that the parent process stays lightweight.
+    # pylint: disable=import-outside-toplevel
+    from gsy_framework.constants_limits import TIME_ZONE
+
+    from gsy_e.gsy_e_core.simulation import Simulation
+    from gsy_e.models.config import SimulationConfig
+    from gsy_e.setup.benchmark.scaled_houses import BENCHMARK_HOUSES_ENV_VAR
+
+    os.environ[BENCHMARK_HOUSES_ENV_VAR] = str(case.houses)
+    _configure_market_type(case.market_type)
+
+    slot_length = duration(minutes=case.slot_length_minutes)
+    config = SimulationConfig(
+        sim_duration=slot_length * case.slots,
+        slot_length=slot_length,
+        tick_length=duration(seconds=case.tick_length_seconds),
+        start_date=today(tz=TIME_ZONE),
+        external_connection_enabled=False,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tick_profile_path = os.path.join(tmp_dir, "tick_profile.jsonl")
+        setup_start = perf_counter()
+        simulation = Simulation(
+            BENCHMARK_SETUP_MODULE,
+            config,
+            None,
+            case.seed,
+            no_export=True,
+            interactive_console=False,
+            tick_profile_path=tick_profile_path,
+        )
+        setup_seconds = perf_counter() - setup_start
+
+        run_start = perf_counter()
+        simulation.run()
+        run_seconds = perf_counter() - run_start
+        tick_profile = _aggregate_tick_profile(tick_profile_path)
+
+    phases = tick_profile["phases"]
+    # Matching of the markets runs inside tick_and_dispatch, the dispatch time excludes it
+    matching_seconds = sum(tick_profile["markets"].values())
+    total_ticks = case.slots * config.ticks_per_slot
+    return {
+        "case": {"name": case.name, **asdict(case)},
+        "setup_s": setup_seconds,
+        "run_s": run_seconds,
+        "wall_time_per_tick_ms": run_seconds / total_ticks * 1000.0,
+        "peak_rss_mb": _peak_rss_mb(),
+        "dispatch_s": phases.get("tick_and_dispatch", 0.0) - matching_seconds,
+        "matcher_s": phases.get("matcher_event_tick", 0.0) + matching_seconds,
+        "market_cycle_s": phases.get("market_cycle", 0.0),
+        "phases": phases,
+    }
+
+
+def _run_benchmark_case_isolated(case: BenchmarkCase) -> Dict:
+    # Each case runs in a fresh interpreter, so that the global settings and the peak RSS of
+    # one case do not leak into the next one.
+    with multiprocessing.get_context("spawn").Pool(processes=1) as pool:
+        return pool.apply(run_benchmark_case, (case,))
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark_suite(cases: List[BenchmarkCase]) -> Dict:
+    """Run all benchmark cases, each one in an isolated process, and return the report."""
+    results = []
+    for case in cases:
+        log.warning("Running benchmark case %s", case.name)
+        results.append(_run_benchmark_case_isolated(case))
+    return {
+        "version": BENCHMARK_REPORT_VERSION,
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def write_benchmark_report(report: Dict, file_path: str) -> None:
+    """Write the benchmark report as JSON."""
+    with open(file_path, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=2)
+
+
+def compare_benchmark_reports(
+    baseline: Dict, current: Dict, metrics=("wall_time_per_tick_ms", "peak_rss_mb")
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compare two benchmark reports case by case.
+
+    Returns the relative change (current / baseline - 1) of each metric for every case that is
+    present in both reports.
+    """
+    baseline_results = {result["case"]["name"]: result for result in baseline["results"]}
+    comparison = {}
+    for result in current["results"]:
+        baseline_result = baseline_results.get(result["case"]["name"])
+        if baseline_result is None:
+            continue
+        comparison[result["case"]["name"]] = {
+            metric: (result[metric] / baseline_result[metric] - 1.0)
+            for metric in metrics
+            if baseline_result.get(metric)
+        }
+    return comparison
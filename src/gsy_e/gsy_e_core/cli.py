@@ -16,6 +16,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import json
 import logging
 import multiprocessing
 import platform
@@ -28,6 +29,14 @@ from gsy_framework.constants_limits import ConstSettings, DATE_FORMAT, TIME_FORM
 from gsy_framework.exceptions import GSyException
 from gsy_framework.settings_validators import validate_global_settings
 from pendulum import today
+import gsy_e.constants
+from gsy_e.gsy_e_core.benchmark import (
+    BENCHMARK_MARKET_TYPES,
+    BenchmarkCase,
+    compare_benchmark_reports,
+    run_benchmark_suite,
+    write_benchmark_report,
+)
 from gsy_e.gsy_e_core.non_p2p_handler import set_non_p2p_settings
 
 from gsy_e.gsy_e_core.simulation import run_simulation
@@ -190,6 +199,54 @@ _setup_modules = available_simulation_scenarios
     help="Specify a path for the carbon ratio (gCO2eq/kWh) csv file, "
     "(example: ./src/gsy_e/resources/carbon_ratio_g_per_kWh.csv)",
 )
+@click.option(
+    "--checkpoint-path",
+    type=str,
+    default=None,
+    show_default=False,
+    help="Directory where binary simulation checkpoints are written",
+)
+@click.option(
+    "--checkpoint-interval",
+    "checkpoint_interval_slots",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Write a simulation checkpoint every N market slots (0 disables checkpoints)",
+)
+@click.option(
+    "--tick-profile-path",
+    type=str,
+    default=None,
+    show_default=False,
+    help="Enable per-phase tick profiling and write per-slot summaries (JSON lines) to this path",
+)
+@click.option(
+    "--fixed-point-grid-fees",
+    is_flag=True,
+    default=False,
+    help="Calculate the grid fees of trades with scaled integers instead of Decimal numbers",
+)
+@click.option(
+    "--batch-external-trade-events",
+    is_flag=True,
+    default=False,
+    help="Publish the trade events of directly connected external assets once per tick",
+)
+@click.option(
+    "--batch-heat-pump-fleet",
+    is_flag=True,
+    default=False,
+    help="Step the heat pumps of an area together in one vectorized pass",
+)
+@click.option(
+    "--resume-from",
+    "checkpoint_file",
+    type=str,
+    default=None,
+    show_default=False,
+    help="Resume the simulation from a binary checkpoint file",
+)
 def run(
     setup_module_name,
     settings_file,
@@ -203,6 +260,10 @@ def run(
     slot_length_realtime,
     enable_dof: bool,
     market_type: int,
+    checkpoint_file: str,
+    fixed_point_grid_fees: bool,
+    batch_external_trade_events: bool,
+    batch_heat_pump_fleet: bool,
     **kwargs,
 ):
     """Configure settings and run a simulation."""
@@ -210,6 +271,9 @@ def run(
     if platform.system() == "Darwin":
         multiprocessing.set_start_method("fork")
 
+    gsy_e.constants.FIXED_POINT_GRID_FEES = fixed_point_grid_fees
+    gsy_e.constants.BATCH_EXTERNAL_TRADE_EVENTS = batch_external_trade_events
+    gsy_e.constants.BATCH_HEAT_PUMP_FLEET = batch_heat_pump_fleet
     try:
         if settings_file is not None:
             simulation_settings, advanced_settings = read_settings_from_file(settings_file)
@@ -244,9 +308,68 @@ def run(
         if pause_at is not None:
             kwargs["pause_after"] = convert_str_to_pause_after_interval(start_date, pause_at)
         run_simulation(
-            setup_module_name, simulation_config, None, None, None, slot_length_realtime, kwargs
+            setup_module_name,
+            simulation_config,
+            None,
+            None,
+            None,
+            slot_length_realtime,
+            kwargs,
+            checkpoint_file=checkpoint_file,
         )
 
     except GSyException as ex:
         log.exception(ex)
         raise click.ClickException(ex.args[0])
+
+
+@main.command()
+@click.option(
+    "--houses",
+    type=str,
+    default="10,100,1000",
+    show_default=True,
+    help="Comma-separated list of grid sizes (number of houses)",
+)
+@click.option(
+    "--market-types",
+    type=str,
+    default=",".join(BENCHMARK_MARKET_TYPES),
+    show_default=True,
+    help=f"Comma-separated list of market types ({', '.join(BENCHMARK_MARKET_TYPES)})",
+)
+@click.option("--slots", type=int, default=4, show_default=True, help="Number of market slots")
+@click.option("--seed", type=int, default=0, show_default=True, help="Random seed")
+@click.option(
+    "-o",
+    "--output",
+    type=str,
+    default="benchmark_report.json",
+    show_default=True,
+    help="Path of the JSON benchmark report",
+)
+@click.option(
+    "--compare-with",
+    type=str,
+    default=None,
+    help="Path of a previous benchmark report to compare the results with",
+)
+def benchmark(houses, market_types, slots, seed, output, compare_with):
+    """Run the scaling benchmark suite and write a machine-readable report."""
+    cases = [
+        BenchmarkCase(houses=int(house_count), market_type=market_type, slots=slots, seed=seed)
+        for market_type in market_types.split(",")
+        for house_count in houses.split(",")
+    ]
+    report = run_benchmark_suite(cases)
+    write_benchmark_report(report, output)
+    log.info("Benchmark report written to %s.", output)
+    if compare_with is not None:
+        with open(compare_with, "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        for case_name, changes in compare_benchmark_reports(baseline, report).items():
+            log.info(
+                "%s: %s",
+                case_name,
+                ", ".join(f"{metric} {change:+.1%}" for metric, change in changes.items()),
+            )
@@ -48,18 +48,6 @@ from gsy_e.gsy_e_core.sim_results.file_export_endpoints import (
     FileExportEndpoints,
     is_heatpump_strategy_with_tanks,
 )
-from gsy_e.gsy_e_core.sim_results.results_plots import (
-    PlotAverageTradePrice,
-    PlotDeviceStats,
-    PlotEnergyProfile,
-    PlotEnergyTradeProfileHR,
-    PlotESSEnergyTrace,
-    PlotESSSOCHistory,
-    PlotOrderInfo,
-    PlotSupplyDemandCurve,
-    PlotUnmatchedLoads,
-    PlotHPPhysicalStats,
-)
 from gsy_e.gsy_e_core.util import constsettings_to_dict, is_two_sided_market_simulation
 from gsy_e.models.area import Area
 
@@ -185,6 +173,21 @@ class ExportAndPlot:
 
     def export(self, power_flow=None) -> None:
         """Main caller for local export of plots and csv-files."""
+        # The plots (and plotly) are imported only when the results are exported locally
+        # pylint: disable=import-outside-toplevel
+        from gsy_e.gsy_e_core.sim_results.results_plots import (
+            PlotAverageTradePrice,
+            PlotDeviceStats,
+            PlotEnergyProfile,
+            PlotEnergyTradeProfileHR,
+            PlotESSEnergyTrace,
+            PlotESSSOCHistory,
+            PlotOrderInfo,
+            PlotSupplyDemandCurve,
+            PlotUnmatchedLoads,
+            PlotHPPhysicalStats,
+        )
+
         if power_flow:
             power_flow.export_power_flow_results(self.plot_dir)
 
@@ -34,6 +34,9 @@ class ExternalConnectionGlobalStatistics:
         self.external_tick_counter = None
         self.current_feed_in_tariff = None
         self.current_market_maker_rate = None
+        # Incremented whenever area_stats_tree_dict is rebuilt, used to invalidate derived views
+        self.tree_version = 0
+        self._is_stale = False
 
     def __call__(self, root_area, ticks_per_slot):
         self.root_area = root_area
@@ -63,11 +66,31 @@ class ExternalConnectionGlobalStatistics:
                 self.root_area.current_market
             )
 
+    @property
+    def is_stale(self) -> bool:
+        """Return True if the statistics changed since the last update."""
+        return self._is_stale
+
+    def mark_stale(self) -> None:
+        """
+        Flag the statistics as outdated (e.g. after a trade), without rebuilding them.
+        The rebuild is deferred to refresh_if_stale, so that it happens once per tick instead
+        of once per trade.
+        """
+        self._is_stale = True
+
+    def refresh_if_stale(self) -> None:
+        """Update the global statistics only if they were marked as stale."""
+        if self._is_stale:
+            self.update()
+
     def update(self, market_cycle: bool = False) -> None:
         """Update the global statistics"""
-        if self.root_area.current_market is None:
+        if self.root_area is None or self.root_area.current_market is None:
             return
+        self._is_stale = False
         self._create_grid_tree_dict(self.root_area, self.area_stats_tree_dict)
+        self.tree_version += 1
         if market_cycle:
             self._buffer_feed_in_tariff(self.root_area, self.root_area.current_market.time_slot)
             self._buffer_market_maker_rate()
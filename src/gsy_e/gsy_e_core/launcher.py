@@ -16,6 +16,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import multiprocessing
 import os
 import platform
 import sys
@@ -34,12 +35,23 @@ from gsy_e.gsy_e_core.util import memory_usage_percent
 REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost")
 MAX_JOBS = os.environ.get("D3A_MAX_JOBS_PER_POD", 2)
 MAX_LIMIT_MEMORY_USAGE_PERCENT = os.environ.get("D3A_MAX_MEM_USAGE_PERCENT", 90)
+USE_PREFORKED_WORKERS = os.environ.get("D3A_USE_PREFORKED_WORKERS", "true").lower() == "true"
+
+# Modules that are imported once by the fork server, so that every worker that is forked from it
+# starts with them already loaded. Modules that are not installed are skipped by the fork server.
+PREFORKED_WORKER_PRELOAD_MODULES = [
+    "gsy_framework",
+    "gsy_e.gsy_e_core.rq_job_handler",
+    "sympy",
+    "pandas",
+    "plotly.graph_objects",
+]
 
 
 class Launcher:
     """Launch new simulation jobs after reading from the job queue."""
 
-    def __init__(self, max_jobs=None, max_delay_seconds=2):
+    def __init__(self, max_jobs=None, max_delay_seconds=2, use_preforked_workers=None):
         self.redis_connection = Redis.from_url(REDIS_URL, retry_on_timeout=True)
         self.queue = Queue(QueueNames().gsy_e_queue_name, connection=self.redis_connection)
         self.max_jobs = max_jobs if max_jobs is not None else int(MAX_JOBS)
@@ -49,6 +61,22 @@ class Launcher:
         )
         self.command = [python_executable, "src/gsy_e/gsy_e_core/exchange_jobs.py"]
         self.job_array = []
+        if use_preforked_workers is None:
+            use_preforked_workers = USE_PREFORKED_WORKERS
+        # The fork server is only available on POSIX platforms.
+        self._worker_context = (
+            self._create_preforked_worker_context()
+            if use_preforked_workers
+            and "forkserver" in multiprocessing.get_all_start_methods()
+            and platform.python_implementation() != "PyPy"
+            else None
+        )
+
+    @staticmethod
+    def _create_preforked_worker_context():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(PREFORKED_WORKER_PRELOAD_MODULES)
+        return context
 
     def run(self):
         """
@@ -63,7 +91,13 @@ class Launcher:
                 if memory_usage_percent() <= MAX_LIMIT_MEMORY_USAGE_PERCENT:
                     self.job_array.append(self._start_worker())
 
-            self.job_array = [j for j in self.job_array if j.poll() is None]
+            self.job_array = [j for j in self.job_array if self._is_worker_running(j)]
+
+    @staticmethod
+    def _is_worker_running(worker) -> bool:
+        if isinstance(worker, Popen):
+            return worker.poll() is None
+        return worker.is_alive()
 
     def _is_queue_crowded(self):
         check_redis_health(redis_db=self.redis_connection)
@@ -77,7 +111,16 @@ class Launcher:
     def _start_worker(self):
         job_environment = os.environ
         job_environment["REDIS_URL"] = REDIS_URL
-        return Popen(self.command, env=job_environment)
+        if self._worker_context is None:
+            return Popen(self.command, env=job_environment)
+
+        # The worker is forked from the fork server, that has already imported the heavy modules.
+        # pylint: disable-next=import-outside-toplevel
+        from gsy_e.gsy_e_core.exchange_jobs import main as exchange_jobs_main
+
+        worker = self._worker_context.Process(target=exchange_jobs_main, daemon=False)
+        worker.start()
+        return worker
 
 
 @click.command()
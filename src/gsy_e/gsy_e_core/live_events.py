@@ -1,16 +1,30 @@
 import logging
 import traceback
+from functools import partial
 from threading import Lock
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set
 
 from gsy_framework.live_events.b2b import B2BLiveEvents
 
 from gsy_e.gsy_e_core.area_serializer import area_from_dict
 from gsy_e.gsy_e_core.exceptions import LiveEventException
 from gsy_e.gsy_e_core.global_objects_singleton import global_objects
+from gsy_e.models.area.area_base import AreaChildrenList
 from gsy_e.models.area.event_dispatcher import DispatcherFactory
 from gsy_e.models.strategy.infinite_bus import InfiniteBusStrategy
 from gsy_e.models.strategy.market_maker_strategy import MarketMakerStrategy
 
+if TYPE_CHECKING:
+    from gsy_e.models.area import Area
+
+# Returns the area with the given uuid, or None if the area does not exist
+AreaLookup = Callable[[str], Optional["Area"]]
+
+
+def _parent_of_area(get_area: AreaLookup, area_uuid: str) -> Optional["Area"]:
+    area = get_area(area_uuid)
+    return area.parent if area is not None else None
+
 
 class CreateAreaEvent:
     """Event that creates a new area on the area representation tree."""
@@ -21,6 +35,10 @@ class CreateAreaEvent:
         self.area_representation = area_representation
         self.created_area = area_from_dict(self.area_representation, self.config)
 
+    def find_target_area(self, get_area: AreaLookup) -> Optional["Area"]:
+        """Return the area that the event should be applied to."""
+        return get_area(self.parent_uuid)
+
     def apply(self, area):
         """Trigger the area creation."""
         if area.uuid != self.parent_uuid:
@@ -54,6 +72,10 @@ class UpdateAreaEvent:
         self.area_uuid = area_uuid
         self.area_params = area_params
 
+    def find_target_area(self, get_area: AreaLookup) -> Optional["Area"]:
+        """Return the area that the event should be applied to."""
+        return get_area(self.area_uuid)
+
     def apply(self, area):
         """Trigger the area update."""
         if area.uuid != self.area_uuid:
@@ -98,15 +120,31 @@ class DeleteAreaEvent:
     def __init__(self, area_uuid):
         self.area_uuid = area_uuid
 
-    def apply(self, area):
-        """Trigger the area deletion."""
-        if self.area_uuid not in [c.uuid for c in area.children]:
-            return False
+    def find_target_area(self, get_area: AreaLookup) -> Optional["Area"]:
+        """Return the parent of the area that should be deleted."""
+        return _parent_of_area(get_area, self.area_uuid)
+
+    @staticmethod
+    def delete_children(area, area_uuids: Set[str]) -> List["Area"]:
+        """Delete the children with the given uuids, rebuilding the children list only once.
+        Return the deleted children."""
+        deleted_children = [c for c in area.children if c.uuid in area_uuids]
+        if not deleted_children:
+            return deleted_children
 
-        area.children = [c for c in area.children if c.uuid != self.area_uuid]
+        area.children = AreaChildrenList(
+            area, [c for c in area.children if c.uuid not in area_uuids]
+        )
         if len(area.children) == 0:
             area.dispatcher = DispatcherFactory(area)()
-        return True
+        for child in deleted_children:
+            if child.strategy is not None:
+                child.strategy.event_area_deleted()
+        return deleted_children
+
+    def apply(self, area):
+        """Trigger the area deletion."""
+        return len(self.delete_children(area, {self.area_uuid})) > 0
 
     def __repr__(self):
         return f"<DeleteAreaEvent - area UUID({self.area_uuid})>"
@@ -119,6 +157,10 @@ class ForwardMarketsEvent:
         self._area_uuid = area_uuid
         self._event_params = event_params
 
+    def find_target_area(self, get_area: AreaLookup) -> Optional["Area"]:
+        """Return the parent of the area that the event refers to."""
+        return _parent_of_area(get_area, self._area_uuid)
+
     def apply(self, area):
         """Trigger the forward market event."""
         if self._area_uuid not in [c.uuid for c in area.children]:
@@ -138,6 +180,10 @@ class LiveEvents:
         self._tick_event_buffer = []
         self._lock = Lock()
         self._config = config
+        # uuid -> area of all areas of the grid, kept up to date when areas are created / deleted
+        self._area_index: Dict[str, "Area"] = {}
+        self._indexed_root_area = None
+        self._is_area_index_validated = False
 
     def add_event(self, event_dict, bulk_event=False):
         """Add a new event in order to be processed on the next market cycle."""
@@ -166,10 +212,39 @@ class LiveEvents:
                     self._event_buffer = []
                 raise LiveEventException(ex) from ex
 
-    def _handle_event(self, area, event):
+    def _index_area(self, area: "Area") -> None:
+        self._area_index[area.uuid] = area
+        for child in area.children or []:
+            self._index_area(child)
+
+    def _unindex_area(self, area: "Area") -> None:
+        self._area_index.pop(area.uuid, None)
+        for child in area.children or []:
+            self._unindex_area(child)
+
+    def _rebuild_area_index(self, root_area: "Area") -> None:
+        self._area_index = {}
+        self._index_area(root_area)
+        self._indexed_root_area = root_area
+        self._is_area_index_validated = True
+
+    def _get_area(self, root_area: "Area", area_uuid: str) -> Optional["Area"]:
+        if self._indexed_root_area is not root_area:
+            self._rebuild_area_index(root_area)
+        area = self._area_index.get(area_uuid)
+        if area is None and not self._is_area_index_validated:
+            # The grid might have been changed without live events, rebuild at most once per batch
+            self._rebuild_area_index(root_area)
+            area = self._area_index.get(area_uuid)
+        return area
+
+    def _handle_event(self, event, get_area: AreaLookup) -> bool:
+        area = event.find_target_area(get_area)
+        if area is None:
+            return False
         try:
-            if event.apply(area) is True:
-                return True
+            if event.apply(area) is not True:
+                return False
         except LiveEventException as ex:
             logging.error(
                 "Event %s failed to apply on area %s. Exception: %s. Traceback: %s",
@@ -179,18 +254,39 @@ class LiveEvents:
                 traceback.format_exc(),
             )
             return False
-        if not area.children:
-            return False
-        for child in area.children:
-            if self._handle_event(child, event) is True:
-                return True
-        return False
+        if isinstance(event, CreateAreaEvent):
+            self._index_area(event.created_area)
+        return True
+
+    def _delete_areas(self, pending_deletions: Dict[str, Dict]) -> None:
+        for deletion in pending_deletions.values():
+            for deleted_area in DeleteAreaEvent.delete_children(
+                deletion["parent"], deletion["area_uuids"]
+            ):
+                self._unindex_area(deleted_area)
+        pending_deletions.clear()
 
     def _handle_events(self, root_area, event_buffer):
         with self._lock:
+            self._is_area_index_validated = False
+            get_area = partial(self._get_area, root_area)
+            # Consecutive deletions are collected per parent area, in order for the children
+            # list of each parent to be rebuilt only once.
+            pending_deletions = {}
             for event in event_buffer:
-                if self._handle_event(root_area, event) is False:
+                if isinstance(event, DeleteAreaEvent):
+                    parent_area = event.find_target_area(get_area)
+                    if parent_area is None:
+                        logging.warning("Event %s not applied.", event)
+                        continue
+                    pending_deletions.setdefault(
+                        parent_area.uuid, {"parent": parent_area, "area_uuids": set()}
+                    )["area_uuids"].add(event.area_uuid)
+                    continue
+                self._delete_areas(pending_deletions)
+                if self._handle_event(event, get_area) is False:
                     logging.warning("Event %s not applied.", event)
+            self._delete_areas(pending_deletions)
             event_buffer.clear()
 
     def handle_all_events(self, root_area):
@@ -0,0 +1,76 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from hashlib import blake2b
+from random import Random
+from typing import Dict, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+class RandomStreams:
+    """
+    Independent random number streams of the simulation components (areas, markets, agents).
+
+    Each stream is seeded from the simulation seed and the stable identifier of its component,
+    therefore the randomization of a component does not depend on the order in which the other
+    components consume random numbers.
+    """
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+        self._streams: Dict[str, Random] = {}
+
+    def set_seed(self, seed: int) -> None:
+        """Set the simulation seed, all streams restart from their new seeds."""
+        self.seed = seed
+        self._streams.clear()
+
+    def get(self, component_id: str) -> Random:
+        """Return the random stream of the component."""
+        stream = self._streams.get(component_id)
+        if stream is None:
+            digest = blake2b(f"{self.seed}:{component_id}".encode(), digest_size=8).digest()
+            stream = Random(int.from_bytes(digest, "big"))
+            self._streams[component_id] = stream
+        return stream
+
+    def shuffled(self, component_id: str, items: Iterable[T]) -> List[T]:
+        """Return the items as a list in random order, using the stream of the component."""
+        shuffled_items = list(items)
+        if len(shuffled_items) > 1:
+            self.get(component_id).shuffle(shuffled_items)
+        return shuffled_items
+
+    def get_state(self) -> Dict:
+        """Return the state of all streams, used to checkpoint the simulation."""
+        return {
+            "seed": self.seed,
+            "streams": {
+                component_id: stream.getstate() for component_id, stream in self._streams.items()
+            },
+        }
+
+    def set_state(self, state: Dict) -> None:
+        """Restore the state of all streams."""
+        self.set_seed(state["seed"])
+        for component_id, stream_state in state["streams"].items():
+            self.get(component_id).setstate(stream_state)
+
+
+random_streams = RandomStreams()
@@ -1,6 +1,5 @@
 import json
 import logging
-from copy import deepcopy
 from threading import Lock
 
 from gsy_framework.constants_limits import ConstSettings
@@ -33,6 +32,10 @@ class AggregatorHandler:
         self.device_aggregator_mapping = {}
         self.lock = Lock()
         self.grid_buffer = {}
+        self._anonymized_grid_tree = {}
+        self._anonymized_grid_tree_version = None
+        self._device_paths = {}
+        self._owned_paths = {}
 
     def set_aggregator_device_mapping(self, aggregator_device):
         """Sets the aggregator_device_mapping derived from the aggregator_device_mapping
@@ -43,6 +46,7 @@ class AggregatorHandler:
             for aggr, devices in self.aggregator_device_mapping.items()
             for dev in devices
         }
+        self._invalidate_grid_tree_views()
 
     def is_controlling_device(self, device_uuid):
         """Return if the aggregator is controlling the device with specified uuid."""
@@ -53,35 +57,99 @@ class AggregatorHandler:
         aggregator_uuid = self.device_aggregator_mapping[device_uuid]
         create_subdict_or_update(batch_event_dict, aggregator_uuid, event)
 
-    def _delete_not_owned_devices_from_dict(self, area_stats_tree_dict, aggregator_uuid):
-        """Wrapper for _delete_not_owned_devices"""
-        out_dict = deepcopy(area_stats_tree_dict)
-        self._delete_not_owned_devices(area_stats_tree_dict, aggregator_uuid, out_dict)
-        return out_dict
+    def _invalidate_grid_tree_views(self):
+        """Drop the cached owned paths, needs to be called when the device mapping changes."""
+        self._owned_paths.clear()
 
-    def _delete_not_owned_devices(self, indict: dict, aggregator_uuid: str, outdict: dict):
-        """Only sent area info from areas that are connected to an external client and
-        to the same aggregator from the to be sent area_stats_tree_dict"""
+    def _update_anonymized_grid_tree(self, area_stats_tree_dict: dict, tree_version: int):
+        """Rebuild the grid tree without any device information, that is shared between all
+        aggregators, once per update of the global statistics."""
+        if tree_version == self._anonymized_grid_tree_version:
+            return
+        device_paths = {}
+        self._anonymized_grid_tree = self._anonymize_devices(
+            area_stats_tree_dict, (), device_paths
+        )
+        self._anonymized_grid_tree_version = tree_version
+        if device_paths != self._device_paths:
+            # The grid structure changed, the owned paths need to be recalculated
+            self._device_paths = device_paths
+            self._invalidate_grid_tree_views()
+
+    @classmethod
+    def _anonymize_devices(cls, indict: dict, path: tuple, device_paths: dict) -> dict:
+        """Replace the info of all devices by their names and collect the path of each device
+        (the uuids of its parent areas) into device_paths."""
+        outdict = {}
         for area_uuid, area_dict in indict.items():
             if "children" in area_dict:
-                self._delete_not_owned_devices(
-                    indict[area_uuid]["children"], aggregator_uuid, outdict[area_uuid]["children"]
-                )
+                outdict[area_uuid] = {
+                    **area_dict,
+                    "children": cls._anonymize_devices(
+                        area_dict["children"], path + (area_uuid,), device_paths
+                    ),
+                }
             else:
+                device_paths[area_uuid] = path
+                outdict[area_uuid] = {"area_name": area_dict["area_name"]}
+        return outdict
+
+    def _get_owned_paths(self, aggregator_uuid: str) -> dict:
+        """Return the nested dict of the area uuids that lead to the devices of the aggregator,
+        device uuids are mapped to None."""
+        if aggregator_uuid not in self._owned_paths:
+            owned_paths = {}
+            for device_uuid in self.aggregator_device_mapping.get(aggregator_uuid, []):
                 if (
-                    area_uuid not in self.device_aggregator_mapping
-                    or area_uuid not in self.aggregator_device_mapping[aggregator_uuid]
+                    device_uuid not in self.device_aggregator_mapping
+                    or device_uuid not in self._device_paths
                 ):
-                    outdict[area_uuid] = {"area_name": area_dict["area_name"]}
+                    continue
+                node = owned_paths
+                for area_uuid in self._device_paths[device_uuid]:
+                    node = node.setdefault(area_uuid, {})
+                node[device_uuid] = None
+            self._owned_paths[aggregator_uuid] = owned_paths
+        return self._owned_paths[aggregator_uuid]
+
+    @classmethod
+    def _create_grid_tree_view(
+        cls, indict: dict, anonymized_dict: dict, owned_paths: dict
+    ) -> dict:
+        """Only sent area info from areas that are connected to an external client and
+        to the same aggregator. Subtrees without owned devices are shared with the anonymized
+        grid tree, only the areas on the paths to the owned devices are copied."""
+        if not owned_paths:
+            return anonymized_dict
+        outdict = dict(anonymized_dict)
+        for area_uuid, owned_children in owned_paths.items():
+            if owned_children is None:
+                outdict[area_uuid] = indict[area_uuid]
+            else:
+                outdict[area_uuid] = {
+                    **anonymized_dict[area_uuid],
+                    "children": cls._create_grid_tree_view(
+                        indict[area_uuid]["children"],
+                        anonymized_dict[area_uuid]["children"],
+                        owned_children,
+                    ),
+                }
+        return outdict
 
     def _create_grid_tree_event_dict(self, aggregator_uuid: str) -> dict:
         """Accumulate area_stats_tree_dict information and initiate a event dictionary
         to be sent to the client"""
         if ConstSettings.MASettings.MARKET_TYPE == SpotMarketTypeEnum.COEFFICIENTS.value:
             return {"grid_tree": global_objects.scm_external_global_stats.area_stats_tree_dict}
+        area_stats_tree_dict = global_objects.external_global_stats.area_stats_tree_dict
+        self._update_anonymized_grid_tree(
+            area_stats_tree_dict, global_objects.external_global_stats.tree_version
+        )
         return {
-            "grid_tree": self._delete_not_owned_devices_from_dict(
-                global_objects.external_global_stats.area_stats_tree_dict, aggregator_uuid
+            "grid_tree": self._create_grid_tree_view(
+                area_stats_tree_dict,
+                self._anonymized_grid_tree,
+                self._get_owned_paths(aggregator_uuid),
             ),
             "feed_in_tariff_rate": global_objects.external_global_stats.current_feed_in_tariff,
             "market_maker_rate": global_objects.external_global_stats.current_market_maker_rate,
@@ -108,12 +176,17 @@ class AggregatorHandler:
         aggregator_uuid = self.device_aggregator_mapping[device_uuid]
         if aggregator_uuid not in self.batch_trade_events:
             self.batch_trade_events[aggregator_uuid] = {"trade_list": []}
-
-        self.batch_trade_events[aggregator_uuid].update(
-            self._create_grid_tree_event_dict(aggregator_uuid)
-        )
+        # The grid tree is attached once per aggregator when the trade events are published
         self.batch_trade_events[aggregator_uuid]["trade_list"].append(trade_info)
 
+    def _add_grid_tree_to_trade_events(self) -> None:
+        """Attach the grid tree, refreshed once for all trades of the tick, to the trade events."""
+        if not self.batch_trade_events:
+            return
+        global_objects.external_global_stats.refresh_if_stale()
+        for aggregator_uuid, trade_event in self.batch_trade_events.items():
+            trade_event.update(self._create_grid_tree_event_dict(aggregator_uuid))
+
     def aggregator_callback(self, payload):
         """Entrypoint for aggregator related commands"""
         message = json.loads(payload["data"])
@@ -167,6 +240,7 @@ class AggregatorHandler:
                 "device_uuid": message["device_uuid"],
                 "transaction_id": message["transaction_id"],
             }
+        self._invalidate_grid_tree_views()
         self.redis_db.publish(AggregatorChannels().response, json.dumps(response_message))
 
     def _unselect_aggregator(self, message):
@@ -180,6 +254,7 @@ class AggregatorHandler:
                     self.aggregator_device_mapping[message["aggregator_uuid"]].remove(
                         message["device_uuid"]
                     )
+                    self._invalidate_grid_tree_views()
                 response_message = {
                     "status": "UNSELECTED",
                     "aggregator_uuid": message["aggregator_uuid"],
@@ -223,6 +298,7 @@ class AggregatorHandler:
     def _delete_aggregator(self, message):
         if message["aggregator_uuid"] in self.aggregator_device_mapping:
             del self.aggregator_device_mapping[message["aggregator_uuid"]]
+            self._invalidate_grid_tree_views()
             success_response_message = {
                 "status": "deleted",
                 "aggregator_uuid": message["aggregator_uuid"],
@@ -330,6 +406,7 @@ class AggregatorHandler:
         self._publish_all_events_from_one_type(redis, self.batch_market_cycle_events, "market")
         self._publish_all_events_from_one_type(redis, self.batch_tick_events, "tick")
         self._publish_all_events_from_one_type(redis, self.batch_finished_events, "finish")
+        self._add_grid_tree_to_trade_events()
         self._publish_all_events_from_one_type(redis, self.batch_trade_events, "trade")
 
     def publish_all_commands_responses(self, redis):
@@ -104,6 +104,10 @@ class RedisSimulationCommunication:
                 })
         self._publish_json(self.channel_names.response_channel(command_type), response_json)
 
+    def set_area(self, area: "Area") -> None:
+        """Replace the root area of the grid (e.g. after restoring a simulation checkpoint)."""
+        self._area = area
+
     def _area_map_callback(self, _) -> None:
         """Trigger the calculation of area uuid and name mapping and publish it
         back to a redis response channel"""
@@ -190,6 +190,12 @@ def _configure_constants_constsettings(
         ConstSettings.SettlementMarketSettings.ENABLE_SETTLEMENT_MARKETS,
     )
     gsy_e.constants.CONNECT_TO_PROFILES_DB = connect_to_profiles_db
+    gsy_e.constants.BATCH_EXTERNAL_TRADE_EVENTS = settings.get(
+        "batch_external_trade_events", gsy_e.constants.BATCH_EXTERNAL_TRADE_EVENTS
+    )
+    gsy_e.constants.BATCH_HEAT_PUMP_FLEET = settings.get(
+        "batch_heat_pump_fleet", gsy_e.constants.BATCH_HEAT_PUMP_FLEET
+    )
 
     set_non_p2p_settings(spot_market_type)
 
@@ -0,0 +1,183 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import io
+import os
+import pickle
+import random as py_random
+import struct
+from dataclasses import dataclass
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Optional
+
+from numpy import random as np_random
+
+from gsy_e.gsy_e_core.exceptions import SimulationException
+from gsy_e.gsy_e_core.random_streams import random_streams
+
+if TYPE_CHECKING:
+    from gsy_e.gsy_e_core.simulation.simulation import Simulation
+
+log = getLogger(__name__)
+
+CHECKPOINT_MAGIC = b"GSYECKPT"
+CHECKPOINT_FORMAT_VERSION = 1
+CHECKPOINT_FILE_SUFFIX = ".gsyckpt"
+# magic, format version, slot number
+_HEADER = struct.Struct(">8sHI")
+
+# Objects that hold live connections or are owned by the running process are not serialized.
+# They are replaced by a token on dump and re-bound to the restoring simulation's objects on load.
+_SIMULATION_CONFIG_PID = "simulation_config"
+_EXTERNAL_REDIS_COMMUNICATOR_PID = "external_redis_communicator"
+
+
+class CheckpointException(SimulationException):
+    """Error while writing or reading a simulation checkpoint."""
+
+
+@dataclass
+class SimulationCheckpoint:
+    """Full state of a simulation at the end of a market slot."""
+
+    slot_number: int
+    area: Any
+    endpoint_buffer: Any
+    global_state: Dict
+    rng_state: Dict
+
+
+class _CheckpointPickler(pickle.Pickler):
+    def __init__(self, file: BinaryIO, simulation: "Simulation"):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._external_objects = {
+            id(simulation.config): _SIMULATION_CONFIG_PID,
+            id(simulation.config.external_redis_communicator): _EXTERNAL_REDIS_COMMUNICATOR_PID,
+        }
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        return self._external_objects.get(id(obj))
+
+
+class _CheckpointUnpickler(pickle.Unpickler):
+    def __init__(self, file: BinaryIO, simulation: "Simulation"):
+        super().__init__(file)
+        self._external_objects = {
+            _SIMULATION_CONFIG_PID: simulation.config,
+            _EXTERNAL_REDIS_COMMUNICATOR_PID: simulation.config.external_redis_communicator,
+        }
+
+    def persistent_load(self, pid: str) -> Any:
+        try:
+            return self._external_objects[pid]
+        except KeyError as ex:
+            raise CheckpointException(f"Unknown external object in checkpoint: {pid}") from ex
+
+
+def _get_rng_state() -> Dict:
+    return {
+        "python": py_random.getstate(),
+        "numpy": np_random.get_state(),
+        "components": random_streams.get_state(),
+    }
+
+
+def _set_rng_state(rng_state: Dict) -> None:
+    py_random.setstate(rng_state["python"])
+    np_random.set_state(rng_state["numpy"])
+    if "components" in rng_state:
+        random_streams.set_state(rng_state["components"])
+
+
+def dump_checkpoint(simulation: "Simulation", slot_number: int) -> bytes:
+    """Serialize the simulation state after the given slot into the binary checkpoint format."""
+    checkpoint = SimulationCheckpoint(
+        slot_number=slot_number,
+        area=simulation.area,
+        endpoint_buffer=simulation._results._endpoint_buffer,  # pylint: disable=protected-access
+        global_state=simulation.current_state,
+        rng_state=_get_rng_state(),
+    )
+    buffer = io.BytesIO()
+    buffer.write(_HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_FORMAT_VERSION, slot_number))
+    _CheckpointPickler(buffer, simulation).dump(checkpoint)
+    return buffer.getvalue()
+
+
+def load_checkpoint(data: bytes, simulation: "Simulation") -> SimulationCheckpoint:
+    """Deserialize a binary checkpoint, re-binding process-owned objects to the simulation."""
+    if len(data) < _HEADER.size:
+        raise CheckpointException("Checkpoint is truncated.")
+    magic, version, slot_number = _HEADER.unpack_from(data)
+    if magic != CHECKPOINT_MAGIC:
+        raise CheckpointException("Not a gsy-e simulation checkpoint.")
+    if version != CHECKPOINT_FORMAT_VERSION:
+        raise CheckpointException(
+            f"Unsupported checkpoint format version {version} "
+            f"(expected {CHECKPOINT_FORMAT_VERSION})."
+        )
+    payload = io.BytesIO(data)
+    payload.seek(_HEADER.size)
+    checkpoint = _CheckpointUnpickler(payload, simulation).load()
+    if checkpoint.slot_number != slot_number:
+        raise CheckpointException("Checkpoint header does not match its payload.")
+    _set_rng_state(checkpoint.rng_state)
+    return checkpoint
+
+
+def read_checkpoint_file(file_path: str, simulation: "Simulation") -> SimulationCheckpoint:
+    """Read a checkpoint file written by SimulationCheckpointWriter."""
+    with open(file_path, "rb") as checkpoint_file:
+        return load_checkpoint(checkpoint_file.read(), simulation)
+
+
+class SimulationCheckpointWriter:
+    """Writes simulation checkpoints to disk every `interval_slots` market slots."""
+
+    def __init__(self, checkpoint_path: Optional[str], interval_slots: int = 0):
+        self.checkpoint_path = checkpoint_path
+        self.interval_slots = interval_slots if checkpoint_path else 0
+
+    @property
+    def is_enabled(self) -> bool:
+        """Return True if checkpoints should be written."""
+        return self.interval_slots > 0
+
+    def file_path_for_slot(self, slot_number: int) -> str:
+        """Return the path of the checkpoint file of the given slot."""
+        return os.path.join(
+            self.checkpoint_path, f"checkpoint_slot_{slot_number:06d}{CHECKPOINT_FILE_SUFFIX}"
+        )
+
+    def save_if_due(self, simulation: "Simulation", slot_number: int) -> Optional[str]:
+        """Write a checkpoint if the slot that just finished falls on the configured interval."""
+        if not self.is_enabled or (slot_number + 1) % self.interval_slots != 0:
+            return None
+        return self.save(simulation, slot_number)
+
+    def save(self, simulation: "Simulation", slot_number: int) -> str:
+        """Write a checkpoint of the given slot and return its file path."""
+        os.makedirs(self.checkpoint_path, exist_ok=True)
+        file_path = self.file_path_for_slot(slot_number)
+        tmp_file_path = f"{file_path}.tmp"
+        with open(tmp_file_path, "wb") as checkpoint_file:
+            checkpoint_file.write(dump_checkpoint(simulation, slot_number))
+        # Atomic rename, a crash during the write never leaves a corrupt checkpoint behind.
+        os.replace(tmp_file_path, file_path)
+        log.info("Simulation checkpoint of slot %s written to %s.", slot_number + 1, file_path)
+        return file_path
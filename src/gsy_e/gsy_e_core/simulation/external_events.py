@@ -44,6 +44,14 @@ class SimulationExternalEvents:
             progress_info=simulation.progress_info,
             area=simulation.area)
 
+    def set_area(self, area: "AreaBase") -> None:
+        """
+        Replace the root area of the grid, e.g. after restoring a simulation checkpoint.
+
+        The live events receive the root area on every update, and re-index it when it changes.
+        """
+        self.redis_connection.set_area(area)
+
     def update(self, area: "AreaBase") -> None:
         """
         Update the simulation according to any live events received. Triggered every market slot.
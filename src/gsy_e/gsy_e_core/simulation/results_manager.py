@@ -50,6 +50,8 @@ class SimulationResultsManager:
         carbon_ratio_file: str = None,
     ) -> None:
         self.export_results_on_finish = export_results_on_finish
+        # Calculate the results on every market cycle even if they are neither exported nor sent
+        self.calculate_results_in_memory = False
         self.export_path = export_path
         self.started_from_cli = started_from_cli
         self.kafka_connection = kafka_connection_factory()
@@ -80,6 +82,15 @@ class SimulationResultsManager:
                 self.carbon_ratio_file,
             )
 
+    def restore_endpoint_buffer(
+        self, endpoint_buffer: "SimulationEndpointBuffer", area: "AreaBase"
+    ) -> None:
+        """Replace the results buffer and root area, e.g. after restoring a checkpoint."""
+        self._endpoint_buffer = endpoint_buffer
+        if self._export is not None:
+            self._export.area = area
+            self._export.endpoint_buffer = endpoint_buffer
+
     @property
     def _should_send_results_to_broker(self) -> None:
         """Flag that decides whether to send results to the gsy-web"""
@@ -111,7 +122,11 @@ class SimulationResultsManager:
                 return
             self.kafka_connection.publish(results, current_state["simulation_id"])
 
-        elif gsy_e.constants.RETAIN_PAST_MARKET_STRATEGIES_STATE or self.export_results_on_finish:
+        elif (
+            gsy_e.constants.RETAIN_PAST_MARKET_STRATEGIES_STATE
+            or self.export_results_on_finish
+            or self.calculate_results_in_memory
+        ):
 
             self._endpoint_buffer.update_stats(
                 area,
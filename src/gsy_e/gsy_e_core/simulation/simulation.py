@@ -32,12 +32,14 @@ import gsy_e.constants
 from gsy_e.gsy_e_core.exceptions import SimulationException
 from gsy_e.gsy_e_core.global_objects_singleton import global_objects
 from gsy_e.gsy_e_core.matching_engine_singleton import bid_offer_matcher
+from gsy_e.gsy_e_core.simulation.checkpoint import SimulationCheckpointWriter, read_checkpoint_file
 from gsy_e.gsy_e_core.simulation.external_events import SimulationExternalEvents
 from gsy_e.gsy_e_core.simulation.progress_info import SimulationProgressInfo
 from gsy_e.gsy_e_core.simulation.results_manager import SimulationResultsManager
 from gsy_e.gsy_e_core.simulation.setup import SimulationSetup
 from gsy_e.gsy_e_core.simulation.status_manager import SimulationStatusManager
 from gsy_e.gsy_e_core.simulation.time_manager import SimulationTimeManager
+from gsy_e.gsy_e_core.tick_profiler import tick_profiler
 from gsy_e.gsy_e_core.util import NonBlockingConsole
 from gsy_e.models.area.event_deserializer import deserialize_events_to_areas
 from gsy_e.models.config import SimulationConfig
@@ -73,7 +75,17 @@ class Simulation:
         slot_length_realtime: Duration = None,
         incremental: bool = False,
         carbon_ratio_file: str = None,
+        checkpoint_path: str = None,
+        checkpoint_interval_slots: int = 0,
+        tick_profile_path: str = None,
+        interactive_console: bool = True,
     ):
+        # If False, simulations started from the CLI do not read keyboard commands from the console
+        self._interactive_console = interactive_console
+        self._tick_profiling_enabled = tick_profile_path is not None
+        if self._tick_profiling_enabled:
+            tick_profiler.enable(tick_profile_path)
+
         self.status = SimulationStatusManager(
             paused=paused,
             pause_after=pause_after,
@@ -101,6 +113,10 @@ class Simulation:
             carbon_ratio_file=carbon_ratio_file,
         )
 
+        self._checkpoints = SimulationCheckpointWriter(
+            checkpoint_path=checkpoint_path, interval_slots=checkpoint_interval_slots
+        )
+
         self.area = None
         self.progress_info = SimulationProgressInfo()
         self.simulation_id = redis_job_id
@@ -175,7 +191,10 @@ class Simulation:
         tick_resume = 0
         try:
             if self._setup.started_from_cli:
-                self._run_cli_execute_cycle(initial_slot, tick_resume)
+                if self._interactive_console:
+                    self._run_cli_execute_cycle(initial_slot, tick_resume)
+                else:
+                    self._execute_simulation(initial_slot, tick_resume)
             else:
                 # update status of the simulation before executing it.
                 self._results.update_and_send_results(simulation=self)
@@ -215,22 +234,27 @@ class Simulation:
         for slot_no in range(slot_resume, slot_count):
             self.progress_info.update(slot_no, slot_count, self._time, self.config)
 
-            self._cycle_markets(slot_no)
+            with tick_profiler.phase("market_cycle"):
+                self._cycle_markets(slot_no)
 
             if self.config.external_connection_enabled:
-                global_objects.external_global_stats.update(market_cycle=True)
-                self.area.publish_market_cycle_to_external_clients()
+                with tick_profiler.phase("external_market_cycle"):
+                    global_objects.external_global_stats.update(market_cycle=True)
+                    self.area.publish_market_cycle_to_external_clients()
 
-            bid_offer_matcher.event_market_cycle(
-                slot_completion="0%", market_slot=self.progress_info.current_slot_str
-            )
+            with tick_profiler.phase("matcher_market_cycle"):
+                bid_offer_matcher.event_market_cycle(
+                    slot_completion="0%", market_slot=self.progress_info.current_slot_str
+                )
 
-            self._external_events.update(self.area)
+            with tick_profiler.phase("external_events"):
+                self._external_events.update(self.area)
 
             self._compute_memory_info()
 
             for tick_no in range(tick_resume, self.config.ticks_per_slot):
                 self._handle_paused(console)
+                tick_profiler.start_tick()
 
                 # reset tick_resume after possible resume
                 tick_resume = 0
@@ -242,7 +266,8 @@ class Simulation:
                     (tick_no + 1) / self.config.ticks_per_slot * 100,
                 )
 
-                self.config.external_redis_communicator.approve_aggregator_commands()
+                with tick_profiler.phase("approve_aggregator_commands"):
+                    self.config.external_redis_communicator.approve_aggregator_commands()
 
                 current_tick_in_slot = tick_no % self.config.ticks_per_slot
                 if (
@@ -251,17 +276,23 @@ class Simulation:
                         current_tick_in_slot
                     )
                 ):
-                    global_objects.external_global_stats.update()
-
-                self.area.tick_and_dispatch()
-                self.area.execute_actions_after_tick_event()
-                bid_offer_matcher.event_tick(
-                    current_tick_in_slot=current_tick_in_slot,
-                    slot_completion=f"{int((tick_no / self.config.ticks_per_slot) * 100)}%",
-                    market_slot=self.progress_info.next_slot_str,
-                )
-                redis_comm = self.config.external_redis_communicator
-                redis_comm.publish_aggregator_commands_responses_events()
+                    with tick_profiler.phase("external_global_stats"):
+                        global_objects.external_global_stats.update()
+
+                with tick_profiler.phase("tick_and_dispatch"):
+                    self.area.tick_and_dispatch()
+                with tick_profiler.phase("actions_after_tick"):
+                    self.area.execute_actions_after_tick_event()
+                with tick_profiler.phase("matcher_event_tick"):
+                    bid_offer_matcher.event_tick(
+                        current_tick_in_slot=current_tick_in_slot,
+                        slot_completion=f"{int((tick_no / self.config.ticks_per_slot) * 100)}%",
+                        market_slot=self.progress_info.next_slot_str,
+                    )
+                with tick_profiler.phase("aggregator_responses"):
+                    redis_comm = self.config.external_redis_communicator
+                    redis_comm.publish_aggregator_commands_responses_events()
+                tick_profiler.end_tick()
 
                 self._time.handle_slowdown_and_realtime(tick_no, self.config, self.status)
 
@@ -277,9 +308,12 @@ class Simulation:
 
                 self._external_events.tick_update(self.area)
 
-            self._results.update_csv_on_market_cycle(slot_no, self.area)
-            self.status.handle_incremental_mode()
-            self._results.update_and_send_results(simulation=self)
+            with tick_profiler.phase("results_update"):
+                self._results.update_csv_on_market_cycle(slot_no, self.area)
+                self.status.handle_incremental_mode()
+                self._results.update_and_send_results(simulation=self)
+            tick_profiler.end_slot(slot_no, self.progress_info.current_slot_str)
+            self._checkpoints.save_if_due(self, slot_no)
 
         self._simulation_stopped_finish_actions(slot_count)
 
@@ -295,6 +329,8 @@ class Simulation:
         self._results.update_and_send_results(simulation=self)
         self._results.create_hierarchy_stats(self.area)
         self._results.save_csv_results(self.area)
+        if self._tick_profiling_enabled:
+            tick_profiler.disable()
 
     def _handle_input(self, console: NonBlockingConsole, sleep_period: float = 0) -> None:
         timeout = 0
@@ -429,6 +465,25 @@ class Simulation:
         self.progress_info.current_slot_number = saved_state["slot_number"]
         self._time.slot_length_realtime = duration(seconds=saved_state["slot_length_realtime_s"])
 
+    def restore_checkpoint(self, file_path: str) -> int:
+        """
+        Restore the full simulation state from a binary checkpoint file.
+
+        Returns the number of the slot that the simulation should be resumed from.
+        """
+        checkpoint = read_checkpoint_file(file_path, self)
+        self.area = checkpoint.area
+        self._external_events.set_area(self.area)
+        self._results.restore_endpoint_buffer(checkpoint.endpoint_buffer, self.area)
+        global_objects.external_global_stats(self.area, self.config.ticks_per_slot)
+        self.restore_global_state(checkpoint.global_state)
+        log.info(
+            "Simulation restored from checkpoint %s (slot %s).",
+            file_path,
+            checkpoint.slot_number + 1,
+        )
+        return checkpoint.slot_number + 1
+
     @staticmethod
     def _compute_memory_info():
         gc.collect()
@@ -458,6 +513,7 @@ def run_simulation(
     saved_sim_state: dict = None,
     slot_length_realtime: Duration = None,
     kwargs: dict = None,
+    checkpoint_file: str = None,
 ) -> Dict:
     """Initiate simulation class and start simulation."""
     # pylint: disable=too-many-arguments,protected-access
@@ -478,7 +534,9 @@ def run_simulation(
         log.error(ex)
         return {}
 
-    if (
+    if checkpoint_file:
+        simulation.run(initial_slot=simulation.restore_checkpoint(checkpoint_file))
+    elif (
         saved_sim_state
         and saved_sim_state["areas"] != {}
         and saved_sim_state["general"]["sim_status"] in ["running", "paused"]
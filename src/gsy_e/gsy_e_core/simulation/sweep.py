@@ -0,0 +1,153 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import csv
+import multiprocessing
+import random
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from gsy_e.gsy_e_core.simulation.simulation import simulation_class_factory
+
+if TYPE_CHECKING:
+    from gsy_e.gsy_e_core.simulation.simulation import Simulation
+    from gsy_e.models.area import Area
+    from gsy_e.models.config import SimulationConfig
+
+log = getLogger(__name__)
+
+# State of the sweep that is shared with the forked workers via copy-on-write memory.
+_sweep_state: Dict = {}
+
+
+@dataclass
+class SweepConfiguration:
+    """Parameter override that is applied to the shared scenario before a single sweep run."""
+
+    name: str
+    seed: Optional[int] = None
+    grid_fee_constant: Optional[float] = None
+    # Maps area names to keyword arguments of Area.area_reconfigure_event, e.g. strategy rates
+    area_params: Dict[str, Dict] = field(default_factory=dict)
+
+    def apply(self, simulation: "Simulation") -> None:
+        """Apply the override to an already set up simulation."""
+        if self.seed is not None:
+            simulation._setup._set_random_seed(self.seed)  # pylint: disable=protected-access
+            random.seed(self.seed)
+        self._apply_to_area(simulation.area)
+
+    def _apply_to_area(self, area: "Area") -> None:
+        if self.grid_fee_constant is not None and area.strategy is None:
+            area.area_reconfigure_event(grid_fee_constant=self.grid_fee_constant)
+        if area.name in self.area_params:
+            area.area_reconfigure_event(**self.area_params[area.name])
+        for child in area.children:
+            self._apply_to_area(child)
+
+    def as_dict(self) -> Dict:
+        """Return the override as a flat dict, used as the leading columns of a results row."""
+        row = {"name": self.name, "seed": self.seed, "grid_fee_constant": self.grid_fee_constant}
+        for area_name, params in self.area_params.items():
+            row.update({f"{area_name}.{key}": value for key, value in params.items()})
+        return row
+
+
+def root_area_kpi_results(simulation: "Simulation") -> Dict:
+    """Default sweep result extractor, returns the KPIs of the root area."""
+    # pylint: disable=protected-access
+    results_handler = simulation._results._endpoint_buffer.results_handler
+    return dict(results_handler.all_ui_results["kpi"].get(simulation.area.uuid, {}))
+
+
+def _run_sweep_configuration(configuration_index: int) -> Dict:
+    simulation = _sweep_state["simulation"]
+    configuration = _sweep_state["configurations"][configuration_index]
+    row = configuration.as_dict()
+    try:
+        configuration.apply(simulation)
+        simulation.run()
+        row.update(_sweep_state["result_extractor"](simulation))
+    except Exception as ex:  # pylint: disable=broad-except
+        log.exception("Sweep run %s failed.", configuration.name)
+        row["error"] = str(ex)
+    return row
+
+
+class SimulationSweepRunner:
+    """
+    Run a parameter sweep over a scenario that is set up only once.
+
+    The setup module is loaded and the area tree is activated in the parent process. Each sweep
+    configuration is then executed in a freshly forked worker, that shares the setup and the
+    profile data with the parent via copy-on-write memory.
+    """
+
+    def __init__(
+        self,
+        setup_module_name: str,
+        simulation_config: "SimulationConfig",
+        max_workers: Optional[int] = None,
+        result_extractor: Callable[["Simulation"], Dict] = root_area_kpi_results,
+        **simulation_kwargs,
+    ):
+        self._setup_module_name = setup_module_name
+        self._simulation_config = simulation_config
+        self._max_workers = max_workers
+        self._result_extractor = result_extractor
+        self._simulation_kwargs = simulation_kwargs
+
+    def _create_simulation(self) -> "Simulation":
+        simulation = simulation_class_factory()(
+            setup_module_name=self._setup_module_name,
+            simulation_config=self._simulation_config,
+            no_export=True,
+            **self._simulation_kwargs,
+        )
+        simulation._results.calculate_results_in_memory = True  # pylint: disable=protected-access
+        return simulation
+
+    def run(self, configurations: List[SweepConfiguration]) -> List[Dict]:
+        """Run all configurations and return one results row per configuration, in order."""
+        _sweep_state.update(
+            simulation=self._create_simulation(),
+            configurations=configurations,
+            result_extractor=self._result_extractor,
+        )
+        try:
+            # Every task runs in its own fork of the set up parent, never in a reused worker
+            with multiprocessing.get_context("fork").Pool(
+                processes=self._max_workers, maxtasksperchild=1
+            ) as pool:
+                return pool.map(
+                    _run_sweep_configuration, range(len(configurations)), chunksize=1
+                )
+        finally:
+            _sweep_state.clear()
+
+
+def write_sweep_results_csv(rows: List[Dict], file_path: str) -> None:
+    """Write the results rows of a sweep into a single CSV table."""
+    field_names = []
+    for row in rows:
+        field_names.extend(key for key in row if key not in field_names)
+    with open(file_path, "w", encoding="utf-8", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=field_names)
+        writer.writeheader()
+        writer.writerows(rows)
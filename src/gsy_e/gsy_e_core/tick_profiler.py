@@ -0,0 +1,182 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import json
+from collections import defaultdict
+from contextlib import nullcontext
+from logging import getLogger
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from gsy_e.models.market import MarketBase
+
+log = getLogger(__name__)
+
+PHASE_CATEGORY = "phases"
+AREA_CATEGORY = "areas"
+STRATEGY_CATEGORY = "strategies"
+MARKET_CATEGORY = "markets"
+
+_DISABLED_MEASUREMENT = nullcontext()
+
+
+def market_profile_key(market: "MarketBase") -> str:
+    """Return the key of the market in the profile: the path of its area, its type and slot."""
+    if market.time_slot_str is None:
+        return market.random_stream_id
+    return f"{market.random_stream_id} {market.time_slot_str}"
+
+
+class _Measurement:
+    """Context manager that accounts the wall time of its body to a profiler key."""
+
+    __slots__ = ("_profiler", "_category", "_key", "_start")
+
+    def __init__(self, profiler: "TickProfiler", category: str, key: str):
+        self._profiler = profiler
+        self._category = category
+        self._key = key
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self._profiler.add(self._category, self._key, perf_counter() - self._start)
+
+
+class TickProfiler:
+    """
+    Low-overhead wall time instrumentation of the simulation tick loop, disabled by default.
+
+    Phases of the simulation loop are aggregated per tick and per slot. Time spent in strategies,
+    market agents and market matching is additionally attributed to the owning area (by its path
+    in the grid), the class of the strategy / agent and the market (by the path of its area, its
+    type and its slot). Attributed times are inclusive, i.e. the time of a market matching
+    contains the time of the strategies reacting to the resulting trades.
+    At the end of each slot, a summary is appended as one JSON line to the summary file.
+    """
+
+    def __init__(self, max_attributed_keys: int = 100):
+        self.enabled = False
+        self.max_attributed_keys = max_attributed_keys
+        self._file_path: Optional[str] = None
+        self._phase_totals: Dict[str, float] = defaultdict(float)
+        self._phase_max_tick: Dict[str, float] = defaultdict(float)
+        self._tick_phases: Dict[str, float] = defaultdict(float)
+        self._attributed: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._ticks = 0
+
+    def enable(self, file_path: Optional[str] = None) -> None:
+        """Start recording; if file_path is given, per-slot summaries are written to it."""
+        self.enabled = True
+        self._file_path = file_path
+        if file_path is not None:
+            # Truncate the summaries of a previous run
+            with open(file_path, "w", encoding="utf-8"):
+                pass
+        self._reset_slot()
+
+    def disable(self) -> None:
+        """Stop recording."""
+        self.enabled = False
+        self._file_path = None
+        self._reset_slot()
+
+    def _reset_slot(self) -> None:
+        self._phase_totals.clear()
+        self._phase_max_tick.clear()
+        self._tick_phases.clear()
+        self._attributed.clear()
+        self._ticks = 0
+
+    def measure(self, category: str, key: str):
+        """Return a context manager that accounts the time of its body to category / key."""
+        if not self.enabled:
+            return _DISABLED_MEASUREMENT
+        return _Measurement(self, category, key)
+
+    def measure_market(self, market: "MarketBase"):
+        """Return a context manager that accounts the time of its body to the market."""
+        if not self.enabled:
+            return _DISABLED_MEASUREMENT
+        return _Measurement(self, MARKET_CATEGORY, market_profile_key(market))
+
+    def phase(self, name: str):
+        """Return a context manager that accounts the time of its body to a simulation phase."""
+        return self.measure(PHASE_CATEGORY, name)
+
+    def add(self, category: str, key: str, seconds: float) -> None:
+        """Account the given time to category / key."""
+        if category == PHASE_CATEGORY:
+            self._phase_totals[key] += seconds
+            self._tick_phases[key] += seconds
+        else:
+            self._attributed[category][key] += seconds
+
+    def start_tick(self) -> None:
+        """Mark the beginning of a tick, phases measured from now on belong to this tick."""
+        if self.enabled:
+            self._tick_phases.clear()
+
+    def end_tick(self) -> None:
+        """Mark the end of a tick and update the per-tick maxima of the phases."""
+        if not self.enabled:
+            return
+        for phase, seconds in self._tick_phases.items():
+            if seconds > self._phase_max_tick[phase]:
+                self._phase_max_tick[phase] = seconds
+        self._tick_phases.clear()
+        self._ticks += 1
+
+    def _top_attributed(self, category: str) -> Dict[str, float]:
+        limit = self.max_attributed_keys
+        ranked = sorted(self._attributed[category].items(), key=lambda item: -item[1])
+        return dict(ranked[:limit])
+
+    def end_slot(self, slot_number: int, time_slot: str) -> Optional[Dict]:
+        """Build the summary of the finished slot, write it to the summary file and reset."""
+        if not self.enabled:
+            return None
+        summary = {
+            "slot": slot_number,
+            "time_slot": time_slot,
+            "ticks": self._ticks,
+            PHASE_CATEGORY: {
+                phase: {
+                    "total_s": total,
+                    "mean_tick_s": total / self._ticks if self._ticks else 0.0,
+                    "max_tick_s": self._phase_max_tick.get(phase, 0.0),
+                }
+                for phase, total in self._phase_totals.items()
+            },
+            **{
+                category: self._top_attributed(category)
+                for category in (AREA_CATEGORY, STRATEGY_CATEGORY, MARKET_CATEGORY)
+            },
+        }
+        if self._file_path is not None:
+            with open(self._file_path, "a", encoding="utf-8") as summary_file:
+                summary_file.write(json.dumps(summary) + "\n")
+        self._reset_slot()
+        return summary
+
+
+tick_profiler = TickProfiler()
@@ -50,6 +50,7 @@ log = getLogger(__name__)
 if TYPE_CHECKING:
     from gsy_e.models.market import MarketBase
     from gsy_e.models.strategy import BaseStrategy
+    from gsy_e.models.strategy.energy_parameters.heatpump.fleet import HeatPumpFleet
     from gsy_e.models.strategy.trading_strategy_base import TradingStrategyBase
 
 
@@ -89,6 +90,8 @@ class Area(AreaBase):
         self.dispatcher = DispatcherFactory(self)()
         self._markets = AreaMarkets(self.log)
         self.stats = AreaStats(self._markets, self)
+        # Created by the first heat pump that joins it, if BATCH_HEAT_PUMP_FLEET is enabled
+        self.heat_pump_fleet: Optional["HeatPumpFleet"] = None
         log.debug("External connection %s for area %s", external_connection_available, self.name)
         self.redis_ext_conn = (
             RedisMarketExternalConnection(self)
@@ -17,7 +17,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 from logging import getLogger
-from typing import TYPE_CHECKING, List, Union, Optional
+from typing import TYPE_CHECKING, Dict, List, Union, Optional
 from uuid import uuid4
 
 from gsy_framework.area_validator import validate_area
@@ -50,6 +50,8 @@ def check_area_name_exists_in_parent_area(parent_area, name):
     :param name: New name of area
     :return: boolean
     """
+    if isinstance(parent_area.children, AreaChildrenList):
+        return parent_area.children.get_by_name(name) is not None
     for child in parent_area.children:
         if child.name == name:
             return True
@@ -57,11 +59,59 @@ def check_area_name_exists_in_parent_area(parent_area, name):
 
 
 class AreaChildrenList(list):
-    """Class to define the children of an area."""
+    """Class to define the children of an area.
+
+    The children are indexed by name and uuid, so that new children are validated and children
+    are looked up without scanning all their siblings.
+    """
 
     def __init__(self, parent_area, *args, **kwargs):
         self.parent_area = parent_area
         super().__init__(*args, **kwargs)
+        self._children_per_name: Dict[str, "Area"] = {}
+        self._children_per_uuid: Dict[str, "Area"] = {}
+        self._rebuild_index()
+
+    def __reduce__(self):
+        return self.__class__, (self.parent_area, list(self))
+
+    def _rebuild_index(self) -> None:
+        self._children_per_name.clear()
+        self._children_per_uuid.clear()
+        for child in self:
+            self._index_child(child)
+
+    def _index_child(self, child: "Area") -> None:
+        # Children that were added without validation might share a name, the first one is kept
+        self._children_per_name.setdefault(child.name, child)
+        self._children_per_uuid.setdefault(child.uuid, child)
+
+    def _unindex_child(self, child: "Area", name: str) -> None:
+        for index, key, attribute in (
+            (self._children_per_name, name, "name"),
+            (self._children_per_uuid, child.uuid, "uuid"),
+        ):
+            if index.get(key) is not child:
+                continue
+            del index[key]
+            sibling = next(
+                (c for c in self if c is not child and getattr(c, attribute) == key), None
+            )
+            if sibling is not None:
+                index[key] = sibling
+
+    def get_by_name(self, name: str) -> Optional["Area"]:
+        """Return the child with the given name, None if it does not exist."""
+        return self._children_per_name.get(name)
+
+    def get_by_uuid(self, uuid: str) -> Optional["Area"]:
+        """Return the child with the given uuid, None if it does not exist."""
+        return self._children_per_uuid.get(uuid)
+
+    def update_child_name(self, child: "Area", old_name: str) -> None:
+        """Update the name index after the child has been renamed."""
+        self._unindex_child(child, old_name)
+        self._index_child(child)
 
     def _validate_before_insertion(self, item):
         if check_area_name_exists_in_parent_area(self.parent_area, item.name):
@@ -70,10 +120,43 @@ class AreaChildrenList(list):
     def append(self, item: "Area") -> None:
         self._validate_before_insertion(item)
         super().append(item)
+        self._index_child(item)
+        item.invalidate_path_to_root_fees()
 
     def insert(self, index, item):
         self._validate_before_insertion(item)
         super().insert(index, item)
+        self._index_child(item)
+        item.invalidate_path_to_root_fees()
+
+    def remove(self, item: "Area") -> None:
+        super().remove(item)
+        self._unindex_child(item, item.name)
+
+    def pop(self, index=-1) -> "Area":
+        item = super().pop(index)
+        self._unindex_child(item, item.name)
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._rebuild_index()
+
+    def extend(self, items) -> None:
+        super().extend(items)
+        self._rebuild_index()
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __setitem__(self, index, item):
+        super().__setitem__(index, item)
+        self._rebuild_index()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._rebuild_index()
 
 
 class AreaBase:
@@ -99,7 +182,9 @@ class AreaBase:
         self.__name = name
         self.uuid = uuid if uuid is not None else str(uuid4())
         self.slug = slugify(name, to_lower=True)
-        self.parent = None
+        self._parent = None
+        self._random_stream_id = None
+        self._path_to_root_fees: Optional[float] = None
         if not children:
             children = []
         children = [child for child in children if child is not None]
@@ -116,6 +201,36 @@ class AreaBase:
         self._set_grid_fees(grid_fee_constant, grid_fee_percentage)
         self.current_market_time_slot = None
 
+    @property
+    def parent(self) -> Optional["AreaBase"]:
+        """Return the parent area."""
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Optional["AreaBase"]) -> None:
+        self._parent = parent
+        # Both caches are derived from the ancestors of the area
+        self.invalidate_random_stream_id()
+        self.invalidate_path_to_root_fees()
+
+    @property
+    def random_stream_id(self) -> str:
+        """Stable identifier of the area in the grid (path of area names from the root area),
+        used to select its random stream."""
+        if self._random_stream_id is None:
+            self._random_stream_id = (
+                self.name
+                if self.parent is None
+                else f"{self.parent.random_stream_id}/{self.name}"
+            )
+        return self._random_stream_id
+
+    def invalidate_random_stream_id(self) -> None:
+        """Drop the cached random stream id of the area and of its descendants."""
+        self._random_stream_id = None
+        for child in self.children:
+            child.invalidate_random_stream_id()
+
     @property
     def now(self) -> DateTime:
         """Get the current time of the simulation."""
@@ -139,6 +254,16 @@ class AreaBase:
         self.grid_fee_constant = grid_fee_const
         self.grid_fee_percentage = grid_fee_percentage
 
+    @property
+    def grid_fee_constant(self) -> Optional[float]:
+        """Return the constant grid fee of the area."""
+        return self._grid_fee_constant
+
+    @grid_fee_constant.setter
+    def grid_fee_constant(self, grid_fee_constant: Optional[float]) -> None:
+        self._grid_fee_constant = grid_fee_constant
+        self.invalidate_path_to_root_fees()
+
     @property
     def config(self) -> Union[SimulationConfig, GlobalConfig]:
         """Return the configuration used by the area."""
@@ -158,14 +283,27 @@ class AreaBase:
         if check_area_name_exists_in_parent_area(self.parent, new_name):
             raise AreaException("Area name should be unique inside the same Parent Area")
 
+        old_name = self.__name
         self.__name = new_name
+        self.invalidate_random_stream_id()
+        if isinstance(self.parent.children, AreaChildrenList):
+            self.parent.children.update_child_name(self, old_name)
 
     def get_path_to_root_fees(self) -> float:
-        """Return the cumulative fees value from the current area to its root."""
-        if self.parent is not None:
+        """Return the cumulative fees value from the current area to its root.
+        The value is cached until the grid fees of the area or of one of its ancestors change."""
+        if self._path_to_root_fees is None:
             grid_fee_constant = self.grid_fee_constant if self.grid_fee_constant else 0
-            return grid_fee_constant + self.parent.get_path_to_root_fees()
-        return self.grid_fee_constant if self.grid_fee_constant else 0
+            if self.parent is not None:
+                grid_fee_constant += self.parent.get_path_to_root_fees()
+            self._path_to_root_fees = grid_fee_constant
+        return self._path_to_root_fees
+
+    def invalidate_path_to_root_fees(self) -> None:
+        """Drop the cached path-to-root fees of the area and of its descendants."""
+        self._path_to_root_fees = None
+        for child in self.children:
+            child.invalidate_path_to_root_fees()
 
     def get_grid_fee(self):
         """Return the current grid fee for the area."""
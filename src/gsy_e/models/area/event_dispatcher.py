@@ -21,13 +21,14 @@ from typing import Union, Dict, TYPE_CHECKING, Optional
 
 from gsy_framework.constants_limits import ConstSettings
 from gsy_framework.enums import AvailableMarketTypes
-from numpy.random import random
 from pendulum import DateTime
 
 from gsy_e.events.event_structures import MarketEvent, AreaEvent
 from gsy_e.gsy_e_core.enums import FORWARD_MARKET_TYPES
 from gsy_e.gsy_e_core.exceptions import WrongMarketTypeException
+from gsy_e.gsy_e_core.random_streams import random_streams
 from gsy_e.gsy_e_core.redis_connections.area_market import RedisCommunicator
+from gsy_e.gsy_e_core.tick_profiler import AREA_CATEGORY, STRATEGY_CATEGORY, tick_profiler
 from gsy_e.gsy_e_core.util import is_one_sided_market_simulation, is_two_sided_market_simulation
 from gsy_e.models.area.redis_dispatcher.area_event_dispatcher import RedisAreaEventDispatcher
 from gsy_e.models.area.redis_dispatcher.area_to_market_publisher import AreaToMarketEventPublisher
@@ -130,7 +131,9 @@ class AreaDispatcher:
     ) -> None:
 
         if market_type == AvailableMarketTypes.FUTURE and agent_area.dispatcher.future_agent:
-            agent_area.dispatcher.future_agent.event_listener(event_type, **kwargs)
+            self._dispatch_to_agent(
+                agent_area, agent_area.dispatcher.future_agent, event_type, **kwargs
+            )
         elif market_type != AvailableMarketTypes.FUTURE:
             agent_dict = self._get_agents_for_market_type(agent_area.dispatcher, market_type)
             for time_slot, agent in agent_dict.items():
@@ -138,7 +141,21 @@ class AreaDispatcher:
                     # exclude past MAs
                     continue
 
-                agent.event_listener(event_type, **kwargs)
+                self._dispatch_to_agent(agent_area, agent, event_type, **kwargs)
+
+    @staticmethod
+    def _dispatch_to_agent(
+        agent_area: "Area", agent, event_type: Union[MarketEvent, AreaEvent], **kwargs
+    ) -> None:
+        if not tick_profiler.enabled:
+            agent.event_listener(event_type, **kwargs)
+            return
+        # Areas are identified by their path, since area names are only unique among siblings
+        area_key = agent_area.random_stream_id
+        with tick_profiler.measure(AREA_CATEGORY, area_key), tick_profiler.measure(
+            STRATEGY_CATEGORY, agent.__class__.__name__
+        ):
+            agent.event_listener(event_type, **kwargs)
 
     def _broadcast_notification_to_area_and_child_agents(
         self,
@@ -150,7 +167,7 @@ class AreaDispatcher:
         if not self.area.events.is_connected:
             return
 
-        for child in sorted(self.area.children, key=lambda _: random()):
+        for child in random_streams.shuffled(self.area.random_stream_id, self.area.children):
             if not child.children:
                 continue
             self._broadcast_notification_to_single_agent(child, market_type, event_type, **kwargs)
@@ -184,7 +201,7 @@ class AreaDispatcher:
             return
 
         # Broadcast to children in random order to ensure fairness
-        for child in sorted(self.area.children, key=lambda _: random()):
+        for child in random_streams.shuffled(self.area.random_stream_id, self.area.children):
             child.dispatcher.event_listener(event_type, **kwargs)
 
         # TODO: Enable the following block once GSYE-340 is implemented
@@ -243,7 +260,7 @@ class AreaDispatcher:
             self.area.activate(**kwargs)
         if self._should_dispatch_to_strategies(event_type):
             if self.area.strategy:
-                self.area.strategy.event_listener(event_type, **kwargs)
+                self._dispatch_to_strategy(event_type, **kwargs)
         elif (
             (not self.area.events.is_enabled or not self.area.events.is_connected)
             and event_type == AreaEvent.MARKET_CYCLE
@@ -251,6 +268,16 @@ class AreaDispatcher:
         ):
             self.area.strategy.event_on_disabled_area()
 
+    def _dispatch_to_strategy(self, event_type: Union[MarketEvent, AreaEvent], **kwargs) -> None:
+        if not tick_profiler.enabled:
+            self.area.strategy.event_listener(event_type, **kwargs)
+            return
+        area_key = self.area.random_stream_id
+        with tick_profiler.measure(AREA_CATEGORY, area_key), tick_profiler.measure(
+            STRATEGY_CATEGORY, self.area.strategy.__class__.__name__
+        ):
+            self.area.strategy.event_listener(event_type, **kwargs)
+
     @staticmethod
     def _create_agent_object(
         owner: "Area",
@@ -132,6 +132,7 @@ class AreaMarkets:
             ),
             name=area.name,
         )
+        market.owner = area
         self.future_markets = market
         self.future_markets.update_clock(area.now)
         area.dispatcher.create_market_agents_for_future_markets(market)
@@ -155,6 +156,7 @@ class AreaMarkets:
                 ),
                 name=area.name,
             )
+            market.owner = area
             self.forward_markets[market_type] = market
             self.forward_markets[market_type].update_clock(area.now)
             area.dispatcher.create_market_agents_for_forward_markets(market, market_type)
@@ -273,6 +275,7 @@ class AreaMarkets:
             name=area.name,
             in_sim_duration=is_time_slot_in_simulation_duration(time_slot, area.config),
         )
+        market.owner = area
         market.set_open_market_slot_parameters(time_slot, [time_slot])
 
         area.dispatcher.create_market_agents(market_type, market)
@@ -1,7 +1,7 @@
 import json
-from random import random
 from gsy_e.events import AreaEvent
 from gsy_e.gsy_e_core.exceptions import D3ARedisException
+from gsy_e.gsy_e_core.random_streams import random_streams
 from gsy_e.models.area.redis_dispatcher import RedisEventDispatcherBase
 
 
@@ -31,7 +31,7 @@ class RedisAreaEventDispatcher(RedisEventDispatcherBase):
         self.redis.publish(dispatch_chanel, json.dumps(send_data))
 
     def broadcast_event_redis(self, event_type: AreaEvent, **kwargs):
-        for child in sorted(self.area.children, key=lambda _: random()):
+        for child in random_streams.shuffled(self.area.random_stream_id, self.area.children):
             self.publish_area_event(child.uuid, event_type, **kwargs)
             self.redis.wait()
             self.root_dispatcher.market_event_dispatcher.wait_for_futures()
@@ -44,7 +44,7 @@ class RedisAreaEventDispatcher(RedisEventDispatcherBase):
 
             if not self.area.events.is_connected:
                 break
-            for area_name in sorted(agents, key=lambda _: random()):
+            for area_name in random_streams.shuffled(self.area.random_stream_id, agents):
                 agents[area_name].event_listener(event_type, **kwargs)
                 self.root_dispatcher.market_notify_event_dispatcher.wait_for_futures()
 
@@ -1,11 +1,11 @@
 import json
 import logging
-from random import random
 from threading import Event
 from concurrent.futures import TimeoutError, ThreadPoolExecutor
 from gsy_e.events import MarketEvent
 from gsy_e.gsy_e_core.exceptions import D3ARedisException
 from gsy_e.constants import MAX_WORKER_THREADS
+from gsy_e.gsy_e_core.random_streams import random_streams
 from gsy_e.models.area.redis_dispatcher import RedisEventDispatcherBase
 from gsy_e.models.market.market_structures import parse_event_and_parameters_from_json_string
 
@@ -64,7 +64,7 @@ class AreaRedisMarketEventDispatcher(RedisEventDispatcherBase):
         self.redis.publish(dispatch_channel, json.dumps(send_data))
 
     def broadcast_event_redis(self, event_type: MarketEvent, **kwargs):
-        for child in sorted(self.area.children, key=lambda _: random()):
+        for child in random_streams.shuffled(self.area.random_stream_id, self.area.children):
             self.publish_event(child.uuid, event_type, **kwargs)
             self.child_response_events[event_type.value].wait()
             self.child_response_events[event_type.value].clear()
@@ -76,7 +76,7 @@ class AreaRedisMarketEventDispatcher(RedisEventDispatcherBase):
 
             if not self.area.events.is_connected:
                 break
-            for area_name in sorted(agents, key=lambda _: random()):
+            for area_name in random_streams.shuffled(self.area.random_stream_id, agents):
                 agents[area_name].event_listener(event_type, **kwargs)
 
     def publish_response(self, event_type):
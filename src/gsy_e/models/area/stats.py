@@ -16,7 +16,6 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 from copy import copy
-from statistics import mean, median
 from typing import Dict, List, Optional
 
 from gsy_framework.constants_limits import ConstSettings
@@ -27,8 +26,8 @@ from gsy_framework.utils import (
 from gsy_framework.utils import limit_float_precision
 from pendulum import DateTime
 
-from gsy_e.gsy_e_core.util import add_or_create_key, area_sells_to_child, child_buys_from_area
 from gsy_e.models.market import MarketBase
+from gsy_e.models.market.market_structures import MarketTradeStatistics
 from gsy_e.models.strategy.load_hours import LoadHoursStrategy
 from gsy_e.models.strategy.pv import PVStrategy
 
@@ -109,7 +108,7 @@ class AreaStats:
         """Extract the cheapest offer from the market"""
         cheapest_offers = []
         for market in self._markets.markets.values():
-            cheapest_offers.extend(market.sorted_offers[0:1])
+            cheapest_offers.extend(market.most_affordable_offers[0:1])
         return cheapest_offers
 
     def _get_current_market_bills(self) -> Dict:
@@ -124,19 +123,25 @@ class AreaStats:
         return (self.rate_stats_market.get(self.current_market.time_slot, None)
                 if self.current_market is not None else None)
 
+    def _current_market_trade_stats(self) -> MarketTradeStatistics:
+        trade_stats = getattr(self.current_market, "trade_stats", None)
+        if trade_stats is None:
+            trade_stats = MarketTradeStatistics.from_trades(
+                getattr(self.current_market, "trades", None) or [])
+        return trade_stats
+
     def min_max_avg_median_rate_current_market(self) -> Dict:
         """Get min, max, average & median energy traded rate as well as
         total volume of energy traded"""
         out_dict = copy(default_trade_stats_dict)
-        trade_volumes = [trade.traded_energy for trade in self.current_market.trades]
-        trade_rates = [trade.trade_rate
-                       for trade in self.current_market.trades]
-        if len(trade_rates) > 0:
-            out_dict["min_trade_rate"] = limit_float_precision(min(trade_rates))
-            out_dict["max_trade_rate"] = limit_float_precision(max(trade_rates))
-            out_dict["avg_trade_rate"] = limit_float_precision(mean(trade_rates))
-            out_dict["median_trade_rate"] = limit_float_precision(median(trade_rates))
-            out_dict["total_traded_energy_kWh"] = limit_float_precision(sum(trade_volumes))
+        trade_stats = self._current_market_trade_stats()
+        if trade_stats.trade_count > 0:
+            out_dict["min_trade_rate"] = limit_float_precision(trade_stats.min_trade_rate)
+            out_dict["max_trade_rate"] = limit_float_precision(trade_stats.max_trade_rate)
+            out_dict["avg_trade_rate"] = limit_float_precision(trade_stats.avg_trade_rate)
+            out_dict["median_trade_rate"] = limit_float_precision(trade_stats.median_trade_rate)
+            out_dict["total_traded_energy_kWh"] = limit_float_precision(
+                trade_stats.total_traded_energy_kWh)
         return out_dict
 
     @property
@@ -170,17 +175,15 @@ class AreaStats:
         self.imported_traded_energy_kwh = {}
         self.exported_traded_energy_kwh = {}
 
-        child_names = [area_name_from_area_or_ma_name(c.name) for c in self._area.children]
-        if getattr(self.current_market, "trades", None) is not None:
-            for trade in self.current_market.trades:
-                if child_buys_from_area(trade, self._area.name, child_names):
-                    add_or_create_key(self.exported_traded_energy_kwh,
-                                      self.current_market.time_slot,
-                                      trade.traded_energy)
-                if area_sells_to_child(trade, self._area.name, child_names):
-                    add_or_create_key(self.imported_traded_energy_kwh,
-                                      self.current_market.time_slot,
-                                      trade.traded_energy)
+        child_names = {area_name_from_area_or_ma_name(c.name) for c in self._area.children}
+        area_names = {self._area.name}
+        trade_stats = self._current_market_trade_stats()
+        if trade_stats.trade_count > 0:
+            time_slot = self.current_market.time_slot
+            self.exported_traded_energy_kwh[time_slot] = trade_stats.traded_energy_between(
+                seller_names=child_names, buyer_names=area_names)
+            self.imported_traded_energy_kwh[time_slot] = trade_stats.traded_energy_between(
+                seller_names=area_names, buyer_names=child_names)
         if self.current_market.time_slot not in self.imported_traded_energy_kwh:
             self.imported_traded_energy_kwh[self.current_market.time_slot] = 0.
         if self.current_market.time_slot not in self.exported_traded_energy_kwh:
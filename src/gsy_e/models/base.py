@@ -75,6 +75,9 @@ class AreaBehaviorBase:
     def deactivate(self) -> None:
         """Handles deactivate event"""
 
+    def event_area_deleted(self) -> None:
+        """Override to release the resources of the strategy when its area is deleted"""
+
     def area_reconfigure_event(self, *args, **kwargs) -> None:
         """Reconfigure the strategy properties at runtime using the provided arguments.
 
@@ -22,7 +22,7 @@ from dataclasses import dataclass
 from functools import wraps
 from logging import getLogger
 from threading import RLock
-from typing import Dict, List, Union, Optional, Callable, TYPE_CHECKING
+from typing import Dict, Iterator, List, Union, Optional, Callable, Tuple, TYPE_CHECKING
 
 from gsy_framework.constants_limits import (
     ConstSettings,
@@ -31,10 +31,11 @@ from gsy_framework.constants_limits import (
     DATE_TIME_FORMAT,
 )
 from gsy_framework.data_classes import Offer, Trade, Bid
-from numpy.random import random
 from pendulum import DateTime, duration
 
+import gsy_e.constants
 from gsy_e.gsy_e_core.device_registry import DeviceRegistry
+from gsy_e.gsy_e_core.random_streams import random_streams
 from gsy_e.gsy_e_core.util import (
     add_or_create_key,
     subtract_or_create_key,
@@ -42,6 +43,11 @@ from gsy_e.gsy_e_core.util import (
 )
 from gsy_e.models.market.grid_fees.base_model import GridFees
 from gsy_e.models.market.grid_fees.constant_grid_fees import ConstantGridFees
+from gsy_e.models.market.grid_fees.fixed_point_grid_fees import (
+    FixedPointConstantGridFees,
+    FixedPointGridFees,
+)
+from gsy_e.models.market.market_structures import MarketTradeStatistics, OrderBook
 from gsy_e.models.market.market_redis_connection import (
     MarketRedisEventSubscriber,
     MarketRedisEventPublisher,
@@ -49,6 +55,7 @@ from gsy_e.models.market.market_redis_connection import (
 )
 
 if TYPE_CHECKING:
+    from gsy_e.models.area.area_base import AreaBase
     from gsy_e.models.config import SimulationConfig
 
 log = getLogger(__name__)
@@ -109,17 +116,22 @@ class MarketBase:  # pylint: disable=too-many-instance-attributes
         name: Optional[str] = None,
     ):
         self.name = name
+        # Area that owns the market, set by the area when it creates the market
+        self.owner: Optional["AreaBase"] = None
         self.bc_interface = bc
         self.id = str(uuid.uuid4())
         self.time_slot = time_slot
         self.readonly = readonly
         # offer-id -> Offer
-        self.offers: Dict[str, Offer] = {}
+        self.offers: Dict[str, Offer] = OrderBook()
         self.offer_history: List[Offer] = []
         self.notification_listeners: List[Callable] = []
-        self.bids: Dict[str, Bid] = {}
+        self.bids: Dict[str, Bid] = OrderBook()
+        # (order book, order book version, sorted offers)
+        self._sorted_offers_cache: Optional[Tuple[Dict, int, List]] = None
         self.bid_history: List[Bid] = []
         self.trades: List[Trade] = []
+        self.trade_stats = MarketTradeStatistics()
         self.const_fee_rate: Optional[float] = None
         self.now: DateTime = time_slot
 
@@ -171,6 +183,15 @@ class MarketBase:  # pylint: disable=too-many-instance-attributes
         """Return the market type representation."""
         return "Market"
 
+    @property
+    def random_stream_id(self) -> str:
+        """Identifier of the random stream of the market, shared by its market slots.
+
+        Built from the path of the owning area, since area names are only unique among siblings.
+        """
+        owner_stream_id = self.owner.random_stream_id if self.owner is not None else self.name
+        return f"{owner_stream_id}:{self.type_name}"
+
     @property
     def avg_trade_price(self) -> float:
         """Update and return the average trade price in the current market."""
@@ -182,34 +203,61 @@ class MarketBase:  # pylint: disable=too-many-instance-attributes
         return self._avg_trade_price
 
     @property
-    def sorted_offers(self):
-        """Sort the offers using the self.sorting method."""
-
-        return self.sorting(self.offers)
+    def sorted_offers(self) -> List[Offer]:
+        """Sort the offers using the self.sorting method, again only if the offers were modified.
+        The returned list is cached and shared between callers, it should not be modified."""
+        offers = self.offers
+        if not isinstance(offers, OrderBook):
+            return self.sorting(offers)
+        cached = self._sorted_offers_cache
+        if cached is None or cached[0] is not offers or cached[1] != offers.version:
+            cached = (offers, offers.version, self.sorting(offers))
+            self._sorted_offers_cache = cached
+        return cached[2]
 
     @property
     def most_affordable_offers(self):
         """Return the offers with the least energy_rate value."""
-        cheapest_offer = self.sorted_offers[0]
-        rate = cheapest_offer.energy_rate
-        return [
-            o for o in self.sorted_offers if abs(o.energy_rate - rate) < FLOATING_POINT_TOLERANCE
-        ]
+        if isinstance(self.offers, OrderBook):
+            return self.offers.lowest_rate_orders(tolerance=FLOATING_POINT_TOLERANCE)
+        sorted_offers = self.sorted_offers
+        if not sorted_offers:
+            return []
+        rate = sorted_offers[0].energy_rate
+        return [o for o in sorted_offers if abs(o.energy_rate - rate) < FLOATING_POINT_TOLERANCE]
+
+    def iterate_sorted_offers(self) -> Iterator[Offer]:
+        """Lazily yield the offers from the cheapest to the most expensive one.
+
+        Unlike sorted_offers, the offers are not sorted upfront, callers that stop at the first
+        acceptable price levels only visit these levels.
+        """
+        if isinstance(self.offers, OrderBook):
+            return self.offers.iterate_rate_tiers()
+        return iter(self.sorted_offers)
 
     def _create_fee_handler(self, grid_fee_type: int, grid_fees: GridFee) -> None:
         if not grid_fees:
             grid_fees = GridFee(grid_fee_percentage=0.0, grid_fee_const=0.0)
         if grid_fee_type == 1:
+            fee_class = (
+                FixedPointConstantGridFees
+                if gsy_e.constants.FIXED_POINT_GRID_FEES
+                else ConstantGridFees
+            )
             if grid_fees.grid_fee_const is None or grid_fees.grid_fee_const <= 0.0:
-                self.fee_class = ConstantGridFees(0.0)
+                self.fee_class = fee_class(0.0)
             else:
-                self.fee_class = ConstantGridFees(grid_fees.grid_fee_const)
+                self.fee_class = fee_class(grid_fees.grid_fee_const)
             self.const_fee_rate = float(self.fee_class.grid_fee_rate)
         else:
+            fee_class = (
+                FixedPointGridFees if gsy_e.constants.FIXED_POINT_GRID_FEES else GridFees
+            )
             if grid_fees.grid_fee_percentage is None or grid_fees.grid_fee_percentage <= 0.0:
-                self.fee_class = GridFees(0.0)
+                self.fee_class = fee_class(0.0)
             else:
-                self.fee_class = GridFees(grid_fees.grid_fee_percentage / 100)
+                self.fee_class = fee_class(grid_fees.grid_fee_percentage / 100)
 
     @property
     def _is_constant_fees(self) -> bool:
@@ -233,12 +281,15 @@ class MarketBase:  # pylint: disable=too-many-instance-attributes
             self.redis_publisher.publish_event(event, **kwargs)
         else:
             # Deliver notifications in random order to ensure fairness
-            for listener in sorted(self.notification_listeners, key=lambda inp: random()):
+            for listener in random_streams.shuffled(
+                self.random_stream_id, self.notification_listeners
+            ):
                 listener(event, market_id=self.id, **kwargs)
 
     def _update_stats_after_trade(self, trade: Trade, order: Union[Offer, Bid]) -> None:
         """Update the instance state in response to an occurring trade."""
         self.trades.append(trade)
+        self.trade_stats.add_trade(trade)
         self.market_fee += trade.fee_price
         self._update_accumulated_trade_price_energy(trade)
         self.traded_energy = add_or_create_key(self.traded_energy, trade.seller.name, order.energy)
@@ -17,9 +17,11 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 from abc import abstractmethod
-from typing import Optional, TYPE_CHECKING, List
+from decimal import Decimal
+from typing import Iterable, Optional, TYPE_CHECKING, List, Tuple, Union
 
 from gsy_framework.constants_limits import ConstSettings
+from gsy_framework.data_classes import Bid, Offer, TraderDetails
 from gsy_framework.enums import AvailableMarketTypes
 from pendulum import DateTime, duration
 
@@ -32,6 +34,9 @@ if TYPE_CHECKING:
     from gsy_e.models.config import SimulationConfig
     from gsy_e.models.area.event_dispatcher import AreaDispatcher
 
+# (time_slot, energy_rate, energy_kWh) of an order that is posted in bulk
+ForwardOrderParameters = Tuple[DateTime, Union[float, Decimal], Union[float, Decimal]]
+
 
 class ForwardMarketBase(FutureMarkets):
     """Base class for forward markets"""
@@ -88,6 +93,68 @@ class ForwardMarketBase(FutureMarkets):
                 closing_time=self._calculate_closing_time(market_slot),
             )
 
+    def get_trader_bids(self, time_slot: DateTime, trader_uuid: str) -> List[Bid]:
+        """Return the open bids of the trader on the market slot."""
+        return list(self.bids.get_trader_orders(time_slot, trader_uuid).values())
+
+    def get_trader_offers(self, time_slot: DateTime, trader_uuid: str) -> List[Offer]:
+        """Return the open offers of the trader on the market slot."""
+        return list(self.offers.get_trader_orders(time_slot, trader_uuid).values())
+
+    def bulk_bid(
+        self, orders: Iterable[ForwardOrderParameters], buyer: TraderDetails
+    ) -> List[Bid]:
+        """Post one bid of the buyer for each (time_slot, energy_rate, energy_kWh) tuple.
+
+        Each bid is posted with a separate bid call, with its own validation and event."""
+        return [
+            self.bid(
+                float(energy_rate * energy_kWh),
+                float(energy_kWh),
+                buyer=buyer,
+                original_price=float(energy_rate * energy_kWh),
+                time_slot=time_slot,
+            )
+            for time_slot, energy_rate, energy_kWh in orders
+        ]
+
+    def bulk_offer(
+        self, orders: Iterable[ForwardOrderParameters], seller: TraderDetails
+    ) -> List[Offer]:
+        """Post one offer of the seller for each (time_slot, energy_rate, energy_kWh) tuple.
+
+        Each offer is posted with a separate offer call, with its own validation and event."""
+        return [
+            self.offer(
+                float(energy_rate * energy_kWh),
+                float(energy_kWh),
+                seller,
+                original_price=float(energy_rate * energy_kWh),
+                time_slot=time_slot,
+            )
+            for time_slot, energy_rate, energy_kWh in orders
+        ]
+
+    def bulk_delete_bids(self, buyer_uuid: str, time_slots: Iterable[DateTime]) -> int:
+        """Delete all open bids of the buyer on the market slots, return their number."""
+        bids = [
+            bid for time_slot in time_slots for bid in self.get_trader_bids(time_slot, buyer_uuid)
+        ]
+        for bid in bids:
+            self.delete_bid(bid)
+        return len(bids)
+
+    def bulk_delete_offers(self, seller_uuid: str, time_slots: Iterable[DateTime]) -> int:
+        """Delete all open offers of the seller on the market slots, return their number."""
+        offers = [
+            offer
+            for time_slot in time_slots
+            for offer in self.get_trader_offers(time_slot, seller_uuid)
+        ]
+        for offer in offers:
+            self.delete_offer(offer)
+        return len(offers)
+
 
 class IntradayMarket(ForwardMarketBase):
     """Intraday market block implementation"""
@@ -22,12 +22,13 @@ from logging import getLogger
 from typing import Dict, List, Optional, TYPE_CHECKING
 
 from gsy_framework.constants_limits import ConstSettings, GlobalConfig, DATE_TIME_FORMAT
-from gsy_framework.data_classes import Bid, Offer, Trade, TraderDetails
+from gsy_framework.data_classes import BaseBidOffer, Bid, Offer, Trade, TraderDetails
 from gsy_framework.utils import is_time_slot_in_simulation_duration
 from pendulum import DateTime, duration
 
 from gsy_e.gsy_e_core.blockchain_interface import NonBlockchainInterface
 from gsy_e.models.market import GridFee, lock_market_action, MarketSlotParams
+from gsy_e.models.market.market_structures import MarketTradeStatistics, get_order_trader
 from gsy_e.models.market.two_sided import TwoSidedMarket
 
 if TYPE_CHECKING:
@@ -45,6 +46,8 @@ class FutureOrders(UserDict):
     """Special mapping object to keep track of a future market's orders."""
     def __init__(self, *args, **kwargs):
         self.slot_order_mapping = {}
+        # {time_slot: {trader_uuid: {order_id: order}}}
+        self.slot_trader_order_mapping: Dict[DateTime, Dict[str, Dict[str, BaseBidOffer]]] = {}
         super().__init__(*args, **kwargs)
 
     def __setitem__(self, order_id, order):
@@ -52,13 +55,25 @@ class FutureOrders(UserDict):
         if order.time_slot not in self.slot_order_mapping:
             self.slot_order_mapping[order.time_slot] = []
         self.slot_order_mapping[order.time_slot].append(order)
+        self.slot_trader_order_mapping.setdefault(order.time_slot, {}).setdefault(
+            get_order_trader(order).uuid, {})[order_id] = order
 
     def __delitem__(self, order_id):
         order = self.data.get(order_id, None)
         if order:
             self.slot_order_mapping[order.time_slot].remove(order)
+            slot_trader_orders = self.slot_trader_order_mapping.get(order.time_slot, {})
+            trader_uuid = get_order_trader(order).uuid
+            trader_orders = slot_trader_orders.get(trader_uuid, {})
+            trader_orders.pop(order_id, None)
+            if not trader_orders:
+                slot_trader_orders.pop(trader_uuid, None)
         del self.data[order_id]
 
+    def get_trader_orders(self, time_slot: DateTime, trader_uuid: str) -> Dict[str, BaseBidOffer]:
+        """Return the {order_id: order} mapping of the trader's orders on the time slot."""
+        return self.slot_trader_order_mapping.get(time_slot, {}).get(trader_uuid, {})
+
 
 class FutureMarkets(TwoSidedMarket):
     """Class responsible for future markets."""
@@ -176,6 +191,7 @@ class FutureMarkets(TwoSidedMarket):
         for time_slot in deepcopy(list(orders.slot_order_mapping.keys())):
             if time_slot <= current_market_time_slot:
                 del orders.slot_order_mapping[time_slot]
+                orders.slot_trader_order_mapping.pop(time_slot, None)
 
     def delete_orders_in_old_future_markets(self, last_slot_to_be_deleted: DateTime
                                             ) -> None:
@@ -189,6 +205,7 @@ class FutureMarkets(TwoSidedMarket):
             self.bid_history, last_slot_to_be_deleted)
         self.trades = self._remove_old_orders_from_list(
             self.trades, last_slot_to_be_deleted)
+        self.trade_stats = MarketTradeStatistics.from_trades(self.trades)
 
     @staticmethod
     def _calculate_closing_time(delivery_time: DateTime) -> DateTime:
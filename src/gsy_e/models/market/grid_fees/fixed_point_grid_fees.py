@@ -0,0 +1,249 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Optional, Tuple, Union
+
+from gsy_framework.data_classes import TradeBidOfferInfo
+
+from gsy_e.models.market.grid_fees.base_model import GridFees
+from gsy_e.models.market.grid_fees.constant_grid_fees import ConstantGridFees
+
+# Rates are represented as integers in units of 1e-12 of the rate unit
+FIXED_POINT_SCALE = 10**12
+FIXED_POINT_DECIMAL_EXPONENT = -12
+FIXED_POINT_QUANTUM = Decimal(1).scaleb(FIXED_POINT_DECIMAL_EXPONENT)
+
+
+def to_fixed_point(value: Union[Decimal, float, int]) -> int:
+    """Convert a rate to its scaled integer representation.
+
+    The conversion goes through the exact Decimal value of the input without a float round-trip,
+    so rates with up to 12 decimal places are represented exactly. Finer digits (e.g. the binary
+    expansion of floats like 0.1) are rounded half to even to the nearest 1e-12.
+    """
+    quantized = Decimal(value).quantize(FIXED_POINT_QUANTUM, rounding=ROUND_HALF_EVEN)
+    return int(quantized.scaleb(-FIXED_POINT_DECIMAL_EXPONENT))
+
+
+def fixed_point_to_float(value: int) -> float:
+    """Convert a scaled integer back to a float rate."""
+    return value / FIXED_POINT_SCALE
+
+
+def fixed_point_to_decimal(value: int) -> Decimal:
+    """Convert a scaled integer back to a Decimal rate."""
+    return Decimal(value).scaleb(FIXED_POINT_DECIMAL_EXPONENT)
+
+
+def fixed_point_divide(numerator: int, denominator: int) -> int:
+    """Integer division, rounded half to even like the default decimal context."""
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator)
+    doubled_remainder = 2 * remainder
+    if doubled_remainder > denominator or (
+        doubled_remainder == denominator and quotient % 2 == 1
+    ):
+        quotient += 1
+    return quotient
+
+
+def fixed_point_multiply(first: int, second: int) -> int:
+    """Multiply two scaled integers, keeping the scale of the result."""
+    return fixed_point_divide(first * second, FIXED_POINT_SCALE)
+
+
+class FixedPointGridFees(GridFees):
+    """
+    Percentage grid fees that calculate the trade fees and the propagation of the original order
+    info with scaled integers instead of Decimal numbers.
+    """
+
+    def __init__(self, grid_fee_rate: float):
+        super().__init__(grid_fee_rate)
+        self._grid_fee_rate_fp = to_fixed_point(grid_fee_rate)
+
+    # pylint: disable=too-many-positional-arguments
+    def _calculate_fixed_point_fee_revenue_from_clearing_trade(
+        self,
+        bid_propagated_rate: int,
+        bid_original_rate: int,
+        offer_propagated_rate: int,
+        offer_original_rate: int,
+        trade_rate_source: int,
+    ) -> Tuple[int, int, int]:
+        # pylint: disable=too-many-arguments
+        # Keep the taxes as exact fractions and round each result only once, in order to
+        # reproduce the Decimal calculation rounded to the fixed-point scale
+        demand_side_tax_num, demand_side_tax_den = (
+            (0, 1)
+            if bid_original_rate == 0
+            else (bid_original_rate - bid_propagated_rate, bid_original_rate)
+        )
+        supply_side_tax_num, supply_side_tax_den = (
+            (0, 1)
+            if offer_original_rate == 0
+            else (offer_propagated_rate - offer_original_rate, offer_original_rate)
+        )
+        # 1 + demand_side_tax + supply_side_tax
+        fee_factor_den = demand_side_tax_den * supply_side_tax_den
+        fee_factor_num = (
+            fee_factor_den
+            + demand_side_tax_num * supply_side_tax_den
+            + supply_side_tax_num * demand_side_tax_den
+        )
+        revenue_num = trade_rate_source * fee_factor_den
+        revenue = fixed_point_divide(revenue_num, fee_factor_num)
+        grid_fee_rate = fixed_point_divide(
+            revenue_num * self._grid_fee_rate_fp, fee_factor_num * FIXED_POINT_SCALE
+        )
+        trade_price = fixed_point_divide(
+            revenue_num * (supply_side_tax_den + supply_side_tax_num),
+            fee_factor_num * supply_side_tax_den,
+        )
+        return revenue, grid_fee_rate, trade_price
+
+    @staticmethod
+    def calculate_original_trade_rate_from_clearing_rate(
+        original_bid_rate: Union[Decimal, float],
+        propagated_bid_rate: Union[Decimal, float],
+        clearing_rate: Union[Decimal, float],
+    ) -> float:
+        # Multiply before dividing, in order to round the scaled result only once
+        trade_rate = fixed_point_divide(
+            to_fixed_point(clearing_rate) * to_fixed_point(original_bid_rate),
+            to_fixed_point(propagated_bid_rate),
+        )
+        return fixed_point_to_float(trade_rate)
+
+    def propagate_original_bid_info_on_offer_trade(
+        self, trade_original_info: TradeBidOfferInfo
+    ) -> Optional[TradeBidOfferInfo]:
+        if trade_original_info is None or trade_original_info.propagated_bid_rate is None:
+            return None
+        bid_rate = to_fixed_point(trade_original_info.propagated_bid_rate) - fixed_point_multiply(
+            to_fixed_point(trade_original_info.original_bid_rate), self._grid_fee_rate_fp
+        )
+        trade_bid_info = TradeBidOfferInfo(
+            original_bid_rate=trade_original_info.original_bid_rate,
+            propagated_bid_rate=fixed_point_to_float(bid_rate),
+            original_offer_rate=None,
+            propagated_offer_rate=None,
+            trade_rate=trade_original_info.trade_rate,
+        )
+        return trade_bid_info
+
+    def propagate_original_offer_info_on_bid_trade(
+        self, trade_original_info: TradeBidOfferInfo, ignore_fees: bool = False
+    ) -> TradeBidOfferInfo:
+        offer_rate = to_fixed_point(trade_original_info.propagated_offer_rate)
+        if not ignore_fees:
+            offer_rate += fixed_point_multiply(
+                to_fixed_point(trade_original_info.original_offer_rate), self._grid_fee_rate_fp
+            )
+        trade_offer_info = TradeBidOfferInfo(
+            original_bid_rate=None,
+            propagated_bid_rate=None,
+            original_offer_rate=trade_original_info.original_offer_rate,
+            propagated_offer_rate=fixed_point_to_float(offer_rate),
+            trade_rate=trade_original_info.trade_rate,
+        )
+        return trade_offer_info
+
+    def calculate_trade_price_and_fees(
+        self, trade_bid_info: TradeBidOfferInfo
+    ) -> Tuple[Decimal, Decimal, Decimal]:
+        revenue, grid_fee_rate, trade_price = (
+            self._calculate_fixed_point_fee_revenue_from_clearing_trade(
+                bid_propagated_rate=to_fixed_point(trade_bid_info.propagated_bid_rate),
+                bid_original_rate=to_fixed_point(trade_bid_info.original_bid_rate),
+                offer_propagated_rate=to_fixed_point(trade_bid_info.propagated_offer_rate),
+                offer_original_rate=to_fixed_point(trade_bid_info.original_offer_rate),
+                trade_rate_source=to_fixed_point(trade_bid_info.trade_rate),
+            )
+        )
+        return (
+            fixed_point_to_decimal(revenue),
+            fixed_point_to_decimal(grid_fee_rate),
+            fixed_point_to_decimal(trade_price),
+        )
+
+
+class FixedPointConstantGridFees(ConstantGridFees):
+    """
+    Constant grid fees that calculate the trade fees and the propagation of the original order
+    info with scaled integers instead of Decimal numbers.
+    """
+
+    def __init__(self, grid_fee_rate: float):
+        super().__init__(grid_fee_rate)
+        self._grid_fee_rate_fp = to_fixed_point(grid_fee_rate)
+
+    @staticmethod
+    def calculate_original_trade_rate_from_clearing_rate(
+        original_bid_rate: Union[Decimal, float],
+        propagated_bid_rate: Union[Decimal, float],
+        clearing_rate: Union[Decimal, float],
+    ) -> float:
+        trade_rate = (
+            to_fixed_point(clearing_rate)
+            + to_fixed_point(original_bid_rate)
+            - to_fixed_point(propagated_bid_rate)
+        )
+        return fixed_point_to_float(trade_rate)
+
+    def propagate_original_bid_info_on_offer_trade(
+        self, trade_original_info
+    ) -> Optional[TradeBidOfferInfo]:
+        if trade_original_info is None or trade_original_info.propagated_bid_rate is None:
+            return None
+        bid_rate = to_fixed_point(trade_original_info.propagated_bid_rate) - self._grid_fee_rate_fp
+        trade_bid_info = TradeBidOfferInfo(
+            original_bid_rate=trade_original_info.original_bid_rate,
+            propagated_bid_rate=fixed_point_to_float(bid_rate),
+            original_offer_rate=None,
+            propagated_offer_rate=None,
+            trade_rate=trade_original_info.trade_rate,
+        )
+        return trade_bid_info
+
+    def propagate_original_offer_info_on_bid_trade(
+        self, trade_original_info: TradeBidOfferInfo, ignore_fees=False
+    ):
+        offer_rate = to_fixed_point(trade_original_info.propagated_offer_rate)
+        if not ignore_fees:
+            offer_rate += self._grid_fee_rate_fp
+        trade_offer_info = TradeBidOfferInfo(
+            original_bid_rate=None,
+            propagated_bid_rate=None,
+            original_offer_rate=trade_original_info.original_offer_rate,
+            propagated_offer_rate=fixed_point_to_float(offer_rate),
+            trade_rate=trade_original_info.trade_rate,
+        )
+        return trade_offer_info
+
+    def calculate_trade_price_and_fees(
+        self, trade_bid_info: TradeBidOfferInfo
+    ) -> Tuple[Decimal, Decimal, Decimal]:
+        bid_rate = to_fixed_point(trade_bid_info.propagated_bid_rate)
+        return (
+            fixed_point_to_decimal(bid_rate - self._grid_fee_rate_fp),
+            self.grid_fee_rate,
+            fixed_point_to_decimal(bid_rate),
+        )
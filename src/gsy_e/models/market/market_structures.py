@@ -16,9 +16,12 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import json
-from typing import Tuple
+from bisect import bisect_left, bisect_right, insort
+from heapq import heappop, heappush
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
-from gsy_framework.data_classes import Trade, BaseBidOffer
+from gsy_framework.data_classes import Bid, BaseBidOffer, Offer, Trade, TraderDetails
+from gsy_framework.utils import area_name_from_area_or_ma_name
 
 from gsy_e.events import MarketEvent
 
@@ -38,3 +41,210 @@ def parse_event_and_parameters_from_json_string(payload) -> Tuple:
         kwargs["bid_trade"] = Trade.from_json(kwargs["bid_trade"])
     event_type = MarketEvent(data["event_type"])
     return event_type, kwargs
+
+
+def get_order_trader(order: Union[Offer, Bid]) -> TraderDetails:
+    """Return the trader that posted the order (the seller of offers, the buyer of bids)."""
+    return order.seller if isinstance(order, Offer) else order.buyer
+
+
+class OrderBook(dict):
+    """Dict of orders (order id -> order) that counts its mutations.
+
+    The version is used to invalidate views that are derived from the orders (e.g. the sorted
+    orders of a market), without the need to recompute them on every access.
+    Alongside the orders, the order book keeps the orders grouped in tiers of equal energy rate,
+    with the tier rates kept in ascending order.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.version = 0
+        # order id -> energy rate of the order at insertion
+        self._insertion_rates: Dict[str, float] = {}
+        self._orders_per_rate: Dict[float, Dict[str, Union[Offer, Bid]]] = {}
+        self._rates: List[float] = []
+        self.update(*args, **kwargs)
+
+    def _add_to_indexes(self, key, value) -> None:
+        self._remove_from_indexes(key)
+        energy_rate = value.energy_rate
+        self._insertion_rates[key] = energy_rate
+        rate_tier = self._orders_per_rate.get(energy_rate)
+        if rate_tier is None:
+            rate_tier = self._orders_per_rate[energy_rate] = {}
+            insort(self._rates, energy_rate)
+        rate_tier[key] = value
+
+    def _remove_from_indexes(self, key) -> None:
+        energy_rate = self._insertion_rates.pop(key, None)
+        if energy_rate is None:
+            return
+        # The rate of the order at insertion is used, the order itself might have been updated
+        rate_tier = self._orders_per_rate[energy_rate]
+        del rate_tier[key]
+        if not rate_tier:
+            del self._orders_per_rate[energy_rate]
+            del self._rates[bisect_left(self._rates, energy_rate)]
+
+    def lowest_rate_orders(self, tolerance: float = 0.0) -> List[Union[Offer, Bid]]:
+        """Return the orders with the lowest energy rate, in the order they were added.
+
+        Orders whose rate differs from the lowest one by less than the tolerance are included.
+        """
+        orders = []
+        for rate in self._rates:
+            if orders and rate - self._rates[0] >= tolerance:
+                break
+            orders.extend(self._orders_per_rate[rate].values())
+        return orders
+
+    def iterate_rate_tiers(self) -> Iterator[Union[Offer, Bid]]:
+        """Lazily yield the orders tier by tier, in ascending energy rate.
+
+        Each tier is copied when it is reached, therefore the order book can be modified while
+        iterating (e.g. when accepting the yielded orders). Orders added to an already visited
+        tier are not yielded.
+        """
+        if not self._rates:
+            return
+        rate = self._rates[0]
+        while True:
+            yield from list(self._orders_per_rate.get(rate, {}).values())
+            position = bisect_right(self._rates, rate)
+            if position >= len(self._rates):
+                return
+            rate = self._rates[position]
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._add_to_indexes(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._remove_from_indexes(key)
+        self.version += 1
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def pop(self, *args):
+        self.version += 1
+        if args:
+            self._remove_from_indexes(args[0])
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        key, value = super().popitem()
+        self._remove_from_indexes(key)
+        return key, value
+
+    def clear(self):
+        self.version += 1
+        super().clear()
+        self._insertion_rates.clear()
+        self._orders_per_rate.clear()
+        self._rates.clear()
+
+    def update(self, *args, **kwargs):
+        self.version += 1
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+
+class StreamingMedian:
+    """Median of a stream of values, maintained with a max-heap and a min-heap."""
+
+    def __init__(self):
+        # Max-heap (negated values) of the lower half, min-heap of the upper half
+        self._lower: List[float] = []
+        self._upper: List[float] = []
+
+    def __len__(self):
+        return len(self._lower) + len(self._upper)
+
+    def add(self, value: float) -> None:
+        """Add a value in O(log n)."""
+        if self._lower and value > -self._lower[0]:
+            heappush(self._upper, value)
+        else:
+            heappush(self._lower, -value)
+        if len(self._lower) > len(self._upper) + 1:
+            heappush(self._upper, -heappop(self._lower))
+        elif len(self._upper) > len(self._lower):
+            heappush(self._lower, -heappop(self._upper))
+
+    @property
+    def median(self) -> Optional[float]:
+        """Return the median of all added values, same as statistics.median."""
+        if not self._lower:
+            return None
+        if len(self._lower) > len(self._upper):
+            return -self._lower[0]
+        return (-self._lower[0] + self._upper[0]) / 2
+
+
+class MarketTradeStatistics:
+    """Trade rate and volume statistics of a market, updated whenever a trade is registered."""
+
+    def __init__(self):
+        self.trade_count = 0
+        self.min_trade_rate: Optional[float] = None
+        self.max_trade_rate: Optional[float] = None
+        self.total_trade_rate = 0.0
+        self.total_traded_energy_kWh = 0.0
+        self._median_trade_rate = StreamingMedian()
+        # (seller area name, buyer area name) -> traded energy
+        self.traded_energy_per_seller_buyer: Dict[Tuple[str, str], float] = {}
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Trade]) -> "MarketTradeStatistics":
+        """Create the statistics of already existing trades."""
+        trade_stats = cls()
+        for trade in trades:
+            trade_stats.add_trade(trade)
+        return trade_stats
+
+    def add_trade(self, trade: Trade) -> None:
+        """Account a new trade."""
+        rate = trade.trade_rate
+        self.trade_count += 1
+        if self.min_trade_rate is None or rate < self.min_trade_rate:
+            self.min_trade_rate = rate
+        if self.max_trade_rate is None or rate > self.max_trade_rate:
+            self.max_trade_rate = rate
+        self.total_trade_rate += rate
+        self.total_traded_energy_kWh += trade.traded_energy
+        self._median_trade_rate.add(rate)
+        seller_buyer = (
+            area_name_from_area_or_ma_name(trade.seller.name),
+            area_name_from_area_or_ma_name(trade.buyer.name),
+        )
+        self.traded_energy_per_seller_buyer[seller_buyer] = (
+            self.traded_energy_per_seller_buyer.get(seller_buyer, 0.0) + trade.traded_energy
+        )
+
+    @property
+    def avg_trade_rate(self) -> Optional[float]:
+        """Return the mean trade rate."""
+        return self.total_trade_rate / self.trade_count if self.trade_count else None
+
+    @property
+    def median_trade_rate(self) -> Optional[float]:
+        """Return the median trade rate."""
+        return self._median_trade_rate.median
+
+    def traded_energy_between(self, seller_names: Set[str], buyer_names: Set[str]) -> float:
+        """Return the energy sold by any of seller_names to any of buyer_names."""
+        return sum(
+            energy
+            for (seller, buyer), energy in self.traded_energy_per_seller_buyer.items()
+            if seller in seller_names and buyer in buyer_names
+        )
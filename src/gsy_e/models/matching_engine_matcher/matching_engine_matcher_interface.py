@@ -18,6 +18,8 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from abc import ABC, abstractmethod
 from typing import Dict, List, Callable
 
+from gsy_e.gsy_e_core.tick_profiler import tick_profiler
+
 
 class MatchingEngineMatcherInterface(ABC):
     """Interface for matching engine matchers' public methods."""
@@ -53,19 +55,20 @@ class MatchingEngineMatcherInterface(ABC):
                 continue
             if market.no_new_order:
                 continue
-            while True:
-                # Perform matching until all recommendations and their residuals are handled.
-                orders = market.orders_per_slot()
+            with tick_profiler.measure_market(market):
+                while True:
+                    # Perform matching until all recommendations and their residuals are handled.
+                    orders = market.orders_per_slot()
 
-                # Format should be: {area_uuid: {time_slot: {"bids": [], "offers": [], ...}}}
-                data = {
-                    area_uuid: {
-                        time_slot: {**orders_data, "current_time": area_data["current_time"]}
-                        for time_slot, orders_data in orders.items()}}
-                bid_offer_pairs = get_matches_recommendations(data)
-                if not bid_offer_pairs:
-                    break
-                trades_occurred = market.match_recommendations(bid_offer_pairs)
-                if not trades_occurred:
-                    break
+                    # Format should be: {area_uuid: {time_slot: {"bids": [], "offers": [], ...}}}
+                    data = {
+                        area_uuid: {
+                            time_slot: {**orders_data, "current_time": area_data["current_time"]}
+                            for time_slot, orders_data in orders.items()}}
+                    bid_offer_pairs = get_matches_recommendations(data)
+                    if not bid_offer_pairs:
+                        break
+                    trades_occurred = market.match_recommendations(bid_offer_pairs)
+                    if not trades_occurred:
+                        break
             market.no_new_order = True
@@ -0,0 +1,63 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from functools import cache
+from typing import Iterable, Tuple
+
+import numpy as np
+from pendulum import DateTime, Duration
+
+MINUTES_PER_DAY = 24 * 60
+
+# The sun rises at approx 6:30 and sets at 18hr, the gaussian fit only covers 8:00 - 16:30
+GAUSSIAN_PV_START_MINUTE = 8 * 60
+GAUSSIAN_PV_END_MINUTE = 16.5 * 60
+
+
+def minutes_of_day(time_slots: Iterable[DateTime]) -> np.ndarray:
+    """Return the minutes passed since (UTC) midnight for each of the time slots."""
+    timestamps = np.fromiter((time_slot.int_timestamp for time_slot in time_slots), np.int64)
+    return (timestamps // 60) % MINUTES_PER_DAY
+
+
+@cache
+def gaussian_pv_daily_profile_kWh(slot_length: Duration) -> np.ndarray:
+    """Return the energy produced by 1 kW of PV capacity in a slot starting at each minute of
+    the day, following the gaussian fit of the enphase PV data.
+
+    The profile is computed once per slot length and shared by all PV devices, that only need
+    to scale it with their capacity. The returned array is read-only.
+    """
+    time_in_minutes = np.arange(MINUTES_PER_DAY)
+    # time/5 is needed because we only have one data set per 5 minutes
+    power_kW = np.exp(-(((np.round(time_in_minutes / 5) - 147.2) / 38.60) ** 2))
+    power_kW[
+        (time_in_minutes < GAUSSIAN_PV_START_MINUTE) | (time_in_minutes > GAUSSIAN_PV_END_MINUTE)
+    ] = 0.0
+    profile = power_kW * (slot_length.total_seconds() / 3600)
+    profile.flags.writeable = False
+    return profile
+
+
+@cache
+def operating_hours_profile(hrs_of_day: Tuple[int, ...]) -> np.ndarray:
+    """Return a read-only mask of the 24 hours of the day, True for the operating hours."""
+    profile = np.zeros(24, dtype=bool)
+    profile[list(hrs_of_day)] = True
+    profile.flags.writeable = False
+    return profile
@@ -183,18 +183,22 @@ class _DayForwardEnergyParams(_BaseMarketEnergyParams):
     def event_load_traded_energy(
         self, energy_kWh: float, market_slot: pendulum.DateTime, state: "LoadState"
     ):
-        for slot in self._day_forward_slots(market_slot):
-            state.decrement_energy_requirement(
-                purchased_energy_Wh=energy_kWh * 1000, time_slot=slot, area_name=self._area.name
-            )
+        state.decrement_energy_requirement_profile(
+            purchased_energy_profile_Wh=dict.fromkeys(
+                self._day_forward_slots(market_slot), energy_kWh * 1000
+            ),
+            area_name=self._area.name,
+        )
 
     def event_pv_traded_energy(
         self, energy_kWh: float, market_slot: pendulum.DateTime, state: "PVState"
     ):
-        for slot in self._day_forward_slots(market_slot):
-            state.decrement_available_energy(
-                sold_energy_kWh=energy_kWh, time_slot=slot, area_name=self._area.name
-            )
+        state.decrement_available_energy_profile(
+            sold_energy_profile_kWh=dict.fromkeys(
+                self._day_forward_slots(market_slot), energy_kWh
+            ),
+            area_name=self._area.name,
+        )
 
 
 class _LongForwardEnergyParameters(_BaseMarketEnergyParams):
@@ -267,12 +271,13 @@ class _LongForwardEnergyParameters(_BaseMarketEnergyParams):
             energy_kWh=energy_kWh, market_slot=market_slot, product_type=self._product_type
         )
 
-        for time_slot, energy_value_kWh in trade_profile.items():
-            state.decrement_energy_requirement(
-                purchased_energy_Wh=energy_value_kWh * 1000,
-                time_slot=time_slot,
-                area_name=self._area.name,
-            )
+        state.decrement_energy_requirement_profile(
+            purchased_energy_profile_Wh={
+                time_slot: energy_value_kWh * 1000
+                for time_slot, energy_value_kWh in trade_profile.items()
+            },
+            area_name=self._area.name,
+        )
 
     def event_pv_traded_energy(
         self, energy_kWh: float, market_slot: pendulum.DateTime, state: "PVState"
@@ -283,10 +288,9 @@ class _LongForwardEnergyParameters(_BaseMarketEnergyParams):
             energy_kWh=energy_kWh, market_slot=market_slot, product_type=self._product_type
         )
 
-        for time_slot, energy_value_kWh in trade_profile.items():
-            state.decrement_available_energy(
-                sold_energy_kWh=energy_value_kWh, time_slot=time_slot, area_name=self._area.name
-            )
+        state.decrement_available_energy_profile(
+            sold_energy_profile_kWh=trade_profile, area_name=self._area.name
+        )
 
 
 class ForwardEnergyParams(ABC):
@@ -5,7 +5,6 @@ from enum import Enum
 from logging import getLogger
 from typing import Optional
 
-import sympy as sp
 from gsy_framework.constants_limits import FLOATING_POINT_TOLERANCE
 from gsy_framework.enums import HeatPumpSourceType
 
@@ -159,6 +158,9 @@ class IndividualCOPModel(BaseCOPModel):
     def _resolve_heat(
         self, source_temp_C: float, condenser_temp_C: float, electricity_demand_kW: float
     ):
+        # sympy is imported on first use, as it is slow to import and only needed by heat pumps
+        import sympy as sp  # pylint: disable=import-outside-toplevel
+
         CAPFT = self._capft(source_temp_C, condenser_temp_C)
         Q = sp.symbols("Q")
         PLR = Q / (self._model["Qref"] * CAPFT)
@@ -184,6 +186,8 @@ class IndividualCOPModel(BaseCOPModel):
         - the correct branch is the one with the LARGER PLR
           (as indicated by the training dataset)
         """
+        import sympy as sp  # pylint: disable=import-outside-toplevel
+
         PLR_dict = {
             q / (self._model["Qref"] * CAPFT): q
             for q in Q_solutions
@@ -0,0 +1,352 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+# pylint: disable=protected-access
+import logging
+from typing import Dict, Iterable, List
+
+import numpy as np
+from gsy_framework.constants_limits import FLOATING_POINT_TOLERANCE, GlobalConfig
+from gsy_framework.utils import convert_kJ_to_kWh, convert_kWh_to_kW
+from pendulum import DateTime
+
+import gsy_e.constants
+from gsy_e.models.strategy.energy_parameters.heatpump.cop_models import UniversalCOPModel
+from gsy_e.models.strategy.energy_parameters.heatpump.heat_pump import (
+    HeatPumpEnergyParameters,
+    calc_heat_pump_energy_kWh,
+    calc_heat_pump_heat_energy_kJ,
+)
+from gsy_e.models.strategy.state.heatpump_tank_states.water_tank_state import (
+    WaterTankState,
+    calc_water_tank_heat_energy_kJ,
+    calc_water_tank_max_temp_diff_C,
+    calc_water_tank_soc,
+    calc_water_tank_temp_below_min_C,
+    calc_water_tank_temp_diff_C,
+)
+
+log = logging.getLogger(__name__)
+
+# Same tolerance as the one of CombinedHeatpumpTanksState.update_tanks_temperature
+NET_HEAT_TOLERANCE_kJ = 1e-4
+
+
+def _to_array(values: Iterable[float], count: int) -> np.ndarray:
+    return np.fromiter(values, dtype=float, count=count)
+
+
+class HeatPumpFleet:
+    """
+    Step the energy parameters of all heat pumps of an area in one vectorized pass.
+
+    On every market cycle the fleet computes, for all its heat pumps at once, the tank
+    temperatures that result from the energy traded in the last market slot, the COP and the
+    energy bounds (min / demand / max) of the new market slot, and writes them to the state of
+    each heat pump. Reading the profiles stays per heat pump.
+    Only heat pumps with a single water tank and the universal COP model can join the fleet, the
+    other heat pumps keep stepping their energy parameters on their own.
+    The formulas are the calc_heat_pump_* and calc_water_tank_* functions that the energy
+    parameters use as well, only the branches of the energy parameters are expressed as masks.
+    """
+
+    def __init__(self):
+        self._members: Dict[int, HeatPumpEnergyParameters] = {}
+        self._stepped_time_slots: Dict[int, DateTime] = {}
+
+    def __len__(self):
+        return len(self._members)
+
+    @staticmethod
+    def is_supported(energy_params) -> bool:
+        """Return whether the energy parameters can be stepped by the fleet."""
+        if not isinstance(energy_params, HeatPumpEnergyParameters):
+            return False
+        tanks = energy_params.combined_state.tanks._tanks_states
+        return (
+            len(tanks) == 1
+            and isinstance(tanks[0], WaterTankState)
+            and isinstance(energy_params.combined_state._cop_model, UniversalCOPModel)
+        )
+
+    def add(self, energy_params: HeatPumpEnergyParameters) -> None:
+        """Add the energy parameters of a heat pump to the fleet."""
+        assert self.is_supported(energy_params), "Heat pump is not supported by the fleet."
+        self._members[id(energy_params)] = energy_params
+
+    def remove(self, energy_params: HeatPumpEnergyParameters) -> None:
+        """Remove the energy parameters of a heat pump from the fleet."""
+        self._members.pop(id(energy_params), None)
+        self._stepped_time_slots.pop(id(energy_params), None)
+
+    def event_market_cycle(self, time_slot: DateTime) -> None:
+        """Step all heat pumps of the fleet that have not been stepped for the time slot yet.
+
+        The first heat pump that receives the market cycle steps the whole fleet, the following
+        heat pumps of the same market slot find their state already populated.
+        """
+        members = [
+            energy_params
+            for member_id, energy_params in self._members.items()
+            if self._stepped_time_slots.get(member_id) != time_slot
+        ]
+        if not members:
+            return
+        for energy_params in members:
+            self._stepped_time_slots[id(energy_params)] = time_slot
+            # Order matters here, same as in HeatPumpEnergyParametersBase.event_market_cycle
+            energy_params._state.event_market_cycle(time_slot)
+            energy_params._rotate_profiles(time_slot)
+
+        self._update_last_time_slot_data(members, time_slot)
+        self._populate_state(members, time_slot)
+
+    @staticmethod
+    def _get_tank(energy_params: HeatPumpEnergyParameters) -> WaterTankState:
+        return energy_params.combined_state.tanks._tanks_states[0]
+
+    @staticmethod
+    def _calc_cops(
+        members: List[HeatPumpEnergyParameters],
+        source_temps_C: np.ndarray,
+        condenser_temps_C: np.ndarray,
+    ) -> np.ndarray:
+        """Calculate the COPs of all heat pumps, once per group of heat pumps of a source type."""
+        cops = np.empty(len(members))
+        source_types = np.fromiter(
+            (energy_params._source_type for energy_params in members), dtype=int
+        )
+        for source_type in np.unique(source_types):
+            mask = source_types == source_type
+            cop_model = members[np.flatnonzero(mask)[0]].combined_state._cop_model
+            cops[mask] = cop_model.calc_cop(source_temps_C[mask], condenser_temps_C[mask])
+        return cops
+
+    def _get_tank_parameters(self, members: List[HeatPumpEnergyParameters]):
+        """Return the min temperature, max temperature and the specific heat of all tanks."""
+        count = len(members)
+        tanks = [self._get_tank(energy_params) for energy_params in members]
+        return (
+            tanks,
+            _to_array((tank._params.min_temp_C for tank in tanks), count),
+            _to_array((tank._params.max_temp_C for tank in tanks), count),
+            _to_array((tank._Q_specific for tank in tanks), count),
+        )
+
+    def _update_last_time_slot_data(
+        self, members: List[HeatPumpEnergyParameters], time_slot: DateTime
+    ) -> None:
+        """Update the tank temperatures and the COPs with the energy bought in the last slot."""
+        # pylint: disable=too-many-locals
+        last_time_slot = time_slot - GlobalConfig.slot_length
+        members = [
+            energy_params
+            for energy_params in members
+            if last_time_slot in energy_params._source_temp_C.profile
+        ]
+        if not members:
+            return
+        count = len(members)
+        tanks, min_temps_C, max_temps_C, q_specific = self._get_tank_parameters(members)
+        source_temps_C = _to_array(
+            (energy_params._source_temp_C.get_value(last_time_slot) for energy_params in members),
+            count,
+        )
+        storage_temps_C = _to_array(
+            (tank.get_storage_temp_C(last_time_slot) for tank in tanks), count
+        )
+        socs = _to_array((tank._soc[last_time_slot] for tank in tanks), count)
+        bought_energy_kWh = _to_array(
+            (energy_params._bought_energy_kWh for energy_params in members), count
+        )
+        heat_demands_kJ = _to_array(
+            (
+                energy_params._state.heatpump.get_heat_demand_kJ(last_time_slot)
+                for energy_params in members
+            ),
+            count,
+        )
+
+        # The universal COP model does not depend on the heat demand, therefore the COP of the
+        # traded energy is also the COP of the last slot after (dis)charging.
+        cops = self._calc_cops(members, source_temps_C, storage_temps_C)
+        traded_heat_energy_kJ = calc_heat_pump_heat_energy_kJ(
+            convert_kWh_to_kW(bought_energy_kWh, GlobalConfig.slot_length) * cops
+        )
+        net_energy_kJ = traded_heat_energy_kJ - heat_demands_kJ
+
+        max_capacity_kJ = calc_water_tank_heat_energy_kJ(max_temps_C - min_temps_C, q_specific)
+        heat_energy_kWh = convert_kJ_to_kWh(np.abs(net_energy_kJ))
+        charging = (
+            (net_energy_kJ > NET_HEAT_TOLERANCE_kJ)
+            & ((1 - socs) * max_capacity_kJ != 0)
+            & (heat_energy_kWh >= FLOATING_POINT_TOLERANCE)
+        )
+        discharging = (
+            (net_energy_kJ < -NET_HEAT_TOLERANCE_kJ)
+            & (socs * max_capacity_kJ != 0)
+            & (heat_energy_kWh >= FLOATING_POINT_TOLERANCE)
+        )
+        temp_diff_C = calc_water_tank_temp_diff_C(heat_energy_kWh, q_specific)
+        new_storage_temps_C = (
+            storage_temps_C
+            + np.where(charging, temp_diff_C, 0.0)
+            - np.where(discharging, temp_diff_C, 0.0)
+        )
+        exceeds_limits = (
+            charging & (new_storage_temps_C - max_temps_C > FLOATING_POINT_TOLERANCE)
+        ) | (discharging & (min_temps_C - new_storage_temps_C > FLOATING_POINT_TOLERANCE))
+        for storage_temp_C, limit_temp_C in zip(
+            new_storage_temps_C[exceeds_limits].tolist(),
+            np.where(charging, max_temps_C, min_temps_C)[exceeds_limits].tolist(),
+        ):
+            log.warning(
+                "Storage tank temperature exceeded its limits, setting to the limit. (%s -> %s)",
+                storage_temp_C,
+                limit_temp_C,
+            )
+        new_storage_temps_C = np.where(
+            charging, np.minimum(new_storage_temps_C, max_temps_C), new_storage_temps_C
+        )
+        new_storage_temps_C = np.where(
+            discharging, np.maximum(new_storage_temps_C, min_temps_C), new_storage_temps_C
+        )
+        new_socs = calc_water_tank_soc(new_storage_temps_C, min_temps_C, max_temps_C)
+
+        for energy_params, tank, storage_temp_C, soc, net_heat_kJ, cop in zip(
+            members,
+            tanks,
+            new_storage_temps_C.tolist(),
+            new_socs.tolist(),
+            net_energy_kJ.tolist(),
+            cops.tolist(),
+        ):
+            tank._storage_temp_C[time_slot] = storage_temp_C
+            tank._soc[time_slot] = soc
+            hp_state = energy_params._state.heatpump
+            hp_state.set_net_heat_consumed_kJ(last_time_slot, net_heat_kJ)
+            hp_state.set_cop(last_time_slot, cop)
+            hp_state.set_cop(time_slot, cop)
+            energy_params._bought_energy_kWh = 0.0
+
+    def _populate_state(self, members: List[HeatPumpEnergyParameters], time_slot: DateTime):
+        """Calculate the heat demand and the energy bounds of the new slot."""
+        # pylint: disable=too-many-locals
+        count = len(members)
+        tanks, min_temps_C, max_temps_C, q_specific = self._get_tank_parameters(members)
+        source_temps_C = _to_array(
+            (energy_params._source_temp_C.get_value(time_slot) for energy_params in members),
+            count,
+        )
+        storage_temps_C = _to_array((tank.get_storage_temp_C(time_slot) for tank in tanks), count)
+        socs = _to_array((tank._soc[time_slot] for tank in tanks), count)
+        consumptions_kWh = _to_array(
+            (energy_params._consumption_kWh.get_value(time_slot) for energy_params in members),
+            count,
+        )
+        has_heat_demand_profile = np.fromiter(
+            (bool(energy_params._heat_demand_Q_J) for energy_params in members),
+            dtype=bool,
+            count=count,
+        )
+        heat_demand_profile_kJ = _to_array(
+            (
+                (
+                    energy_params._heat_demand_Q_J.get_value(time_slot) / 1000.0
+                    if energy_params._heat_demand_Q_J
+                    else 0.0
+                )
+                for energy_params in members
+            ),
+            count,
+        )
+        max_energy_consumption_kWh = _to_array(
+            (energy_params._max_energy_consumption_kWh for energy_params in members), count
+        )
+
+        cops = self._calc_cops(members, source_temps_C, storage_temps_C)
+        heat_demands_kJ = np.where(
+            has_heat_demand_profile,
+            heat_demand_profile_kJ,
+            calc_heat_pump_heat_energy_kJ(
+                convert_kWh_to_kW(consumptions_kWh, GlobalConfig.slot_length) * cops
+            ),
+        )
+
+        max_capacity_kJ = calc_water_tank_heat_energy_kJ(max_temps_C - min_temps_C, q_specific)
+        temp_below_min_C = calc_water_tank_temp_below_min_C(
+            storage_temps_C, min_temps_C, heat_demands_kJ, q_specific
+        )
+        min_heat_energy_kJ = np.where(
+            socs * max_capacity_kJ == 0,
+            heat_demands_kJ,
+            calc_water_tank_heat_energy_kJ(np.maximum(temp_below_min_C, 0.0), q_specific),
+        )
+        can_charge = (1 - socs) * max_capacity_kJ != 0
+        max_temp_diff_C = calc_water_tank_max_temp_diff_C(
+            storage_temps_C, max_temps_C, heat_demands_kJ, q_specific
+        )
+        assert (max_temp_diff_C[can_charge] >= 0).all(), "max_temp_diff lower than 0"
+        max_heat_energy_kJ = np.where(
+            can_charge,
+            calc_water_tank_heat_energy_kJ(max_temp_diff_C, q_specific),
+            heat_demands_kJ,
+        )
+
+        valid_cops = np.where(cops == 0, 1.0, cops)
+        min_energy_demands_kWh = np.where(
+            cops == 0,
+            0.0,
+            np.minimum(
+                calc_heat_pump_energy_kWh(min_heat_energy_kJ, valid_cops),
+                max_energy_consumption_kWh,
+            ),
+        )
+        energy_demands_kWh = np.where(
+            cops == 0,
+            0.0,
+            np.minimum(
+                calc_heat_pump_energy_kWh(heat_demands_kJ, valid_cops), max_energy_consumption_kWh
+            ),
+        )
+        max_energy_demands_kWh = np.where(
+            cops == 0,
+            0.0,
+            np.minimum(
+                calc_heat_pump_energy_kWh(
+                    max_heat_energy_kJ, np.maximum(valid_cops, gsy_e.constants.HP_MIN_COP)
+                ),
+                max_energy_consumption_kWh,
+            ),
+        )
+        assert (max_energy_demands_kWh > -FLOATING_POINT_TOLERANCE).all()
+
+        for energy_params, heat_demand_kJ, min_kWh, demand_kWh, max_kWh, consumption_kWh in zip(
+            members,
+            heat_demands_kJ.tolist(),
+            min_energy_demands_kWh.tolist(),
+            energy_demands_kWh.tolist(),
+            max_energy_demands_kWh.tolist(),
+            consumptions_kWh.tolist(),
+        ):
+            hp_state = energy_params._state.heatpump
+            hp_state.set_heat_demand_kJ(time_slot, heat_demand_kJ)
+            hp_state.set_min_energy_demand_kWh(time_slot, min_kWh)
+            hp_state.set_energy_demand_kWh(time_slot, demand_kWh)
+            hp_state.set_max_energy_demand_kWh(time_slot, max_kWh)
+            hp_state.set_energy_consumption_kWh(time_slot, consumption_kWh)
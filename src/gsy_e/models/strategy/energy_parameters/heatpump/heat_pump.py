@@ -32,6 +32,18 @@ from gsy_e.models.strategy.strategy_profile import profile_factory, StrategyProf
 HEAT_EXCHANGER_EFFICIENCY = 1.0
 
 
+# The calc_heat_pump_* functions only use arithmetic operators, so that they accept floats as well
+# as NumPy arrays. The heat pump fleet steps many heat pumps at once with the same formulas.
+def calc_heat_pump_energy_kWh(heat_energy_kJ, cop):
+    """Return the electrical energy that the heat pump needs in order to produce the heat."""
+    return convert_kJ_to_kWh(heat_energy_kJ / cop)
+
+
+def calc_heat_pump_heat_energy_kJ(heat_energy_kW):
+    """Return the heat energy that the heat pump produces with the heat power during a slot."""
+    return convert_kWh_to_kJ(convert_kW_to_kWh(heat_energy_kW, GlobalConfig.slot_length))
+
+
 class HeatPumpEnergyParametersException(Exception):
     """Exception raised in the HeatPumpEnergyParameters"""
 
@@ -193,7 +205,7 @@ class CombinedHeatpumpTanksState:
         # limit the cop value to HP_MIN_COP
         cop = max(cop, gsy_e.constants.HP_MIN_COP)
 
-        max_energy_consumption_kWh = convert_kJ_to_kWh(max_heat_demand_kJ / cop)
+        max_energy_consumption_kWh = calc_heat_pump_energy_kWh(max_heat_demand_kJ, cop)
         assert max_energy_consumption_kWh > -FLOATING_POINT_TOLERANCE
         if max_energy_consumption_kWh > self._max_energy_consumption_kWh:
             return self._max_energy_consumption_kWh
@@ -209,7 +221,7 @@ class CombinedHeatpumpTanksState:
         )
         if cop == 0:
             return 0
-        min_energy_consumption_kWh = convert_kJ_to_kWh(min_heat_demand_kJ / cop)
+        min_energy_consumption_kWh = calc_heat_pump_energy_kWh(min_heat_demand_kJ, cop)
         if min_energy_consumption_kWh > self._max_energy_consumption_kWh:
             return self._max_energy_consumption_kWh
         return min_energy_consumption_kWh
@@ -222,7 +234,7 @@ class CombinedHeatpumpTanksState:
         )
         if cop == 0:
             return 0
-        energy_consumption_kWh = convert_kJ_to_kWh(heat_demand_kJ / cop)
+        energy_consumption_kWh = calc_heat_pump_energy_kWh(heat_demand_kJ, cop)
         if energy_consumption_kWh > self._max_energy_consumption_kWh:
             return self._max_energy_consumption_kWh
         return energy_consumption_kWh
@@ -327,7 +339,7 @@ class CombinedHeatpumpTanksState:
         )
         if heat_energy_kW is None:
             heat_energy_kW = energy_kWh * self._hp_state.get_cop(self._last_time_slot(time_slot))
-        return convert_kWh_to_kJ(convert_kW_to_kWh(heat_energy_kW, GlobalConfig.slot_length))
+        return calc_heat_pump_heat_energy_kJ(heat_energy_kW)
 
     def event_activate(self):
         """Runs on activate event."""
@@ -741,14 +753,14 @@ class HeatPumpEnergyParametersWithoutTanks:
             heat_energy_kW = convert_kWh_to_kW(
                 energy_kWh, GlobalConfig.slot_length
             ) * self.state.get_cop(self.last_time_slot(time_slot))
-        return convert_kWh_to_kJ(convert_kW_to_kWh(heat_energy_kW, GlobalConfig.slot_length))
+        return calc_heat_pump_heat_energy_kJ(heat_energy_kW)
 
     def _calc_energy_kWh_from_Q_kJ(self, time_slot: DateTime, Q_energy_kJ: float) -> float:
         """Calculate energy in kWh from heat in kJ."""
         cop = self.state.get_cop(time_slot)
         if cop == 0:
             return 0
-        return convert_kJ_to_kWh(Q_energy_kJ / cop)
+        return calc_heat_pump_energy_kWh(Q_energy_kJ, cop)
 
     def _update_last_time_slot_data(self, time_slot: DateTime):
         last_time_slot = self.last_time_slot(time_slot)
@@ -2,7 +2,6 @@ import logging
 from dataclasses import dataclass
 from typing import Optional, List
 
-import sympy as sp
 from gsy_framework.constants_limits import ConstSettings, GlobalConfig
 from gsy_framework.utils import convert_W_to_kWh, convert_kWh_to_W
 
@@ -150,6 +149,9 @@ class VirtualHeatpumpStorageEnergySolver:
 
     def calculate_storage_temp_from_energy(self):
         """Calculate target storage temp based on energy and other parameters."""
+        # sympy is imported on first use, as it is slow to import and only needed by heat pumps
+        import sympy as sp  # pylint: disable=import-outside-toplevel
+
         assert self.energy_kWh is not None
         self._calculate_q_out()
         self.p_el_W = convert_kWh_to_W(self.energy_kWh, GlobalConfig.slot_length)
@@ -19,6 +19,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import logging
 from typing import List, Optional
 
+import numpy as np
 from gsy_framework.exceptions import GSyException
 from gsy_framework.utils import convert_W_to_Wh
 from gsy_framework.validators.load_validator import LoadValidator
@@ -27,6 +28,7 @@ from pendulum import DateTime
 
 import gsy_e.constants
 from gsy_e.models.strategy import utils
+from gsy_e.models.strategy.energy_parameters.daily_profiles import operating_hours_profile
 from gsy_e.models.strategy.strategy_profile import profile_factory
 from gsy_e.models.strategy.state import LoadState
 
@@ -48,6 +50,7 @@ class LoadHoursEnergyParameters:
 
         # List of active hours of day (values range from 0 to 23)
         self.hrs_of_day: Optional[List[int]] = None
+        self._operating_hours_profile = None
         self._area = None
         self._simulation_start_timestamp = None
         self._assign_hours_of_day(hrs_of_day)
@@ -77,18 +80,29 @@ class LoadHoursEnergyParameters:
 
     def update_energy_requirement(self, time_slot):
         """Update the energy requirement and desired energy from the state class."""
+        self.update_energy_requirements([time_slot])
+
+    def update_energy_requirements(self, time_slots: List[DateTime]) -> None:
+        """Update the energy requirement and desired energy of all time slots at once.
+
+        The operating hours mask is shared by all loads with the same hours of day, only the
+        average power of the load is applied here.
+        """
         self.energy_per_slot_Wh = convert_W_to_Wh(
             self.avg_power_W, self._area.config.slot_length
         )
-        if self.allowed_operating_hours(time_slot):
-            desired_energy_Wh = self.energy_per_slot_Wh
-        else:
-            desired_energy_Wh = 0.0
-        self.state.set_desired_energy(desired_energy_Wh, time_slot)
+        if not time_slots:
+            return
+        hours = np.fromiter((time_slot.hour for time_slot in time_slots), np.int64)
+        desired_energy_Wh = np.where(
+            self._operating_hours_profile[hours], self.energy_per_slot_Wh, 0.0
+        )
+        for time_slot, energy_Wh in zip(time_slots, desired_energy_Wh.tolist()):
+            self.state.set_desired_energy(energy_Wh, time_slot)
 
     def allowed_operating_hours(self, time_slot):
         """Check if timeslot inside allowed operating hours."""
-        return time_slot.hour in self.hrs_of_day
+        return bool(self._operating_hours_profile[time_slot.hour])
 
     def event_activate_energy(self, area):
         """Update energy requirement upon the activation event."""
@@ -118,6 +132,7 @@ class LoadHoursEnergyParameters:
             raise ValueError(
                 "Hrs_of_day list should contain integers between 0 and 23."
             )
+        self._operating_hours_profile = operating_hours_profile(tuple(hrs_of_day))
 
 
 class DefinedLoadEnergyParameters(LoadHoursEnergyParameters):
@@ -157,6 +172,10 @@ class DefinedLoadEnergyParameters(LoadHoursEnergyParameters):
             self.energy_profile.input_profile = kwargs["daily_load_profile"]
             self.energy_profile.read_or_rotate_profiles(reconfigure=True)
 
+    def update_energy_requirements(self, time_slots: List[DateTime]) -> None:
+        for time_slot in time_slots:
+            self.update_energy_requirement(time_slot)
+
     def update_energy_requirement(self, time_slot):
         if not self.energy_profile.profile:
             if GlobalConfig.is_canary_network():
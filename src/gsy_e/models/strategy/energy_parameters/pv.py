@@ -17,10 +17,10 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import logging
-import math
 import pathlib
+from typing import List
 
-import pendulum
+import numpy as np
 from gsy_framework.read_user_profile import InputProfileTypes, UserProfileReader
 from gsy_framework.utils import convert_kW_to_kWh, key_in_dict_and_not_none
 from gsy_framework.validators import PVValidator
@@ -31,6 +31,10 @@ import gsy_e.constants
 from gsy_e.gsy_e_core.exceptions import GSyException
 from gsy_e.gsy_e_core.util import gsye_root_path
 from gsy_e.models.strategy import utils
+from gsy_e.models.strategy.energy_parameters.daily_profiles import (
+    gaussian_pv_daily_profile_kWh,
+    minutes_of_day,
+)
 from gsy_e.models.strategy.strategy_profile import profile_factory
 from gsy_e.models.strategy.state import PVState
 
@@ -58,14 +62,25 @@ class PVEnergyParameters:
 
     def set_produced_energy_forecast(self, time_slot, slot_length, reconfigure=True):
         """Generate the energy forecast value for the specified timeslot."""
-        difference_to_midnight_in_minutes = time_slot.diff(
-            pendulum.datetime(time_slot.year, time_slot.month, time_slot.day)
-        ).in_minutes() % (60 * 24)
+        self.set_produced_energy_forecasts([time_slot], slot_length, reconfigure)
+
+    def set_produced_energy_forecasts(
+        self, time_slots: List[DateTime], slot_length, reconfigure=True
+    ) -> None:
+        """Generate the energy forecast values for all specified timeslots at once.
+
+        The normalized daily profile is shared by all PV devices with the same slot length, only
+        the capacity and the panel count of the device are applied here.
+        """
+        if not time_slots:
+            return
+        daily_profile_kWh = gaussian_pv_daily_profile_kWh(slot_length)
         available_energy_kWh = (
-            self._gaussian_energy_forecast_kWh(slot_length, difference_to_midnight_in_minutes)
+            np.round(self.capacity_kW * daily_profile_kWh[minutes_of_day(time_slots)], 4)
             * self.panel_count
         )
-        self._state.set_available_energy(available_energy_kWh, time_slot, reconfigure)
+        for time_slot, energy_kWh in zip(time_slots, available_energy_kWh.tolist()):
+            self._state.set_available_energy(energy_kWh, time_slot, reconfigure)
 
     def reset(self, **kwargs):
         """Reset / update energy parameters."""
@@ -74,24 +89,6 @@ class PVEnergyParameters:
         if key_in_dict_and_not_none(kwargs, "capacity_kW"):
             self.capacity_kW = kwargs["capacity_kW"]
 
-    def _gaussian_energy_forecast_kWh(self, slot_length, time_in_minutes=0):
-        # The sun rises at approx 6:30 and sets at 18hr
-        # time_in_minutes is the difference in time to midnight
-
-        # Clamp to day range
-        time_in_minutes %= 60 * 24
-
-        if (8 * 60) > time_in_minutes or time_in_minutes > (16.5 * 60):
-            gauss_forecast = 0
-
-        else:
-            gauss_forecast = self.capacity_kW * math.exp(
-                # time/5 is needed because we only have one data set per 5 minutes
-                (-((((round(time_in_minutes / 5, 0)) - 147.2) / 38.60) ** 2))
-            )
-
-        return round(convert_kW_to_kWh(gauss_forecast, slot_length), 4)
-
     def set_energy_measurement_kWh(self, time_slot: DateTime) -> None:
         """Set the (simulated) actual energy produced by the device in a market slot."""
         energy_forecast_kWh = self._state.get_energy_production_forecast_kWh(time_slot)
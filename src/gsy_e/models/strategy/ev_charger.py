@@ -17,15 +17,20 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 from logging import getLogger
-from typing import Optional, Union, Dict
+from typing import Optional, Union, Dict, List
 
 from pendulum import DateTime
 from gsy_framework.validators import EVChargerValidator
 from gsy_framework.enums import GridIntegrationType, EVChargerStatus
 from gsy_framework.constants_limits import ConstSettings, GlobalConfig
 from gsy_framework.read_user_profile import UserProfileReader, InputProfileTypes
+from gsy_framework.utils import key_in_dict_and_not_none, str_to_pendulum_datetime
 
-from gsy_e.models.strategy.state.evcharger_state import EVChargerState, EVChargingSession
+from gsy_e.models.strategy.state.evcharger_state import (
+    EVChargerState,
+    EVChargingSession,
+    EVChargingSessionList,
+)
 from gsy_e.models.strategy.state.storage_state import StorageLosses
 from gsy_e.models.strategy.storage import StorageStrategy
 from gsy_e.constants import EV_CHARGER_DEFAULT_CHARGING_EFFICIENCY
@@ -80,7 +85,9 @@ class EVChargerStrategy(StorageStrategy):
         self.grid_integration = grid_integration
         self.maximum_power_rating_kW = maximum_power_rating_kW
         self.preferred_charging_power = preferred_charging_power
-        self.charging_sessions = sorted(charging_sessions, key=lambda s: s.plug_in_time)
+        self.charging_sessions = EVChargingSessionList(
+            sorted(charging_sessions, key=lambda s: s.plug_in_time)
+        )
         self.status = EVChargerStatus.IDLE
 
         # Convert preferred_charging_power to profile if provided
@@ -135,6 +142,34 @@ class EVChargerStrategy(StorageStrategy):
             return  # skip if no charging session is active
         super().event_tick()
 
+    def area_reconfigure_event(self, *args, **kwargs):
+        """Reconfigure the device properties at runtime using the provided arguments.
+        The charging_sessions argument replaces the scheduled charging sessions."""
+        if key_in_dict_and_not_none(kwargs, "charging_sessions"):
+            self._reconfigure_charging_sessions(kwargs["charging_sessions"])
+        super().area_reconfigure_event(*args, **kwargs)
+
+    def _reconfigure_charging_sessions(
+        self, charging_sessions: List[Union[EVChargingSession, Dict]]
+    ) -> None:
+        """Add the new sessions and remove the ones that are not scheduled anymore.
+        Sessions that are scheduled again keep their state of charge."""
+        scheduled_sessions = {
+            (session.plug_in_time, session.duration_minutes): session
+            for session in self._state.ev_sessions_manager.sessions
+        }
+        for session in charging_sessions:
+            if isinstance(session, dict):
+                session = EVChargingSession(**session)
+            if isinstance(session.plug_in_time, str):
+                session.plug_in_time = str_to_pendulum_datetime(session.plug_in_time)
+            key = (session.plug_in_time, session.duration_minutes)
+            if scheduled_sessions.pop(key, None) is not None:
+                continue
+            self._state.ev_sessions_manager.add_session(session)
+        for session in scheduled_sessions.values():
+            self._state.ev_sessions_manager.remove_session(session)
+
     def _sell_energy_to_spot_market(self):
         if self.grid_integration == GridIntegrationType.UNIDIRECTIONAL:
             return  # Do not sell in unidirectional chargers
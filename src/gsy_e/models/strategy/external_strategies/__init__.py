@@ -177,6 +177,7 @@ class ExternalMixin:
         super().__init__(*args, **kwargs)
         self.pending_requests: deque = deque()
         self.channel_names = None
+        self._trade_events_buffer: List[Dict] = []
 
     def event_activate(self, **kwargs):
         """Initiate channel names"""
@@ -522,6 +523,7 @@ class ExternalMixin:
         Dispatch the tick event to devices either directly connected or connected
         through an aggregator.
         """
+        self._publish_buffered_trade_events()
         if global_objects.external_global_stats.is_it_time_for_external_tick(
             self.device.current_tick
         ):
@@ -538,6 +540,7 @@ class ExternalMixin:
 
     def event_market_cycle(self) -> None:
         """Handler for the market cycle event."""
+        self._publish_buffered_trade_events()
         if self.should_use_default_strategy:
             super().event_market_cycle()
 
@@ -596,11 +599,10 @@ class ExternalMixin:
                 ),
             }
 
-            global_objects.external_global_stats.update()
+            global_objects.external_global_stats.mark_stale()
             self.redis.aggregator.add_batch_trade_event(self.device.uuid, event_response_dict)
         elif self.connected:
             event_response_dict = {
-                "device_info": self._device_info_dict,
                 "event": "trade",
                 "trade_id": trade.id,
                 "time": trade.creation_time.isoformat(),
@@ -623,7 +625,27 @@ class ExternalMixin:
                 trade.match_details["bid"].id if is_bid_trade else trade.match_details["offer"].id
             )
 
-            self.redis.publish_json(self.channel_names.trade, event_response_dict)
+            if gsy_e.constants.BATCH_EXTERNAL_TRADE_EVENTS:
+                self._trade_events_buffer.append(event_response_dict)
+            else:
+                event_response_dict["device_info"] = self._device_info_dict
+                self.redis.publish_json(self.channel_names.trade, event_response_dict)
+
+    def _publish_buffered_trade_events(self) -> None:
+        """Publish the buffered trade events of the directly connected asset as one message."""
+        if not self._trade_events_buffer:
+            return
+        trade_events = self._trade_events_buffer
+        self._trade_events_buffer = []
+        self.redis.publish_json(
+            self.channel_names.trade,
+            {
+                "event": "trade",
+                "area_uuid": self.device.uuid,
+                "device_info": self._device_info_dict,
+                "trade_list": trade_events,
+            },
+        )
 
     def event_bid_traded(self, market_id: str, bid_trade: Trade):
         """Handler for the event when a bid is accepted for trading."""
@@ -640,6 +662,7 @@ class ExternalMixin:
     def deactivate(self):
         """Deactivate the area and notify the client."""
         super().deactivate()
+        self._publish_buffered_trade_events()
 
         if self.is_aggregator_controlled:
             deactivate_msg = {"event": "finish"}
@@ -217,6 +217,7 @@ class PVExternalMixin(ExternalMixin):
 
     def event_market_cycle(self):
         self._reject_all_pending_requests()
+        self._publish_buffered_trade_events()
         self._update_connection_status()
         if not self.should_use_default_strategy:
             self.set_produced_energy_forecast_in_state(reconfigure=False)
@@ -81,6 +81,7 @@ class SmartMeterExternalMixin(ExternalMixin):
     def event_market_cycle(self) -> None:
         """Handler for the market cycle event."""
         self._reject_all_pending_requests()
+        self._publish_buffered_trade_events()
         self._update_connection_status()
         if not self.should_use_default_strategy:
             self._energy_params.set_energy_forecast_for_future_markets(
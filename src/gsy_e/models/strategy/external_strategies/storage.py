@@ -394,6 +394,7 @@ class StorageExternalMixin(ExternalMixin):
     def event_market_cycle(self) -> None:
         """Handler for the market cycle event."""
         self._reject_all_pending_requests()
+        self._publish_buffered_trade_events()
         self._update_connection_status()
         if not self.should_use_default_strategy:
             self.state.add_default_values_to_state_profiles([
@@ -1,8 +1,9 @@
-from typing import TYPE_CHECKING, Dict
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
 from gsy_framework.constants_limits import ConstSettings
 from gsy_framework.enums import AvailableMarketTypes
-from pendulum import duration
+from pendulum import DateTime, duration
 
 from gsy_e.models.strategy.forward.live_event_handler import ForwardLiveEvents
 from gsy_e.models.strategy.forward.order_updater import (
@@ -10,6 +11,7 @@ from gsy_e.models.strategy.forward.order_updater import (
 from gsy_e.models.strategy.trading_strategy_base import TradingStrategyBase
 
 if TYPE_CHECKING:
+    from gsy_e.models.market.forward import ForwardMarketBase, ForwardOrderParameters
     from gsy_e.models.strategy.state import StateInterface
 
 
@@ -48,6 +50,7 @@ class ForwardStrategyBase(TradingStrategyBase):
             if market not in self._order_updaters:
                 self._order_updaters[market] = {}
 
+            new_market_slots = []
             for market_slot in market.market_time_slots:
                 market_parameters = market.get_market_parameters_for_market_slot(market_slot)
                 if (market_parameters.closing_time <= market_parameters.opening_time or
@@ -58,7 +61,51 @@ class ForwardStrategyBase(TradingStrategyBase):
                         self._order_updater_params[market_type],
                         market_parameters
                     )
-                    self.post_order(market, market_slot)
+                    new_market_slots.append(market_slot)
+            self.post_orders(market, new_market_slots)
+
+    def post_order(
+            self, market: "ForwardMarketBase", market_slot: DateTime, order_rate: float = None,
+            **kwargs):
+        self.post_orders(market, [market_slot], order_rate, **kwargs)
+
+    def post_orders(
+            self, market: "ForwardMarketBase", market_slots: Iterable[DateTime],
+            order_rate: float = None, **kwargs):
+        """Post the orders of multiple market slots to the market in one bulk operation."""
+        orders = []
+        for market_slot in market_slots:
+            order = self._get_order_parameters(
+                market, market_slot, order_rate, kwargs.get("capacity_percent"))
+            if order is not None:
+                orders.append(order)
+        if not orders:
+            return
+        self._post_orders_to_market(market, orders)
+        for market_slot, _, order_energy_kWh in orders:
+            self._energy_params.increment_posted_energy(
+                market_slot, float(order_energy_kWh), market.market_type)
+
+    def remove_open_orders(self, market: "ForwardMarketBase", market_slot: DateTime):
+        self.remove_open_orders_on_slots(market, [market_slot])
+
+    @abstractmethod
+    def remove_open_orders_on_slots(
+            self, market: "ForwardMarketBase", market_slots: Iterable[DateTime]):
+        """Remove the open orders of the asset on multiple market slots in one bulk operation."""
+
+    @abstractmethod
+    def _get_order_parameters(
+            self, market: "ForwardMarketBase", market_slot: DateTime,
+            order_rate: Optional[float], capacity_percent: Optional[float]
+    ) -> Optional["ForwardOrderParameters"]:
+        """Return the (market_slot, energy_rate, energy_kWh) of the order, None if no energy
+        can be traded on the market slot."""
+
+    @abstractmethod
+    def _post_orders_to_market(
+            self, market: "ForwardMarketBase", orders: List["ForwardOrderParameters"]):
+        """Post the orders to the market as bids or offers of the asset."""
 
     @property
     def fully_automated_trading(self):
@@ -79,6 +79,9 @@ class ForwardLiveEvents:
         energy_rate = args["energy_rate"]
         market = self._strategy.area.forward_markets[market_type]
 
+        market_slots = []
+        # Market slots whose open orders are replaced by the orders of the new updaters
+        replaced_market_slots = []
         for slot in market.market_time_slots:
             if not start_time <= slot <= end_time:
                 continue
@@ -87,7 +90,7 @@ class ForwardLiveEvents:
                 self._strategy._order_updaters[market] = {}
             updater = self._strategy._order_updaters[market].get(slot)
             if updater:
-                market.remove_open_orders(slot)
+                replaced_market_slots.append(slot)
 
             market_parameters = market.get_market_parameters_for_market_slot(slot)
 
@@ -108,7 +111,10 @@ class ForwardLiveEvents:
             self._strategy._order_updaters[market][slot] = ForwardOrderUpdater(
                 order_updater_params, market_parameters
             )
-            self._strategy.post_order(market, slot)
+            market_slots.append(slot)
+        if replaced_market_slots:
+            self._strategy.remove_open_orders_on_slots(market, replaced_market_slots)
+        self._strategy.post_orders(market, market_slots)
 
     @ForwardValidator.stop_trading
     def _stop_auto_trading_event(self, args: Dict):
@@ -123,11 +129,12 @@ class ForwardLiveEvents:
         end_time = str_to_pendulum_datetime(args["end_time"])
         capacity_percent = args["capacity_percent"]
         energy_rate = args["energy_rate"]
-        for slot in market.market_time_slots:
-            if start_time <= slot <= end_time:
-                self._strategy.post_order(
-                    market, slot, energy_rate, capacity_percent=capacity_percent
-                )
+        self._strategy.post_orders(
+            market,
+            [slot for slot in market.market_time_slots if start_time <= slot <= end_time],
+            energy_rate,
+            capacity_percent=capacity_percent,
+        )
 
     @ForwardValidator.stop_trading
     def _remove_order_event(self, args: Dict):
@@ -135,10 +142,14 @@ class ForwardLiveEvents:
         market = self._strategy.area.forward_markets[AvailableMarketTypes(args["market_type"])]
         start_time = str_to_pendulum_datetime(args["start_time"])
         end_time = str_to_pendulum_datetime(args["end_time"])
-        for slot in market.market_time_slots:
-            if not start_time <= slot <= end_time:
-                continue
-            updater = self._strategy._order_updaters[market].get(slot)
-            if updater:
-                self._strategy.remove_open_orders(market, slot)
-                self._strategy._order_updaters[market].pop(slot)
+        order_updaters = self._strategy._order_updaters[market]
+        removed_market_slots = [
+            slot
+            for slot in market.market_time_slots
+            if start_time <= slot <= end_time and order_updaters.get(slot)
+        ]
+        if not removed_market_slots:
+            return
+        self._strategy.remove_open_orders_on_slots(market, removed_market_slots)
+        for slot in removed_market_slots:
+            order_updaters.pop(slot)
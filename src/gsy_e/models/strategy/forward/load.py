@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Dict, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
 
 from pendulum import DateTime, duration
 from gsy_framework.data_classes import TraderDetails
@@ -13,7 +13,7 @@ from gsy_e.models.strategy.forward import ForwardStrategyBase
 from gsy_e.models.strategy.forward.order_updater import ForwardOrderUpdaterParameters
 
 if TYPE_CHECKING:
-    from gsy_e.models.market.forward import ForwardMarketBase
+    from gsy_e.models.market.forward import ForwardMarketBase, ForwardOrderParameters
     from gsy_framework.data_classes import Trade
     from gsy_e.models.strategy.state import LoadState
 
@@ -57,12 +57,8 @@ class ForwardLoadStrategy(ForwardStrategyBase):
         self._energy_params.event_activate_energy(self.area)
 
     def remove_order(self, market: "ForwardMarketBase", market_slot: DateTime, order_uuid: str):
-        bids = [
-            bid
-            for bid in market.slot_bid_mapping[market_slot]
-            if bid.buyer.name == self.owner.name and bid.id == order_uuid
-        ]
-        if not bids:
+        bid = market.bids.get_trader_orders(market_slot, self.owner.uuid).get(order_uuid)
+        if bid is None:
             self.log.error(
                 "Bid with id %s does not exist on the market %s %s.",
                 order_uuid,
@@ -70,29 +66,24 @@ class ForwardLoadStrategy(ForwardStrategyBase):
                 market_slot,
             )
             return
-        market.delete_bid(bids[0])
+        market.delete_bid(bid)
 
-    def remove_open_orders(self, market: "ForwardMarketBase", market_slot: DateTime):
-        bids = [
-            bid
-            for bid in market.slot_bid_mapping[market_slot]
-            if bid.buyer.name == self.owner.name
-        ]
-        for bid in bids:
-            market.delete_bid(bid)
+    def remove_open_orders_on_slots(
+        self, market: "ForwardMarketBase", market_slots: Iterable[DateTime]
+    ):
+        market.bulk_delete_bids(self.owner.uuid, market_slots)
 
-    def post_order(
+    def _get_order_parameters(
         self,
         market: "ForwardMarketBase",
         market_slot: DateTime,
-        order_rate: float = None,
-        **kwargs
-    ):
+        order_rate: Optional[float],
+        capacity_percent: Optional[float],
+    ) -> Optional["ForwardOrderParameters"]:
         if not order_rate:
             order_rate = self._order_updaters[market][market_slot].get_energy_rate(self.area.now)
         else:
             order_rate = Decimal(order_rate)
-        capacity_percent = kwargs.get("capacity_percent")
         if not capacity_percent:
             capacity_percent = self._order_updaters[market][market_slot].capacity_percent / 100.0
         max_energy_kWh = Decimal(self._energy_params.peak_energy_kWh) * Decimal(capacity_percent)
@@ -107,18 +98,17 @@ class ForwardLoadStrategy(ForwardStrategyBase):
         order_energy_kWh = Decimal(min(available_energy_kWh - posted_energy_kWh, max_energy_kWh))
 
         if order_energy_kWh <= FLOATING_POINT_TOLERANCE:
-            return
-        market.bid(
-            float(order_rate * order_energy_kWh),
-            float(order_energy_kWh),
+            return None
+        return market_slot, order_rate, order_energy_kWh
+
+    def _post_orders_to_market(
+        self, market: "ForwardMarketBase", orders: List["ForwardOrderParameters"]
+    ):
+        market.bulk_bid(
+            orders,
             buyer=TraderDetails(
                 self.owner.name, self.owner.uuid, self.owner.name, self.owner.uuid
             ),
-            original_price=float(order_rate * order_energy_kWh),
-            time_slot=market_slot,
-        )
-        self._energy_params.increment_posted_energy(
-            market_slot, float(order_energy_kWh), market.market_type
         )
 
     def event_bid_traded(self, *, market_id: str, bid_trade: "Trade"):
@@ -10,11 +10,13 @@ from gsy_framework.utils import convert_pendulum_to_str_in_dict
 from gsy_framework.validators.heat_pump_validator import HeatPumpValidator
 from pendulum import DateTime, duration
 
+import gsy_e.constants
 from gsy_e.gsy_e_core.util import (
     get_market_maker_rate_from_time_slot,
     get_feed_in_tariff_rate_from_time_slot,
 )
 from gsy_e.models.strategy.energy_parameters.heatpump.cop_models import COPModelType
+from gsy_e.models.strategy.energy_parameters.heatpump.fleet import HeatPumpFleet
 from gsy_e.models.strategy.energy_parameters.heatpump.heat_pump import (
     HeatPumpEnergyParameters,
     CombinedHeatpumpTanksState,
@@ -81,6 +83,9 @@ class HeatPumpOrderUpdaterParameters(OrderUpdaterParameters):
 class HeatPumpStrategyBase(TradingStrategyBase):
     """Heat pump strategy base class"""
 
+    # Set on activation if the heat pump is stepped by the heat pump fleet of its area
+    _heat_pump_fleet: Optional[HeatPumpFleet] = None
+
     # pylint: disable=no-member
     def event_market_cycle(self) -> None:
         super().event_market_cycle()
@@ -89,13 +94,50 @@ class HeatPumpStrategyBase(TradingStrategyBase):
             return
 
         # Order matters: First update the energy state and then post orders
-        self._energy_params.event_market_cycle(spot_market.time_slot)
+        if self._heat_pump_fleet is None:
+            # Rejoin the fleet after the area was disabled
+            self._join_heat_pump_fleet()
+        if self._heat_pump_fleet is not None:
+            self._heat_pump_fleet.event_market_cycle(spot_market.time_slot)
+        else:
+            self._energy_params.event_market_cycle(spot_market.time_slot)
 
         self._post_orders_to_new_markets()
 
     def event_activate(self, **kwargs):
         self._update_grid_fees_in_order_updater_params()
         self._energy_params.event_activate()
+        self._join_heat_pump_fleet()
+
+    def _join_heat_pump_fleet(self):
+        """Let the heat pump fleet of the area step the energy parameters, if enabled."""
+        if not gsy_e.constants.BATCH_HEAT_PUMP_FLEET or not HeatPumpFleet.is_supported(
+            self._energy_params
+        ):
+            return
+        if self.area.heat_pump_fleet is None:
+            self.area.heat_pump_fleet = HeatPumpFleet()
+        self.area.heat_pump_fleet.add(self._energy_params)
+        self._heat_pump_fleet = self.area.heat_pump_fleet
+
+    def _leave_heat_pump_fleet(self):
+        """Stop the heat pump fleet of the area from stepping the energy parameters."""
+        if self._heat_pump_fleet is None:
+            return
+        self._heat_pump_fleet.remove(self._energy_params)
+        self._heat_pump_fleet = None
+
+    def event_on_disabled_area(self):
+        super().event_on_disabled_area()
+        self._leave_heat_pump_fleet()
+
+    def deactivate(self):
+        super().deactivate()
+        self._leave_heat_pump_fleet()
+
+    def event_area_deleted(self):
+        super().event_area_deleted()
+        self._leave_heat_pump_fleet()
 
     def event_tick(self):
         self._update_open_orders()
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
 from logging import getLogger
 from math import isclose
 
@@ -36,6 +36,46 @@ if TYPE_CHECKING:
 log = getLogger(__name__)
 
 
+class SorTesPerformanceTable:
+    """Interpolation table of a SorTES performance map (ambient_temp [K]: power [kW]).
+
+    Powers are linearly interpolated between the table temperatures and linearly extrapolated,
+    using the two nearest edge points, outside of them.
+    """
+
+    def __init__(self, power_map: Dict[float, float]):
+        temperatures = sorted(power_map.keys())
+        self.temperatures = np.array(temperatures, dtype=float)
+        self.powers = np.array([power_map[t] for t in temperatures], dtype=float)
+        self.temperatures.flags.writeable = False
+        self.powers.flags.writeable = False
+        self._left_slope = (self.powers[1] - self.powers[0]) / (
+            self.temperatures[1] - self.temperatures[0]
+        )
+        self._right_slope = (self.powers[-1] - self.powers[-2]) / (
+            self.temperatures[-1] - self.temperatures[-2]
+        )
+
+    def get_power(self, temperature: float) -> float:
+        """Return the power at the temperature."""
+        return float(self.get_powers(temperature))
+
+    def get_powers(self, temperatures: Union[float, np.ndarray]) -> np.ndarray:
+        """Return the powers for a batch of temperatures."""
+        temperatures = np.asarray(temperatures, dtype=float)
+        powers = np.interp(temperatures, self.temperatures, self.powers)
+        powers = np.where(
+            temperatures < self.temperatures[0],
+            self.powers[0] + self._left_slope * (temperatures - self.temperatures[0]),
+            powers,
+        )
+        return np.where(
+            temperatures > self.temperatures[-1],
+            self.powers[-1] + self._right_slope * (temperatures - self.temperatures[-1]),
+            powers,
+        )
+
+
 class SorTesPerformanceMaps:
     """Calculate the charging and discharging performance of the SorTES tank"""
 
@@ -58,37 +98,37 @@ class SorTesPerformanceMaps:
         25: 4.8,
     }  # ambient_temp [K]: power [kW]
 
+    # Tables are shared by all devices whose performance maps are identical
+    _tables: Dict[Tuple[Tuple[float, float], ...], SorTesPerformanceTable] = {}
+
+    @classmethod
+    def get_table(cls, power_map: Dict[float, float]) -> SorTesPerformanceTable:
+        """Return the interpolation table of the performance map, built only once per map."""
+        key = tuple(sorted(power_map.items()))
+        table = cls._tables.get(key)
+        if table is None:
+            table = cls._tables[key] = SorTesPerformanceTable(power_map)
+        return table
+
+    @classmethod
+    def get_charging_table(cls) -> SorTesPerformanceTable:
+        """Return the interpolation table of the charging power."""
+        return cls.get_table(cls.CHARGING_POWER_MAP)
+
+    @classmethod
+    def get_discharging_table(cls) -> SorTesPerformanceTable:
+        """Return the interpolation table of the discharging power."""
+        return cls.get_table(cls.DISCHARGING_POWER_MAP)
+
     @classmethod
     def get_power_charging(cls, temperature: float) -> float:
         """Return the charging power."""
-        return cls._get_power(temperature, cls.CHARGING_POWER_MAP)
+        return cls.get_charging_table().get_power(temperature)
 
     @classmethod
     def get_power_discharging(cls, temperature: float) -> float:
         """Return the discharging power."""
-        return cls._get_power(temperature, cls.DISCHARGING_POWER_MAP)
-
-    @classmethod
-    def _get_power(cls, temperature: float, power_table: dict) -> float:
-        temps = np.array(sorted(power_table.keys()), dtype=float)
-        powers = np.array([power_table[t] for t in sorted(power_table.keys())], dtype=float)
-
-        return float(
-            np.interp(temperature, temps, powers, left=None, right=None)
-            if temps[0] <= temperature <= temps[-1]
-            else cls._extrapolate(temperature, temps, powers)
-        )
-
-    @staticmethod
-    def _extrapolate(temperature: float, temps: np.ndarray, powers: np.ndarray) -> float:
-        """Linear extrapolation using the two nearest edge points."""
-        if temperature < temps[0]:
-            # Use the first two points for left extrapolation
-            slope = (powers[1] - powers[0]) / (temps[1] - temps[0])
-            return powers[0] + slope * (temperature - temps[0])
-        # Use the last two points for right extrapolation
-        slope = (powers[-1] - powers[-2]) / (temps[-1] - temps[-2])
-        return powers[-1] + slope * (temperature - temps[-1])
+        return cls.get_discharging_table().get_power(temperature)
 
 
 class SorTesTankMinimiseSwitchStrategy(MinimiseHeatpumpSwitchStrategy):
@@ -296,6 +336,8 @@ class SorTesTankEnergyParameters:
             target_temp_C_profile, None, profile_type=InputProfileTypes.IDENTITY
         )
         self._capacity_kWh: float = SorTesConfiguration.CAPACITY_KWH
+        self._charging_table = SorTesPerformanceMaps.get_charging_table()
+        self._discharging_table = SorTesPerformanceMaps.get_discharging_table()
         self._cop_model = cop_model_factory(COPModelType.UNIVERSAL, source_type)
         self._bought_energy_kWh = 0.0
 
@@ -397,14 +439,14 @@ class SorTesTankEnergyParameters:
         )
 
     def _get_performance_energy_charge_kWh(self, time_slot: DateTime) -> float:
-        charge_power_kW = SorTesPerformanceMaps.get_power_charging(
+        charge_power_kW = self._charging_table.get_power(
             self._ambient_temp_C.get_value(time_slot)
             + SorTesConfiguration.AMBIENT_TEMPERATURE_CORRECTION
         )
         return convert_kW_to_kWh(charge_power_kW, GlobalConfig.slot_length)
 
     def _get_performance_energy_discharge_kWh(self, time_slot: DateTime) -> float:
-        discharge_power_kW = SorTesPerformanceMaps.get_power_discharging(
+        discharge_power_kW = self._discharging_table.get_power(
             self._ambient_temp_C.get_value(time_slot)
             - SorTesConfiguration.AMBIENT_TEMPERATURE_CORRECTION
         )
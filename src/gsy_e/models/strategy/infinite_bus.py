@@ -112,7 +112,7 @@ class InfiniteBusStrategy(CommercialStrategy, BidEnabledStrategy):
 
     def buy_energy(self, market):
         """Buy energy."""
-        for offer in market.sorted_offers:
+        for offer in market.iterate_sorted_offers():
             if offer.seller.name == self.owner.name:
                 # Don't buy our own offer
                 continue
@@ -526,8 +526,7 @@ class LoadHoursStrategy(BidEnabledStrategy, UseMarketMakerMixin):
     def _update_energy_requirement_future_markets(self):
         if not ConstSettings.FutureMarketSettings.FUTURE_MARKET_DURATION_HOURS:
             return
-        for time_slot in self.area.future_market_time_slots:
-            self._energy_params.update_energy_requirement(time_slot)
+        self._energy_params.update_energy_requirements(self.area.future_market_time_slots)
 
     def _update_energy_requirement_in_state(self):
         self._update_energy_requirement_spot_market()
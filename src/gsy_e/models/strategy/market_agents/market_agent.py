@@ -19,7 +19,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from typing import Optional, TYPE_CHECKING
 
 from gsy_framework.constants_limits import ConstSettings, TIME_FORMAT
-from numpy.random import random
+from gsy_e.gsy_e_core.random_streams import random_streams
 from gsy_e.models.strategy import BaseStrategy, _TradeLookerUpper
 
 if TYPE_CHECKING:
@@ -65,6 +65,11 @@ class MarketAgent(BaseStrategy):
     def _create_engines(self):
         """Base method for creating the engines"""
 
+    @property
+    def random_stream_id(self) -> str:
+        """Identifier of the random stream that the agent uses to shuffle its engines."""
+        return f"{self.owner.random_stream_id}:{self.__class__.__name__}"
+
     @property
     def time_slot_str(self) -> Optional[str]:
         """Return time_slot of the inter area agent. For future markets it is None."""
@@ -84,7 +89,7 @@ class MarketAgent(BaseStrategy):
             min_offer_age = kwargs["min_offer_age"]
             self._validate_constructor_arguments(min_offer_age)
             self.min_offer_age = min_offer_age
-            for engine in sorted(self.engines, key=lambda _: random()):
+            for engine in random_streams.shuffled(self.random_stream_id, self.engines):
                 engine.min_offer_age = min_offer_age
 
     @property
@@ -17,8 +17,8 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 from typing import Optional, TYPE_CHECKING
 
-from numpy.random import random
 
+from gsy_e.gsy_e_core.random_streams import random_streams
 from gsy_e.models.market import MarketBase
 from gsy_e.models.strategy.market_agents.market_agent import MarketAgent
 from gsy_e.models.strategy.market_agents.one_sided_engine import MAEngine
@@ -57,27 +57,27 @@ class OneSidedAgent(MarketAgent):
 
     def event_tick(self):
         area = self.owner
-        for engine in sorted(self.engines, key=lambda _: random()):
+        for engine in random_streams.shuffled(self.random_stream_id, self.engines):
             engine.tick(area=area)
 
     # pylint: disable=unused-argument
     def event_offer(self, *, market_id: str, offer: "Offer"):
-        for engine in sorted(self.engines, key=lambda _: random()):
+        for engine in random_streams.shuffled(self.random_stream_id, self.engines):
             engine.event_offer(offer=offer)
 
     # pylint: disable=unused-argument
     def event_offer_traded(self, *, market_id: str, trade: "Trade"):
-        for engine in sorted(self.engines, key=lambda _: random()):
+        for engine in random_streams.shuffled(self.random_stream_id, self.engines):
             engine.event_offer_traded(trade=trade)
 
     # pylint: disable=unused-argument
     def event_offer_deleted(self, *, market_id: str, offer: "Offer"):
-        for engine in sorted(self.engines, key=lambda _: random()):
+        for engine in random_streams.shuffled(self.random_stream_id, self.engines):
             engine.event_offer_deleted(offer=offer)
 
     def event_offer_split(self, *, market_id: str,  original_offer: "Offer",
                           accepted_offer: "Offer", residual_offer: "Offer"):
-        for engine in sorted(self.engines, key=lambda _: random()):
+        for engine in random_streams.shuffled(self.random_stream_id, self.engines):
             engine.event_offer_split(market_id=market_id,
                                      original_offer=original_offer,
                                      accepted_offer=accepted_offer,
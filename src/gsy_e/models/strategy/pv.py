@@ -270,10 +270,9 @@ class PVStrategy(BidEnabledStrategy, UseMarketMakerMixin):
         time_slots = [self.area.spot_market.time_slot]
         if ConstSettings.FutureMarketSettings.FUTURE_MARKET_DURATION_HOURS:
             time_slots.extend(self.area.future_market_time_slots)
-        for time_slot in time_slots:
-            self._energy_params.set_produced_energy_forecast(
-                time_slot, self.simulation_config.slot_length
-            )
+        self._energy_params.set_produced_energy_forecasts(
+            time_slots, self.simulation_config.slot_length
+        )
 
     def event_market_cycle(self):
         super().event_market_cycle()
@@ -18,7 +18,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from abc import ABC, abstractmethod
 from math import copysign
-from typing import Dict, Optional, Union
+from typing import Dict, Mapping, Optional, Union
 from collections import defaultdict
 
 from pendulum import DateTime
@@ -37,6 +37,24 @@ class UnexpectedStateException(Exception):
     """Exception raised when the state of a device is unexpected."""
 
 
+def subtract_energy_profile(
+    energy_per_slot: Dict[DateTime, float], energy_profile: Mapping[DateTime, float]
+) -> float:
+    """Subtract the energy profile from the energy of the same time slots in energy_per_slot.
+
+    The energy stays stored in the per-slot dict and is updated slot by slot. Compared to one
+    decrement call per slot, only the call overhead is saved and the callers check the remaining
+    energy once, on the returned minimum of the updated time slots.
+    """
+    min_energy = None
+    for time_slot, energy in energy_profile.items():
+        remaining_energy = energy_per_slot[time_slot] - energy
+        energy_per_slot[time_slot] = remaining_energy
+        if min_energy is None or remaining_energy < min_energy:
+            min_energy = remaining_energy
+    return 0.0 if min_energy is None else min_energy
+
+
 # Complex device models should be split in three classes each:
 #
 # - a strategy class responsible for buying/selling options
@@ -303,6 +321,18 @@ class ConsumptionState(ProsumptionInterface):
             f"({self._energy_requirement_Wh[time_slot]})."
         )
 
+    def decrement_energy_requirement_profile(
+        self, purchased_energy_profile_Wh: Mapping[DateTime, float], area_name: str
+    ) -> None:
+        """Decrease the energy required by the device in multiple market slots at once."""
+        min_energy_requirement_Wh = subtract_energy_profile(
+            self._energy_requirement_Wh, purchased_energy_profile_Wh
+        )
+        assert min_energy_requirement_Wh >= -FLOATING_POINT_TOLERANCE, (
+            f"Energy requirement for device {area_name} fell below zero "
+            f"({min_energy_requirement_Wh})."
+        )
+
     def delete_past_state_values(self, current_time_slot: DateTime):
         """Delete data regarding energy consumption for past market slots."""
         to_delete = []
@@ -385,6 +415,18 @@ class ProductionState(ProsumptionInterface):
             f"({self._available_energy_kWh[time_slot]})."
         )
 
+    def decrement_available_energy_profile(
+        self, sold_energy_profile_kWh: Mapping[DateTime, float], area_name: str
+    ) -> None:
+        """Decrement the available energy of multiple market slots at once after a trade."""
+        min_available_energy_kWh = subtract_energy_profile(
+            self._available_energy_kWh, sold_energy_profile_kWh
+        )
+        assert min_available_energy_kWh >= -FLOATING_POINT_TOLERANCE, (
+            f"Available energy for device {area_name} fell below zero "
+            f"({min_available_energy_kWh})."
+        )
+
     def delete_past_state_values(self, current_time_slot: DateTime):
         """Delete data regarding energy production for past market slots."""
         to_delete = []
@@ -16,8 +16,9 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+from bisect import bisect_right
 from math import isclose
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 from pendulum import DateTime, duration
 
@@ -90,8 +91,66 @@ class EVChargingSession:
         self._current_soc_percent = (self._current_energy_kWh / self.battery_capacity_kWh) * 100.0
 
 
+class EVChargingSessionList(list):
+    """List of EV charging sessions that counts its mutations.
+
+    The version is used to invalidate the interval index of the sessions manager, so that the
+    sessions can be added, removed or replaced through the list at any time.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def _mutate(self, method_name: str, *args):
+        self.version += 1
+        return getattr(super(), method_name)(*args)
+
+    def __setitem__(self, *args):
+        self._mutate("__setitem__", *args)
+
+    def __delitem__(self, *args):
+        self._mutate("__delitem__", *args)
+
+    def __iadd__(self, *args):
+        return self._mutate("__iadd__", *args)
+
+    def append(self, *args):
+        self._mutate("append", *args)
+
+    def insert(self, *args):
+        self._mutate("insert", *args)
+
+    def extend(self, *args):
+        self._mutate("extend", *args)
+
+    def remove(self, *args):
+        self._mutate("remove", *args)
+
+    def pop(self, *args):
+        return self._mutate("pop", *args)
+
+    def clear(self):
+        self._mutate("clear")
+
+    def sort(self, *args, **kwargs):
+        self.version += 1
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._mutate("reverse")
+
+
 class EVSessionsManager:
-    """Manages multiple concurrent EV charging sessions."""
+    """Manages multiple concurrent EV charging sessions.
+
+    Active sessions are looked up through an interval index of the sessions, sorted by plug-in
+    time. Only the sessions that plugged in less than the longest session duration before the
+    time slot are checked, instead of the whole session history.
+    """
 
     def __init__(
         self,
@@ -99,9 +158,42 @@ class EVSessionsManager:
         slot_length: duration,
         losses: StorageLosses,
     ):
-        self.sessions = sessions
+        self.sessions = (
+            sessions
+            if isinstance(sessions, EVChargingSessionList)
+            else EVChargingSessionList(sessions)
+        )
         self.slot_length = slot_length
         self.losses = losses
+        self._index_version: Optional[int] = None
+        # (plug_in_time, end_time, position in the sessions list) sorted by plug_in_time
+        self._session_intervals: List[Tuple[DateTime, DateTime, int]] = []
+        self._plug_in_times: List[DateTime] = []
+        self._max_session_duration = duration()
+
+    def _update_index(self) -> None:
+        if self._index_version == self.sessions.version:
+            return
+        self._session_intervals = sorted(
+            (
+                (session.plug_in_time, session.end_time, position)
+                for position, session in enumerate(self.sessions)
+            ),
+            key=lambda interval: (interval[0], interval[2]),
+        )
+        self._plug_in_times = [interval[0] for interval in self._session_intervals]
+        self._max_session_duration = duration(
+            minutes=max((session.duration_minutes for session in self.sessions), default=0)
+        )
+        self._index_version = self.sessions.version
+
+    def add_session(self, session: EVChargingSession) -> None:
+        """Schedule a new charging session."""
+        self.sessions.append(session)
+
+    def remove_session(self, session: EVChargingSession) -> None:
+        """Remove a scheduled charging session."""
+        self.sessions.remove(session)
 
     @property
     def used_storage(self) -> float:
@@ -110,7 +202,16 @@ class EVSessionsManager:
 
     def get_active_sessions(self, time_slot: DateTime) -> List[EVChargingSession]:
         """Get all sessions active at the given time slot."""
-        return [session for session in self.sessions if session.is_active(time_slot)]
+        self._update_index()
+        # Sessions that plugged in before the longest duration prior to the slot have ended
+        first = bisect_right(self._plug_in_times, time_slot - self._max_session_duration)
+        last = bisect_right(self._plug_in_times, time_slot)
+        positions = sorted(
+            position
+            for _, end_time, position in self._session_intervals[first:last]
+            if time_slot < end_time
+        )
+        return [self.sessions[position] for position in positions]
 
     def has_active_sessions(self, time_slot: DateTime) -> bool:
         """Check if there are any active sessions at the given time slot."""
@@ -258,7 +359,7 @@ class EVChargerState(StorageState):
         self._preferred_power_profile = preferred_power_profile
         self._slot_length = slot_length
         self._losses = losses
-        sessions = charging_sessions or []
+        sessions = charging_sessions if charging_sessions is not None else []
 
         self.ev_sessions_manager = EVSessionsManager(
             sessions=sessions,
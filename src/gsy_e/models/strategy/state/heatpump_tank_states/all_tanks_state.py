@@ -2,6 +2,7 @@ from logging import getLogger
 from statistics import mean
 from typing import Union, List, Dict
 
+import numpy as np
 from gsy_framework.constants_limits import FLOATING_POINT_TOLERANCE, GlobalConfig
 from gsy_framework.utils import convert_kJ_to_kWh
 from pendulum import DateTime
@@ -40,8 +41,8 @@ class AllTanksState:
     def increase_tanks_temp_from_heat_energy(self, heat_energy_kJ: float, time_slot: DateTime):
         """Increase the temperature of the tanks with the provided heat energy."""
         scaling_factors = self._get_scaling_factors_for_charging(self._last_time_slot(time_slot))
-        for num, tank in enumerate(self._tanks_states):
-            heat_energy_per_tank_kWh = convert_kJ_to_kWh(heat_energy_kJ * scaling_factors[num])
+        heat_energies_per_tank_kWh = self._split_heat_energy_kWh(heat_energy_kJ, scaling_factors)
+        for tank, heat_energy_per_tank_kWh in zip(self._tanks_states, heat_energies_per_tank_kWh):
             if heat_energy_per_tank_kWh < FLOATING_POINT_TOLERANCE:
                 tank.no_charge(time_slot)
             else:
@@ -52,13 +53,18 @@ class AllTanksState:
         scaling_factors = self._get_scaling_factors_for_discharging(
             self._last_time_slot(time_slot)
         )
-        for num, tank in enumerate(self._tanks_states):
-            heat_energy_per_tank_kWh = convert_kJ_to_kWh(heat_energy_kJ * scaling_factors[num])
+        heat_energies_per_tank_kWh = self._split_heat_energy_kWh(heat_energy_kJ, scaling_factors)
+        for tank, heat_energy_per_tank_kWh in zip(self._tanks_states, heat_energies_per_tank_kWh):
             if heat_energy_per_tank_kWh < FLOATING_POINT_TOLERANCE:
                 tank.no_charge(time_slot)
             else:
                 tank.decrease_tank_temp_from_heat_energy(heat_energy_per_tank_kWh, time_slot)
 
+    @staticmethod
+    def _split_heat_energy_kWh(heat_energy_kJ: float, scaling_factors) -> List[float]:
+        """Split the heat energy between the tanks according to their scaling factors."""
+        return (convert_kJ_to_kWh(heat_energy_kJ) * np.asarray(scaling_factors)).tolist()
+
     def no_charge(self, time_slot: DateTime):
         """Trigger no_charge method for all tanks"""
         for tank in self._tanks_states:
@@ -139,20 +145,28 @@ class AllTanksState:
             tank.event_market_cycle(time_slot)
 
     def _get_scaling_factors_for_charging(self, time_slot):
-        _current_dod_tanks = [tank.get_dod_energy_kJ(time_slot) for tank in self._tanks_states]
-        total_energy = sum(_current_dod_tanks)
+        _current_dod_tanks = np.fromiter(
+            (tank.get_dod_energy_kJ(time_slot) for tank in self._tanks_states),
+            dtype=float,
+            count=len(self._tanks_states),
+        )
+        total_energy = _current_dod_tanks.sum()
         if total_energy == 0:
             log.info("No available space for charging in any tank. Skipping charging.")
             return [0] * len(self._tanks_states)
-        return [energy / total_energy for energy in _current_dod_tanks]
+        return (_current_dod_tanks / total_energy).tolist()
 
     def _get_scaling_factors_for_discharging(self, time_slot):
-        available_energies = [tank.get_soc_energy_kJ(time_slot) for tank in self._tanks_states]
-        total_available_energy = sum(available_energies)
+        available_energies = np.fromiter(
+            (tank.get_soc_energy_kJ(time_slot) for tank in self._tanks_states),
+            dtype=float,
+            count=len(self._tanks_states),
+        )
+        total_available_energy = available_energies.sum()
         if total_available_energy == 0:
             log.info("No available capacity for discharging in any tanks. Skipping discharging.")
             return [0] * len(self._tanks_states)
-        return [energy / total_available_energy for energy in available_energies]
+        return (available_energies / total_available_energy).tolist()
 
     def _last_time_slot(self, time_slot: DateTime):
         return time_slot - GlobalConfig.slot_length
@@ -1,7 +1,7 @@
 import logging
-from statistics import mean
 from typing import Dict, Optional
 
+import numpy as np
 from pendulum import DateTime
 
 from gsy_framework.constants_limits import GlobalConfig, FLOATING_POINT_TOLERANCE
@@ -40,8 +40,9 @@ class PCMTankState(TankStateBase):
         tank_parameters: PCMTankParameters,
     ):
         super().__init__(tank_parameters)
-        self._htf_temps_C: Dict[DateTime, list[float]] = {}
-        self._pcm_temps_C: Dict[DateTime, list[float]] = {}
+        # Temperatures of the PCM elements, as one array of all elements per time slot
+        self._htf_temps_C: Dict[DateTime, np.ndarray] = {}
+        self._pcm_temps_C: Dict[DateTime, np.ndarray] = {}
         self._condenser_temp_C: Dict[DateTime, float] = {}
         self._pcm_charge_model = PCMChargeModel(
             slot_length=GlobalConfig.slot_length,
@@ -69,21 +70,21 @@ class PCMTankState(TankStateBase):
         """
         Initiate the storage temperatures with the initial temperature of the storge
         """
-        self._htf_temps_C[GlobalConfig.start_date] = [
-            self._params.initial_temp_C for _ in range(int(NUMBER_OF_PCM_ELEMENTS / 2))
-        ]
-        self._pcm_temps_C[GlobalConfig.start_date] = [
-            self._params.initial_temp_C for _ in range(int(NUMBER_OF_PCM_ELEMENTS / 2))
-        ]
+        self._htf_temps_C[GlobalConfig.start_date] = np.full(
+            int(NUMBER_OF_PCM_ELEMENTS / 2), self._params.initial_temp_C, dtype=float
+        )
+        self._pcm_temps_C[GlobalConfig.start_date] = np.full(
+            int(NUMBER_OF_PCM_ELEMENTS / 2), self._params.initial_temp_C, dtype=float
+        )
         self._condenser_temp_C[GlobalConfig.start_date] = self._params.initial_temp_C
         self._soc[GlobalConfig.start_date] = self._pcm_charge_model.get_soc(
             self._get_pcm_temps_C(GlobalConfig.start_date)
         )
 
-    def _get_htf_temps_C(self, time_slot: DateTime) -> Optional[list]:
+    def _get_htf_temps_C(self, time_slot: DateTime) -> Optional[np.ndarray]:
         return self._htf_temps_C.get(time_slot)
 
-    def _get_pcm_temps_C(self, time_slot: DateTime) -> Optional[list]:
+    def _get_pcm_temps_C(self, time_slot: DateTime) -> Optional[np.ndarray]:
         return self._pcm_temps_C.get(time_slot)
 
     def _set_soc_after_charging(self, time_slot: DateTime):
@@ -123,12 +124,12 @@ class PCMTankState(TankStateBase):
     def get_htf_temp_C(self, time_slot: DateTime) -> Optional[float]:
         """Return mean temperature of the heat transfer fluid"""
         htf_temps = self._get_htf_temps_C(time_slot)
-        return None if htf_temps is None else mean(htf_temps)
+        return None if htf_temps is None else float(np.mean(htf_temps))
 
     def get_pcm_temp_C(self, time_slot: DateTime) -> Optional[float]:
         """Return the mean temperature of the PCM."""
         pcm_temps = self._get_pcm_temps_C(time_slot)
-        return None if pcm_temps is None else mean(pcm_temps)
+        return None if pcm_temps is None else float(np.mean(pcm_temps))
 
     def _get_deltaT_from_heat_demand_kWh(self, heat_energy_kWh: float) -> float:
         """dT[K] = Q / (m + c_p)"""
@@ -161,13 +162,10 @@ class PCMTankState(TankStateBase):
         )
         self._decrease_storage_temp_from_condenser_temp(temp_cond_C, time_slot)
 
-    def _limit_temps_after_dis_charging(self, temps: list[float]):
-        temps = [
-            temp if temp <= self._params.max_temp_C else self._params.max_temp_C for temp in temps
-        ]
-        return [
-            temp if temp >= self._params.min_temp_C else self._params.min_temp_C for temp in temps
-        ]
+    def _limit_temps_after_dis_charging(self, temps: np.ndarray) -> np.ndarray:
+        return np.clip(
+            np.asarray(temps, dtype=float), self._params.min_temp_C, self._params.max_temp_C
+        )
 
     def _increase_storage_temp_from_condenser_temp(
         self, condenser_temp_C: float, time_slot: DateTime
@@ -229,15 +227,29 @@ class PCMTankState(TankStateBase):
 
     def get_state(self) -> Dict:
         return {
-            "htf_temps_C": convert_pendulum_to_str_in_dict(self._htf_temps_C),
-            "pcm_temps_C": convert_pendulum_to_str_in_dict(self._pcm_temps_C),
+            "htf_temps_C": convert_pendulum_to_str_in_dict(
+                {time_slot: temps.tolist() for time_slot, temps in self._htf_temps_C.items()}
+            ),
+            "pcm_temps_C": convert_pendulum_to_str_in_dict(
+                {time_slot: temps.tolist() for time_slot, temps in self._pcm_temps_C.items()}
+            ),
             "condenser_temp_C": convert_pendulum_to_str_in_dict(self._condenser_temp_C),
             "soc": convert_pendulum_to_str_in_dict(self._soc),
         }
 
     def restore_state(self, state_dict: Dict):
-        self._htf_temps_C = convert_str_to_pendulum_in_dict(state_dict["htf_temps_C"])
-        self._pcm_temps_C = convert_str_to_pendulum_in_dict(state_dict["pcm_temps_C"])
+        self._htf_temps_C = {
+            time_slot: np.asarray(temps, dtype=float)
+            for time_slot, temps in convert_str_to_pendulum_in_dict(
+                state_dict["htf_temps_C"]
+            ).items()
+        }
+        self._pcm_temps_C = {
+            time_slot: np.asarray(temps, dtype=float)
+            for time_slot, temps in convert_str_to_pendulum_in_dict(
+                state_dict["pcm_temps_C"]
+            ).items()
+        }
         self._condenser_temp_C = convert_str_to_pendulum_in_dict(state_dict["condenser_temp_C"])
         self._soc = convert_str_to_pendulum_in_dict(state_dict["soc"])
         self._params.min_temp_C = state_dict["min_temp_C"]
@@ -293,7 +305,7 @@ class PCMTankState(TankStateBase):
         )
 
     def current_tank_temperature(self, time_slot):
-        return mean(self._pcm_temps_C[time_slot])
+        return float(np.mean(self._pcm_temps_C[time_slot]))
 
     def current_condenser_temperature(self, time_slot):
         return self._get_condenser_temp_C(time_slot)
@@ -312,6 +324,6 @@ class PCMTankState(TankStateBase):
         per_market_slot_loss_pcm_C = (
             self.get_pcm_temp_C(time_slot) * self._params.per_market_slot_loss
         )
-        self._pcm_temps_C[time_slot] = [
-            plate_temp - per_market_slot_loss_pcm_C for plate_temp in self._pcm_temps_C[time_slot]
-        ]
+        self._pcm_temps_C[time_slot] = (
+            np.asarray(self._pcm_temps_C[time_slot], dtype=float) - per_market_slot_loss_pcm_C
+        )
@@ -23,6 +23,41 @@ from gsy_e.models.strategy.state.heatpump_state import delete_time_slots_in_stat
 log = getLogger(__name__)
 
 
+# The calc_water_tank_* functions only use arithmetic operators, so that they accept floats as
+# well as NumPy arrays. The heat pump fleet steps many tanks at once with the same formulas.
+def calc_water_tank_temp_diff_C(heat_energy_kWh, Q_specific):
+    """Return the temperature difference that the heat energy causes in the tank."""
+    return heat_energy_kWh / Q_specific
+
+
+def calc_water_tank_heat_energy_kJ(temp_diff_C, Q_specific):
+    """Return the heat energy that causes the temperature difference in the tank."""
+    return convert_kWh_to_kJ(temp_diff_C * Q_specific)
+
+
+def calc_water_tank_soc(storage_temp_C, min_temp_C, max_temp_C):
+    """Return the SOC of the tank at the storage temperature."""
+    return (storage_temp_C - min_temp_C) / (max_temp_C - min_temp_C)
+
+
+def calc_water_tank_max_temp_diff_C(storage_temp_C, max_temp_C, heat_demand_kJ, Q_specific):
+    """Return the temperature increase that the tank can take while covering the heat demand."""
+    temp_diff_due_to_consumption = calc_water_tank_temp_diff_C(
+        convert_kJ_to_kWh(heat_demand_kJ), Q_specific
+    )
+    return max_temp_C - storage_temp_C + temp_diff_due_to_consumption
+
+
+def calc_water_tank_temp_below_min_C(storage_temp_C, min_temp_C, heat_demand_kJ, Q_specific):
+    """Return how far covering the heat demand would cool the tank below its minimum
+    temperature (negative if the tank stays above it)."""
+    diff_to_min_temp_C = storage_temp_C - min_temp_C
+    temp_diff_due_to_consumption = calc_water_tank_temp_diff_C(
+        convert_kJ_to_kWh(heat_demand_kJ), Q_specific
+    )
+    return temp_diff_due_to_consumption - diff_to_min_temp_C
+
+
 class WaterTankState(TankStateBase):
     """State for the heat pump tank."""
 
@@ -37,8 +72,8 @@ class WaterTankState(TankStateBase):
     @property
     def max_capacity_kJ(self) -> float:
         """return the maximal energy capacity of the storage."""
-        return convert_kWh_to_kJ(
-            (self._params.max_temp_C - self._params.min_temp_C) * self._Q_specific
+        return calc_water_tank_heat_energy_kJ(
+            self._params.max_temp_C - self._params.min_temp_C, self._Q_specific
         )
 
     def get_storage_temp_C(self, time_slot: DateTime) -> float:
@@ -46,8 +81,8 @@ class WaterTankState(TankStateBase):
         return self._storage_temp_C[time_slot]
 
     def _update_soc(self, time_slot: DateTime):
-        self._soc[time_slot] = (self._storage_temp_C[time_slot] - self._params.min_temp_C) / (
-            self._params.max_temp_C - self._params.min_temp_C
+        self._soc[time_slot] = calc_water_tank_soc(
+            self._storage_temp_C[time_slot], self._params.min_temp_C, self._params.max_temp_C
         )
 
     def get_state(self) -> Dict:
@@ -125,15 +160,15 @@ class WaterTankState(TankStateBase):
 
     def get_max_heat_energy_consumption_kJ(self, time_slot: DateTime, heat_demand_kJ: float):
         """Calculate max heat energy consumption that the tank can accommodate."""
-        temp_diff_due_to_consumption = self._Q_kWh_to_temp_diff(convert_kJ_to_kWh(heat_demand_kJ))
-        max_temp_diff = (
-            self._params.max_temp_C
-            - self.get_storage_temp_C(time_slot)
-            + temp_diff_due_to_consumption
+        max_temp_diff = calc_water_tank_max_temp_diff_C(
+            self.get_storage_temp_C(time_slot),
+            self._params.max_temp_C,
+            heat_demand_kJ,
+            self._Q_specific,
         )
         if max_temp_diff < 0:
             assert False, f"max_temp_diff lower than 0: {max_temp_diff}"
-        return convert_kWh_to_kJ(max_temp_diff * self._Q_specific)
+        return calc_water_tank_heat_energy_kJ(max_temp_diff, self._Q_specific)
 
     def get_min_heat_energy_consumption_kJ(self, time_slot: DateTime, heat_demand_kJ: float):
         """
@@ -144,14 +179,14 @@ class WaterTankState(TankStateBase):
         - if current_temp > min_storage: only trade for the demand minus the heat
                                          that can be extracted from the storage
         """
-        diff_to_min_temp_C = self.get_storage_temp_C(time_slot) - self._params.min_temp_C
-        temp_diff_due_to_consumption = self._Q_kWh_to_temp_diff(convert_kJ_to_kWh(heat_demand_kJ))
-        min_temp_diff = (
-            temp_diff_due_to_consumption - diff_to_min_temp_C
-            if diff_to_min_temp_C <= temp_diff_due_to_consumption
-            else 0
+        temp_below_min_C = calc_water_tank_temp_below_min_C(
+            self.get_storage_temp_C(time_slot),
+            self._params.min_temp_C,
+            heat_demand_kJ,
+            self._Q_specific,
         )
-        return convert_kWh_to_kJ(min_temp_diff * self._Q_specific)
+        min_temp_diff = max(temp_below_min_C, 0)
+        return calc_water_tank_heat_energy_kJ(min_temp_diff, self._Q_specific)
 
     def current_tank_temperature(self, time_slot: DateTime) -> float:
         """Get current tank temperature for timeslot."""
@@ -162,7 +197,7 @@ class WaterTankState(TankStateBase):
         return self.get_storage_temp_C(time_slot)
 
     def _Q_kWh_to_temp_diff(self, energy_kWh: float) -> float:
-        return energy_kWh / self._Q_specific
+        return calc_water_tank_temp_diff_C(energy_kWh, self._Q_specific)
 
     @property
     def _Q_specific(self):
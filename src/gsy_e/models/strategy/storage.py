@@ -480,7 +480,7 @@ class StorageStrategy(BidEnabledStrategy):
         if offer:
             self._try_to_buy_offer(offer, market, max_affordable_offer_rate)
         else:
-            for market_offer in market.sorted_offers:
+            for market_offer in market.iterate_sorted_offers():
                 if (
                     self._try_to_buy_offer(market_offer, market, max_affordable_offer_rate)
                     is False
@@ -0,0 +1,63 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+
+from gsy_framework.constants_limits import ConstSettings
+
+from gsy_e.models.area import Area
+from gsy_e.models.strategy.commercial_producer import CommercialStrategy
+from gsy_e.models.strategy.forward.load import ForwardLoadStrategy
+from gsy_e.models.strategy.forward.pv import ForwardPVStrategy
+from gsy_e.models.strategy.load_hours import LoadHoursStrategy
+from gsy_e.models.strategy.pv import PVStrategy
+from gsy_e.models.strategy.storage import StorageStrategy
+
+# Same grid as setup/1000_houses.py, with a configurable number of houses.
+BENCHMARK_HOUSES_ENV_VAR = "GSY_E_BENCHMARK_HOUSES"
+
+
+def _spot_house(i):
+    return Area(f"House {i}", [
+        Area(f"H{i} General Load", strategy=LoadHoursStrategy(avg_power_W=100,
+                                                              hrs_of_day=list(range(24)))),
+        Area(f"H{i} PV", strategy=PVStrategy(6, 80)),
+        Area(f"H{i} Storage", strategy=StorageStrategy(initial_soc=50)),
+    ])
+
+
+def _forward_house(i):
+    return Area(f"House {i}", [
+        Area(f"H{i} General Load", strategy=ForwardLoadStrategy(capacity_kW=1)),
+        Area(f"H{i} PV", strategy=ForwardPVStrategy(capacity_kW=6)),
+    ])
+
+
+def get_setup(config):
+    number_of_houses = int(os.environ.get(BENCHMARK_HOUSES_ENV_VAR, 1000))
+    create_house = (_forward_house if ConstSettings.ForwardMarketSettings.ENABLE_FORWARD_MARKETS
+                    else _spot_house)
+    area = Area(
+        "Grid",
+        [*[create_house(i) for i in range(1, number_of_houses + 1)],
+         Area("Commercial Energy Producer",
+              strategy=CommercialStrategy(energy_rate=30)
+              ),
+         ],
+        config=config
+    )
+    return area
@@ -17,6 +17,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 # pylint: disable=missing-function-docstring, protected-access
+from copy import deepcopy
 from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
@@ -30,6 +31,7 @@ from gsy_e.gsy_e_core.device_registry import DeviceRegistry
 from gsy_e.models.area import Area, Asset, Market, check_area_name_exists_in_parent_area
 from gsy_e.models.area.events import Events
 from gsy_e.models.config import SimulationConfig
+from gsy_e.models.market.one_sided import OneSidedMarket
 from gsy_e.models.strategy.storage import StorageStrategy
 
 
@@ -382,6 +384,70 @@ class TestEventDispatcher:
             child.name = "Street 2"
             assert exception == "Area name should be unique inside the same Parent Area"
 
+    @staticmethod
+    def test_children_are_indexed_by_name_and_uuid():
+        house1 = Area(name="House 1", uuid="house1_uuid")
+        house2 = Area(name="House 2", uuid="house2_uuid")
+        area = Area(name="Street", children=[house1])
+        area.children.insert(0, house2)
+        assert area.children.get_by_name("House 2") is house2
+        assert area.children.get_by_uuid("house1_uuid") is house1
+
+        house1.name = "House 3"
+        assert area.children.get_by_name("House 1") is None
+        assert area.children.get_by_name("House 3") is house1
+        area.children.append(Area(name="House 1"))
+
+        area.children.remove(house2)
+        assert area.children.get_by_uuid("house2_uuid") is None
+        assert check_area_name_exists_in_parent_area(area, "House 2") is False
+        assert [child.name for child in deepcopy(area).children] == ["House 3", "House 1"]
+
+    @staticmethod
+    def test_path_to_root_fees_are_invalidated_when_grid_fees_change(config):
+        house = Area(name="House", grid_fee_constant=1, config=config)
+        street = Area(name="Street", children=[house], grid_fee_constant=2, config=config)
+        grid = Area(name="Grid", children=[street], grid_fee_constant=3, config=config)
+        assert house.get_path_to_root_fees() == 6
+        grid.grid_fee_constant = 4
+        assert house.get_path_to_root_fees() == 7
+        street.area_reconfigure_event(grid_fee_constant=5)
+        assert house.get_path_to_root_fees() == 10
+
+    @staticmethod
+    def test_random_stream_ids_follow_the_area_path():
+        house1 = Area(name="House")
+        house2 = Area(name="House")
+        street1 = Area(name="Street 1", children=[house1])
+        Area(name="Grid", children=[street1, Area(name="Street 2", children=[house2])])
+        market1 = OneSidedMarket(name="House")
+        market2 = OneSidedMarket(name="House")
+        market1.owner, market2.owner = house1, house2
+        assert market1.random_stream_id == "Grid/Street 1/House:Spot Market"
+        assert market2.random_stream_id == "Grid/Street 2/House:Spot Market"
+
+        street1.name = "Street 3"
+        assert house1.random_stream_id == "Grid/Street 3/House"
+        assert market1.random_stream_id == "Grid/Street 3/House:Spot Market"
+
+    @staticmethod
+    def test_cached_area_paths_follow_a_new_parent(config):
+        house = Area(name="House", grid_fee_constant=1, config=config)
+        street1 = Area(name="Street 1", children=[house], grid_fee_constant=2, config=config)
+        street2 = Area(name="Street 2", grid_fee_constant=3, config=config)
+        Area(name="Grid", children=[street1, street2], config=config)
+        assert house.random_stream_id == "Grid/Street 1/House"
+        assert house.get_path_to_root_fees() == 3
+
+        street1.children.remove(house)
+        street2.children.append(house)
+        house.parent = street2
+        assert house.random_stream_id == "Grid/Street 2/House"
+        assert house.get_path_to_root_fees() == 4
+
+        street2.parent = None
+        assert house.random_stream_id == "Street 2/House"
+
 
 class TestFunctions:
     """Test utility functions in the area module."""
@@ -0,0 +1,373 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+
+import pytest
+from gsy_framework.data_classes import TradeBidOfferInfo
+from hypothesis import given
+from hypothesis import strategies as st
+
+from gsy_e.models.market.grid_fees.base_model import GridFees
+from gsy_e.models.market.grid_fees.constant_grid_fees import ConstantGridFees
+from gsy_e.models.market.grid_fees.fixed_point_grid_fees import (
+    FixedPointConstantGridFees,
+    FixedPointGridFees,
+    FIXED_POINT_QUANTUM,
+    fixed_point_divide,
+    to_fixed_point,
+)
+
+TRADE_INFO_FIELDS = (
+    "original_bid_rate",
+    "propagated_bid_rate",
+    "original_offer_rate",
+    "propagated_offer_rate",
+    "trade_rate",
+)
+
+
+def _decimals(min_value, max_value):
+    return st.decimals(min_value=Decimal(min_value), max_value=Decimal(max_value), places=4)
+
+
+def _floats(min_value, max_value):
+    return st.floats(min_value=min_value, max_value=max_value, allow_nan=False)
+
+
+rates = _decimals("0.01", "1000")
+fee_ratios = _decimals("0", "0.5")
+constant_fees = _decimals("0", "10")
+float_rates = _floats(0.01, 1000)
+float_fee_ratios = _floats(0, 0.5)
+float_constant_fees = _floats(0, 10)
+
+
+def _assert_equal_rates(actual, expected):
+    assert actual == expected
+
+
+def _is_rounded_to_fixed_point(actual, expected):
+    if actual == expected.quantize(FIXED_POINT_QUANTUM):
+        return True
+    return abs(abs(actual - expected) - FIXED_POINT_QUANTUM / 2) < Decimal("1e-24")
+
+
+def _assert_rounded_to_fixed_point(actual, expected):
+    """The fixed-point result has to be the Decimal result rounded half to even to 1e-12.
+
+    Exact ties at the 13th decimal are the only exception: there the Decimal result carries the
+    rounding error of its 28 significant digits, that decides the rounding direction.
+    """
+    assert _is_rounded_to_fixed_point(actual, expected)
+
+
+def _assert_rounded_float_rate(actual, expected):
+    """Like _assert_rounded_to_fixed_point, for fixed-point results that are returned as floats."""
+    assert any(
+        actual == float(candidate) and _is_rounded_to_fixed_point(candidate, expected)
+        for candidate in (
+            expected.quantize(FIXED_POINT_QUANTUM, rounding=ROUND_FLOOR),
+            expected.quantize(FIXED_POINT_QUANTUM, rounding=ROUND_CEILING),
+        )
+    )
+
+
+def _quantized(rate):
+    return None if rate is None else Decimal(rate).quantize(FIXED_POINT_QUANTUM)
+
+
+def _quantized_trade_info(trade_info):
+    return TradeBidOfferInfo(
+        **{field: _quantized(getattr(trade_info, field)) for field in TRADE_INFO_FIELDS}
+    )
+
+
+def _assert_matches_float_inputs(actual, quantized_expected, float_expected):
+    """Compare a fixed-point result for float inputs with the results of the Decimal class.
+
+    The fixed-point classes round float inputs to 1e-12 first. With the same rounded inputs the
+    Decimal class has to agree up to the fixed-point scale, and with the unrounded float inputs
+    it may only differ by the propagated rounding of the inputs.
+    """
+    assert float(actual) == pytest.approx(
+        float(quantized_expected), rel=1e-15, abs=float(FIXED_POINT_QUANTUM)
+    )
+    assert float(actual) == pytest.approx(float(float_expected), rel=1e-8, abs=1e-10)
+
+
+def _trade_info(
+    original_bid_rate, bid_fee_ratio, original_offer_rate, offer_fee_ratio, trade_ratio
+):
+    propagated_bid_rate = original_bid_rate * (1 - bid_fee_ratio)
+    propagated_offer_rate = original_offer_rate * (1 + offer_fee_ratio)
+    return TradeBidOfferInfo(
+        original_bid_rate=original_bid_rate,
+        propagated_bid_rate=propagated_bid_rate,
+        original_offer_rate=original_offer_rate,
+        propagated_offer_rate=propagated_offer_rate,
+        trade_rate=original_bid_rate * trade_ratio,
+    )
+
+
+trade_infos = st.builds(
+    _trade_info,
+    rates,
+    _decimals("0", "0.9"),
+    rates,
+    _decimals("0", "1"),
+    _decimals("0", "1"),
+)
+float_trade_infos = st.builds(
+    _trade_info,
+    float_rates,
+    _floats(0, 0.9),
+    float_rates,
+    _floats(0, 1),
+    _floats(0, 1),
+)
+
+
+class TestFixedPointGridFees:
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "numerator, denominator, expected",
+        [(5, 2, 2), (7, 2, 4), (-5, 2, -2), (5, -2, -2), (10, 3, 3), (11, 3, 4), (0, 7, 0)],
+    )
+    def test_fixed_point_divide_rounds_half_to_even(numerator, denominator, expected):
+        assert fixed_point_divide(numerator, denominator) == expected
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (3, 3_000_000_000_000),
+            (Decimal("123.456789012345"), 123_456_789_012_345),
+            (Decimal("0.0000000000005"), 0),
+            (Decimal("0.0000000000015"), 2),
+            (Decimal("-0.0000000000015"), -2),
+            (0.1, 100_000_000_000),
+            (1e-13, 0),
+        ],
+    )
+    def test_to_fixed_point_is_exact_up_to_the_fixed_point_scale(value, expected):
+        assert to_fixed_point(value) == expected
+
+    @staticmethod
+    @given(trade_infos, fee_ratios)
+    def test_calculate_trade_price_and_fees_matches_decimal(trade_info, grid_fee_ratio):
+        decimal_results = GridFees(grid_fee_ratio).calculate_trade_price_and_fees(trade_info)
+        fixed_point_results = FixedPointGridFees(grid_fee_ratio).calculate_trade_price_and_fees(
+            trade_info
+        )
+        for fixed_point_result, decimal_result in zip(fixed_point_results, decimal_results):
+            _assert_rounded_to_fixed_point(fixed_point_result, decimal_result)
+
+    @staticmethod
+    @given(trade_infos, fee_ratios, st.booleans())
+    def test_propagate_original_info_matches_decimal(trade_info, grid_fee_ratio, ignore_fees):
+        decimal_fees = GridFees(grid_fee_ratio)
+        fixed_point_fees = FixedPointGridFees(grid_fee_ratio)
+        _assert_equal_rates(
+            fixed_point_fees.propagate_original_bid_info_on_offer_trade(
+                trade_info
+            ).propagated_bid_rate,
+            decimal_fees.propagate_original_bid_info_on_offer_trade(
+                trade_info
+            ).propagated_bid_rate,
+        )
+        _assert_equal_rates(
+            fixed_point_fees.propagate_original_offer_info_on_bid_trade(
+                trade_info, ignore_fees
+            ).propagated_offer_rate,
+            decimal_fees.propagate_original_offer_info_on_bid_trade(
+                trade_info, ignore_fees
+            ).propagated_offer_rate,
+        )
+
+    @staticmethod
+    @given(trade_infos)
+    def test_calculate_original_trade_rate_matches_decimal(trade_info):
+        _assert_rounded_float_rate(
+            FixedPointGridFees.calculate_original_trade_rate_from_clearing_rate(
+                trade_info.original_bid_rate,
+                trade_info.propagated_bid_rate,
+                trade_info.trade_rate,
+            ),
+            GridFees.calculate_original_trade_rate_from_clearing_rate(
+                trade_info.original_bid_rate,
+                trade_info.propagated_bid_rate,
+                trade_info.trade_rate,
+            ),
+        )
+
+    @staticmethod
+    @given(float_trade_infos, float_fee_ratios, st.booleans())
+    def test_float_inputs_match_decimal(trade_info, grid_fee_ratio, ignore_fees):
+        quantized_info = _quantized_trade_info(trade_info)
+        quantized_fees = GridFees(_quantized(grid_fee_ratio))
+        float_fees = GridFees(grid_fee_ratio)
+        fixed_point_fees = FixedPointGridFees(grid_fee_ratio)
+
+        for fixed_point_result, quantized_result, float_result in zip(
+            fixed_point_fees.calculate_trade_price_and_fees(trade_info),
+            quantized_fees.calculate_trade_price_and_fees(quantized_info),
+            float_fees.calculate_trade_price_and_fees(trade_info),
+        ):
+            _assert_matches_float_inputs(fixed_point_result, quantized_result, float_result)
+
+        _assert_matches_float_inputs(
+            *(
+                fees.propagate_original_bid_info_on_offer_trade(info).propagated_bid_rate
+                for fees, info in (
+                    (fixed_point_fees, trade_info),
+                    (quantized_fees, quantized_info),
+                    (float_fees, trade_info),
+                )
+            )
+        )
+        _assert_matches_float_inputs(
+            *(
+                fees.propagate_original_offer_info_on_bid_trade(
+                    info, ignore_fees
+                ).propagated_offer_rate
+                for fees, info in (
+                    (fixed_point_fees, trade_info),
+                    (quantized_fees, quantized_info),
+                    (float_fees, trade_info),
+                )
+            )
+        )
+        _assert_matches_float_inputs(
+            *(
+                fees.calculate_original_trade_rate_from_clearing_rate(
+                    info.original_bid_rate, info.propagated_bid_rate, info.trade_rate
+                )
+                for fees, info in (
+                    (fixed_point_fees, trade_info),
+                    (quantized_fees, quantized_info),
+                    (float_fees, trade_info),
+                )
+            )
+        )
+
+
+class TestFixedPointConstantGridFees:
+
+    @staticmethod
+    @given(trade_infos, constant_fees)
+    def test_calculate_trade_price_and_fees_matches_decimal(trade_info, grid_fee_const):
+        decimal_results = ConstantGridFees(grid_fee_const).calculate_trade_price_and_fees(
+            trade_info
+        )
+        fixed_point_results = FixedPointConstantGridFees(
+            grid_fee_const
+        ).calculate_trade_price_and_fees(trade_info)
+        for fixed_point_result, decimal_result in zip(fixed_point_results, decimal_results):
+            _assert_equal_rates(fixed_point_result, decimal_result.quantize(FIXED_POINT_QUANTUM))
+
+    @staticmethod
+    @given(trade_infos, constant_fees, st.booleans())
+    def test_propagate_original_info_matches_decimal(trade_info, grid_fee_const, ignore_fees):
+        decimal_fees = ConstantGridFees(grid_fee_const)
+        fixed_point_fees = FixedPointConstantGridFees(grid_fee_const)
+        _assert_equal_rates(
+            fixed_point_fees.propagate_original_bid_info_on_offer_trade(
+                trade_info
+            ).propagated_bid_rate,
+            decimal_fees.propagate_original_bid_info_on_offer_trade(
+                trade_info
+            ).propagated_bid_rate,
+        )
+        _assert_equal_rates(
+            fixed_point_fees.propagate_original_offer_info_on_bid_trade(
+                trade_info, ignore_fees
+            ).propagated_offer_rate,
+            decimal_fees.propagate_original_offer_info_on_bid_trade(
+                trade_info, ignore_fees
+            ).propagated_offer_rate,
+        )
+
+    @staticmethod
+    @given(trade_infos)
+    def test_calculate_original_trade_rate_matches_decimal(trade_info):
+        _assert_equal_rates(
+            FixedPointConstantGridFees.calculate_original_trade_rate_from_clearing_rate(
+                trade_info.original_bid_rate,
+                trade_info.propagated_bid_rate,
+                trade_info.trade_rate,
+            ),
+            float(
+                ConstantGridFees.calculate_original_trade_rate_from_clearing_rate(
+                    trade_info.original_bid_rate,
+                    trade_info.propagated_bid_rate,
+                    trade_info.trade_rate,
+                ).quantize(FIXED_POINT_QUANTUM)
+            ),
+        )
+
+    @staticmethod
+    @given(float_trade_infos, float_constant_fees, st.booleans())
+    def test_float_inputs_match_decimal(trade_info, grid_fee_const, ignore_fees):
+        quantized_info = _quantized_trade_info(trade_info)
+        quantized_fees = ConstantGridFees(_quantized(grid_fee_const))
+        float_fees = ConstantGridFees(grid_fee_const)
+        fixed_point_fees = FixedPointConstantGridFees(grid_fee_const)
+
+        for fixed_point_result, quantized_result, float_result in zip(
+            fixed_point_fees.calculate_trade_price_and_fees(trade_info),
+            quantized_fees.calculate_trade_price_and_fees(quantized_info),
+            float_fees.calculate_trade_price_and_fees(trade_info),
+        ):
+            _assert_matches_float_inputs(fixed_point_result, quantized_result, float_result)
+
+        _assert_matches_float_inputs(
+            *(
+                fees.propagate_original_bid_info_on_offer_trade(info).propagated_bid_rate
+                for fees, info in (
+                    (fixed_point_fees, trade_info),
+                    (quantized_fees, quantized_info),
+                    (float_fees, trade_info),
+                )
+            )
+        )
+        _assert_matches_float_inputs(
+            *(
+                fees.propagate_original_offer_info_on_bid_trade(
+                    info, ignore_fees
+                ).propagated_offer_rate
+                for fees, info in (
+                    (fixed_point_fees, trade_info),
+                    (quantized_fees, quantized_info),
+                    (float_fees, trade_info),
+                )
+            )
+        )
+        _assert_matches_float_inputs(
+            *(
+                fees.calculate_original_trade_rate_from_clearing_rate(
+                    info.original_bid_rate, info.propagated_bid_rate, info.trade_rate
+                )
+                for fees, info in (
+                    (fixed_point_fees, trade_info),
+                    (quantized_fees, quantized_info),
+                    (float_fees, trade_info),
+                )
+            )
+        )
@@ -165,3 +165,24 @@ class TestForwardMarkets:
             assert slot_info.opening_time == expected_open_time
             assert slot_info.closing_time == expected_delivery_time - closing_delivery_timedelta
             expected_delivery_time = expected_delivery_time + delivery_duration
+
+    @patch("gsy_e.models.market.forward.ConstSettings.ForwardMarketSettings."
+           "ENABLE_FORWARD_MARKETS", True)
+    def test_trader_orders_are_indexed_and_deleted_in_bulk(self):
+        forward_markets = self._create_forward_market(DayForwardMarket, create=True)
+        time_slots = list(forward_markets.slot_bid_mapping)[:2]
+        for time_slot in time_slots:
+            for buyer in ["buyer1", "buyer2"]:
+                bid = Bid(f"{buyer}{time_slot}", time_slot, 1, 1, TraderDetails(buyer, buyer),
+                          time_slot=time_slot)
+                forward_markets.bids[bid.id] = bid
+
+        assert [bid.id for bid in forward_markets.get_trader_bids(time_slots[0], "buyer1")] == [
+            f"buyer1{time_slots[0]}"]
+        assert forward_markets.bulk_delete_bids("buyer1", time_slots) == 2
+        assert all(not forward_markets.get_trader_bids(time_slot, "buyer1")
+                   for time_slot in time_slots)
+        assert all("buyer1" not in forward_markets.bids.slot_trader_order_mapping[time_slot]
+                   for time_slot in time_slots)
+        assert len(forward_markets.get_trader_bids(time_slots[1], "buyer2")) == 1
+        assert len(forward_markets.bids) == 2
@@ -44,6 +44,7 @@ from gsy_e.gsy_e_core.exceptions import (
 )
 from gsy_e.gsy_e_core.util import add_or_create_key, subtract_or_create_key
 from gsy_e.models.market.balancing import BalancingMarket
+from gsy_e.models.market.market_structures import OrderBook
 from gsy_e.models.market.one_sided import OneSidedMarket
 from gsy_e.models.market.settlement import SettlementMarket
 from gsy_e.models.market.two_sided import TwoSidedMarket
@@ -482,6 +483,42 @@ def test_market_sorted_offers(market, offer):
     assert [o.price for o in market.sorted_offers] == [1, 2, 3, 4, 5]
 
 
+def test_market_sorted_offers_are_cached_until_offers_change(market):
+    market.offer(5, 1, seller_details)
+    cheap_offer = market.offer(1, 1, seller_details)
+    sorted_offers = market.sorted_offers
+    assert market.sorted_offers is sorted_offers
+
+    market.offer(3, 1, seller_details)
+    assert [o.price for o in market.sorted_offers] == [1, 3, 5]
+    market.delete_offer(cheap_offer)
+    assert [o.price for o in market.sorted_offers] == [3, 5]
+    assert [o.price for o in sorted_offers] == [1, 5]
+
+
+def test_order_book_keeps_orders_in_rate_tiers():
+    order_book = OrderBook()
+    for order_id, price in [("id1", 3), ("id2", 1), ("id3", 2), ("id4", 1)]:
+        order_book[order_id] = Offer(order_id, now(), price, 1, seller_details)
+
+    assert [offer.id for offer in order_book.lowest_rate_orders()] == ["id2", "id4"]
+    assert [offer.id for offer in order_book.lowest_rate_orders(tolerance=1.5)] == [
+        "id2", "id4", "id3"]
+
+    visited_ids = []
+    for offer in order_book.iterate_rate_tiers():
+        visited_ids.append(offer.id)
+        # Accepting an offer while iterating replaces it with its residual
+        del order_book[offer.id]
+        order_book[f"{offer.id}_residual"] = Offer(
+            f"{offer.id}_residual", now(), offer.price, offer.energy, seller_details)
+    assert visited_ids == ["id2", "id4", "id3", "id1"]
+
+    order_book.clear()
+    assert order_book.lowest_rate_orders() == []
+    assert list(order_book.iterate_rate_tiers()) == []
+
+
 @pytest.mark.parametrize(
     "market, offer",
     [
@@ -506,6 +543,13 @@ def test_market_most_affordable_offers(market, offer):
     assert {o.price for o in market.most_affordable_offers} == {1, 10, 20, 20000}
 
 
+@pytest.mark.parametrize("offers", [OrderBook(), {}])
+def test_market_most_affordable_offers_without_offers(offers):
+    market = OneSidedMarket(bc=NonBlockchainInterface(str(uuid4())), time_slot=now())
+    market.offers = offers
+    assert market.most_affordable_offers == []
+
+
 @pytest.mark.parametrize(
     "market, offer",
     [(OneSidedMarket, "offer"), (BalancingMarket, "balancing_offer"), (SettlementMarket, "offer")],
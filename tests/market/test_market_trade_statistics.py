@@ -0,0 +1,65 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from statistics import mean, median
+
+import pytest
+from gsy_framework.data_classes import Trade, TraderDetails
+from hypothesis import given
+from hypothesis import strategies as st
+from pendulum import now
+
+from gsy_e.models.market.market_structures import MarketTradeStatistics, StreamingMedian
+
+
+def _trade(seller: str, buyer: str, energy: float, price: float) -> Trade:
+    return Trade("id", now(), TraderDetails(seller, ""), TraderDetails(buyer, ""),
+                 traded_energy=energy, trade_price=price)
+
+
+class TestMarketTradeStatistics:
+
+    @staticmethod
+    @given(st.lists(st.floats(min_value=-1000, max_value=1000), min_size=1))
+    def test_streaming_median_matches_statistics_median(values):
+        streaming_median = StreamingMedian()
+        for value in values:
+            streaming_median.add(value)
+        assert len(streaming_median) == len(values)
+        assert streaming_median.median == median(values)
+
+    @staticmethod
+    def test_streaming_median_is_none_without_values():
+        assert StreamingMedian().median is None
+
+    @staticmethod
+    def test_trade_statistics_are_updated_incrementally():
+        trades = [
+            _trade("MA House 1", "Grid", 2, 60),
+            _trade("House 2", "Grid", 1, 10),
+            _trade("Grid", "House 2", 4, 100),
+        ]
+        trade_stats = MarketTradeStatistics.from_trades(trades)
+        rates = [trade.trade_rate for trade in trades]
+        assert trade_stats.trade_count == 3
+        assert trade_stats.min_trade_rate == min(rates)
+        assert trade_stats.max_trade_rate == max(rates)
+        assert trade_stats.avg_trade_rate == pytest.approx(mean(rates))
+        assert trade_stats.median_trade_rate == median(rates)
+        assert trade_stats.total_traded_energy_kWh == 7
+        assert trade_stats.traded_energy_between({"House 1", "House 2"}, {"Grid"}) == 3
+        assert trade_stats.traded_energy_between({"Grid"}, {"House 1", "House 2"}) == 4
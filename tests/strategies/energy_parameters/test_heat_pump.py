@@ -4,10 +4,12 @@ from unittest.mock import Mock, patch
 
 import pytest
 from gsy_framework.constants_limits import GlobalConfig, TIME_ZONE
+from gsy_framework.enums import HeatPumpSourceType
 from gsy_framework.utils import generate_market_slot_list
 from pendulum import duration, today
 
 from gsy_e.models.strategy.energy_parameters.heatpump.cop_models import COPModelType
+from gsy_e.models.strategy.energy_parameters.heatpump.fleet import HeatPumpFleet
 from gsy_e.models.strategy.energy_parameters.heatpump.heat_pump import (
     HeatPumpEnergyParameters,
 )
@@ -85,6 +87,27 @@ def fixture_heatpump_energy_params_heat_profile() -> HeatPumpEnergyParameters:
     GlobalConfig.slot_length = original_slot_length
 
 
+def _create_water_tank_energy_params(
+    initial_temp_C, source_type, heat_demand_Q_profile=None
+) -> HeatPumpEnergyParameters:
+    return HeatPumpEnergyParameters(
+        maximum_power_rating_kW=30,
+        tank_parameters=[
+            WaterTankParameters(
+                min_temp_C=10,
+                max_temp_C=60,
+                initial_temp_C=initial_temp_C,
+                tank_volume_L=500,
+                loss_per_day_percent=2,
+            )
+        ],
+        source_temp_C_profile=12,
+        consumption_kWh_profile=2,
+        source_type=source_type,
+        heat_demand_Q_profile=heat_demand_Q_profile,
+    )
+
+
 class TestHeatPumpEnergyParameters:
 
     @staticmethod
@@ -276,3 +299,83 @@ class TestHeatPumpEnergyParameters:
         assert energy_params._bought_energy_kWh == 0
         assert energy_params._consumption_kWh.get_value(current_market_slot) == 5
         assert energy_params.combined_state._hp_state._energy_demand_kWh[current_market_slot] == 5
+
+    @staticmethod
+    @pytest.mark.usefixtures("energy_params")
+    def test_heat_pump_fleet_steps_heat_pumps_like_the_energy_parameters():
+        parameters = [
+            (20, HeatPumpSourceType.AIR.value, None),
+            (55, HeatPumpSourceType.GROUND.value, None),
+            (35, HeatPumpSourceType.AIR.value, 9000000),
+        ]
+        fleet = HeatPumpFleet()
+        fleet_members = [
+            _create_water_tank_energy_params(*member_parameters)
+            for member_parameters in parameters
+        ]
+        single_heat_pumps = [
+            _create_water_tank_energy_params(*member_parameters)
+            for member_parameters in parameters
+        ]
+        for fleet_member in fleet_members:
+            assert HeatPumpFleet.is_supported(fleet_member)
+            fleet.add(fleet_member)
+            fleet_member.event_activate()
+        for single_heat_pump in single_heat_pumps:
+            single_heat_pump.event_activate()
+
+        # All values that the fleet writes to the states of its heat pumps
+        tank_getters = ("get_storage_temp_C", "get_soc")
+        heat_pump_getters = (
+            "get_heat_demand_kJ",
+            "get_cop",
+            "get_min_energy_demand_kWh",
+            "get_energy_demand_kWh",
+            "get_max_energy_demand_kWh",
+            "get_energy_consumption_kWh",
+        )
+        last_slot_heat_pump_getters = ("get_net_heat_consumed_kJ", "get_cop")
+        for slot_index, traded_energy_kWh in enumerate([0, 3, 8, 0.5]):
+            time_slot = CURRENT_MARKET_SLOT + GlobalConfig.slot_length * slot_index
+            last_time_slot = time_slot - GlobalConfig.slot_length
+            fleet.event_market_cycle(time_slot)
+            fleet.event_market_cycle(time_slot)
+            for fleet_member, single_heat_pump in zip(fleet_members, single_heat_pumps):
+                single_heat_pump.event_market_cycle(time_slot)
+                assert fleet_member._bought_energy_kWh == single_heat_pump._bought_energy_kWh
+                tank_state = fleet_member._state._charger.tanks._tanks_states[0]
+                single_tank_state = single_heat_pump._state._charger.tanks._tanks_states[0]
+                for getter in tank_getters:
+                    assert isclose(
+                        getattr(tank_state, getter)(time_slot),
+                        getattr(single_tank_state, getter)(time_slot),
+                        abs_tol=1e-9,
+                    )
+                for getter, slot in [
+                    *((getter, time_slot) for getter in heat_pump_getters),
+                    *((getter, last_time_slot) for getter in last_slot_heat_pump_getters),
+                ]:
+                    assert isclose(
+                        getattr(fleet_member._state.heatpump, getter)(slot),
+                        getattr(single_heat_pump._state.heatpump, getter)(slot),
+                        abs_tol=1e-9,
+                    )
+                for heat_pump in (fleet_member, single_heat_pump):
+                    heat_pump.event_traded_energy(time_slot, traded_energy_kWh)
+
+    @staticmethod
+    @pytest.mark.usefixtures("energy_params")
+    def test_heat_pump_fleet_stops_stepping_removed_heat_pumps():
+        fleet = HeatPumpFleet()
+        kept_heat_pump = _create_water_tank_energy_params(20, HeatPumpSourceType.AIR.value)
+        removed_heat_pump = _create_water_tank_energy_params(20, HeatPumpSourceType.AIR.value)
+        for heat_pump in (kept_heat_pump, removed_heat_pump):
+            fleet.add(heat_pump)
+            heat_pump.event_activate()
+            heat_pump._rotate_profiles = Mock(wraps=heat_pump._rotate_profiles)
+
+        fleet.remove(removed_heat_pump)
+        assert len(fleet) == 1
+        fleet.event_market_cycle(CURRENT_MARKET_SLOT)
+        kept_heat_pump._rotate_profiles.assert_called_once_with(CURRENT_MARKET_SLOT)
+        removed_heat_pump._rotate_profiles.assert_not_called()
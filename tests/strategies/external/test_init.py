@@ -415,6 +415,63 @@ class TestExternalMixin:
         assert call_args["buyer"] == "anonymous"
         assert call_args["device_info"] == strategy._device_info_dict
 
+    @parameterized.expand(
+        [
+            [LoadHoursExternalStrategy(100)],
+            [PVExternalStrategy(2, capacity_kW=0.16)],
+            [StorageExternalStrategy()],
+        ]
+    )
+    @patch("gsy_e.constants.BATCH_EXTERNAL_TRADE_EVENTS", True)
+    def test_dispatch_batched_event_trade_to_external_agent(self, strategy):
+        strategy._track_energy_sell_type = lambda _: None
+        self._create_and_activate_strategy_area(strategy)
+        strategy.redis.aggregator.is_controlling_device = lambda _: False
+        market = self.area.get_future_market_from_id(1)
+        self.area._markets.markets = {1: market}
+        strategy.state._available_energy_kWh = {market.time_slot: 1000.0}
+        strategy.state.pledged_sell_kWh = {market.time_slot: 0.0}
+        strategy.state.offered_sell_kWh = {market.time_slot: 0.0}
+        trades = [
+            Trade(
+                trade_id,
+                now(),
+                TraderDetails("test_area", str(self.area.uuid)),
+                TraderDetails("parent_area", str(self.parent.uuid)),
+                offer=Offer(
+                    f"offer_{trade_id}",
+                    now(),
+                    20,
+                    1.0,
+                    TraderDetails("test_area", str(self.area.uuid)),
+                ),
+                traded_energy=1,
+                trade_price=20,
+            )
+            for trade_id in ("id1", "id2")
+        ]
+        for trade in trades:
+            strategy.event_offer_traded(market_id="test_market", trade=trade)
+        strategy.redis.publish_json.assert_not_called()
+
+        strategy._dispatch_event_tick_to_external_agent()
+        trade_calls = [
+            call
+            for call in strategy.redis.publish_json.call_args_list
+            if call[0][0] == "test_area/events/trade"
+        ]
+        assert len(trade_calls) == 1
+        call_args = trade_calls[0][0][1]
+        assert call_args["event"] == "trade"
+        assert call_args["area_uuid"] == strategy.device.uuid
+        assert call_args["device_info"] == strategy._device_info_dict
+        assert [trade_event["trade_id"] for trade_event in call_args["trade_list"]] == [
+            "id1",
+            "id2",
+        ]
+        assert call_args["trade_list"][1]["offer_id"] == "offer_id2"
+        assert strategy._trade_events_buffer == []
+
     @parameterized.expand(
         [
             [LoadHoursExternalStrategy(100)],
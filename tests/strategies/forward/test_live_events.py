@@ -176,3 +176,30 @@ class TestForwardLiveEvents:
         TestForwardLiveEvents._assert_order_count_from_strategy(
             strategy, AvailableMarketTypes.INTRADAY, 0)
         assert len(strategy._order_updaters.get(market, [])) == 0
+
+    @staticmethod
+    def test_enable_trading_event_replaces_open_orders_of_existing_updaters(
+            forward_strategy_fixture):
+        strategy = forward_strategy_fixture[0]
+        area = forward_strategy_fixture[1]
+        area.activate()
+        strategy.event_market_cycle()
+        enable_trading_event = {
+            "type": "enable_trading",
+            "args": {
+                "market_type": AvailableMarketTypes.INTRADAY.value,
+                "start_time": "2022-06-13T00:00",
+                "end_time": "2022-06-13T02:00",
+                "capacity_percent": 20.0,
+                "energy_rate": 30.0
+            }}
+        strategy.apply_live_event(enable_trading_event)
+        market = area.forward_markets[AvailableMarketTypes.INTRADAY]
+        strategy.remove_open_orders_on_slots = MagicMock(
+            wraps=strategy.remove_open_orders_on_slots)
+
+        strategy.apply_live_event(enable_trading_event)
+        strategy.remove_open_orders_on_slots.assert_called_once()
+        TestForwardLiveEvents._assert_order_count_from_strategy(
+            strategy, AvailableMarketTypes.INTRADAY, 7)
+        assert len(strategy._order_updaters.get(market, [])) == 7
@@ -2,6 +2,7 @@
 from math import isclose
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 from gsy_framework.constants_limits import GlobalConfig, DATE_TIME_FORMAT
 
@@ -44,8 +45,8 @@ class TestPCMTankState:
         # When
         pcm_tank.increase_tank_temp_from_heat_energy(heat_energy_kWh=1, time_slot=NEXT_MARKET_SLOT)
         # Then
-        assert pcm_tank._htf_temps_C[NEXT_MARKET_SLOT] == [40] * 5
-        assert pcm_tank._pcm_temps_C[NEXT_MARKET_SLOT] == [39] * 5
+        assert pcm_tank._htf_temps_C[NEXT_MARKET_SLOT].tolist() == [40] * 5
+        assert pcm_tank._pcm_temps_C[NEXT_MARKET_SLOT].tolist() == [39] * 5
         assert pcm_tank._soc.get(NEXT_MARKET_SLOT) == 0.6
         assert pcm_tank._condenser_temp_C.get(NEXT_MARKET_SLOT) == 45
 
@@ -62,23 +63,23 @@ class TestPCMTankState:
         # When
         pcm_tank.decrease_tank_temp_from_heat_energy(heat_energy_kWh=1, time_slot=NEXT_MARKET_SLOT)
         # Then
-        assert pcm_tank._htf_temps_C[NEXT_MARKET_SLOT] == [35] * 5
-        assert pcm_tank._pcm_temps_C[NEXT_MARKET_SLOT] == [36] * 5
+        assert pcm_tank._htf_temps_C[NEXT_MARKET_SLOT].tolist() == [35] * 5
+        assert pcm_tank._pcm_temps_C[NEXT_MARKET_SLOT].tolist() == [36] * 5
         assert pcm_tank._soc.get(NEXT_MARKET_SLOT) == 0.4
         assert pcm_tank._condenser_temp_C.get(NEXT_MARKET_SLOT) == 40
 
     def test_no_charge_correctly_updates_storage_temp_and_soc(self, pcm_tank):
         # Given
         pcm_tank._soc[CURRENT_MARKET_SLOT] = 0.4
-        pcm_tank._htf_temps_C[CURRENT_MARKET_SLOT] = [37] * 5
-        pcm_tank._pcm_temps_C[CURRENT_MARKET_SLOT] = [36] * 5
+        pcm_tank._htf_temps_C[CURRENT_MARKET_SLOT] = np.array([37] * 5)
+        pcm_tank._pcm_temps_C[CURRENT_MARKET_SLOT] = np.array([36] * 5)
         pcm_tank._pcm_charge_model.get_soc = Mock(return_value=0.5)
         # When
         pcm_tank.no_charge(time_slot=NEXT_MARKET_SLOT)
         # Then
         assert pcm_tank._soc.get(NEXT_MARKET_SLOT) == 0.5
-        assert pcm_tank._htf_temps_C.get(NEXT_MARKET_SLOT) == [37] * 5
-        assert pcm_tank._pcm_temps_C.get(NEXT_MARKET_SLOT) == [37] * 5
+        assert pcm_tank._htf_temps_C.get(NEXT_MARKET_SLOT).tolist() == [37] * 5
+        assert pcm_tank._pcm_temps_C.get(NEXT_MARKET_SLOT).tolist() == [37] * 5
         assert pcm_tank._condenser_temp_C.get(NEXT_MARKET_SLOT) == 37
 
     @pytest.mark.parametrize("heat_demand_kJ, expected_energy_kJ", [[5000, 5100], [0, 100]])
@@ -127,8 +128,10 @@ class TestPCMTankState:
         # When
         pcm_tank.init()
         # Then
-        assert pcm_tank._htf_temps_C == {CURRENT_MARKET_SLOT: [37] * 5}
-        assert pcm_tank._pcm_temps_C == {CURRENT_MARKET_SLOT: [37] * 5}
+        assert list(pcm_tank._htf_temps_C) == [CURRENT_MARKET_SLOT]
+        assert pcm_tank._htf_temps_C[CURRENT_MARKET_SLOT].tolist() == [37] * 5
+        assert list(pcm_tank._pcm_temps_C) == [CURRENT_MARKET_SLOT]
+        assert pcm_tank._pcm_temps_C[CURRENT_MARKET_SLOT].tolist() == [37] * 5
         assert pcm_tank._soc == {CURRENT_MARKET_SLOT: 0.5}
 
     def test_get_htf_temp_C_returns_correct_value(self, pcm_tank):
@@ -143,6 +146,15 @@ class TestPCMTankState:
         pcm_tank._pcm_temps_C = {CURRENT_MARKET_SLOT: [1, 2, 3, 4, 5]}
         assert pcm_tank.get_pcm_temp_C(CURRENT_MARKET_SLOT) == 3
 
+    def test_temps_are_limited_to_the_tank_temperature_range(self, pcm_tank):
+        pcm_tank._pcm_charge_model.get_temp_after_charging = Mock(
+            return_value=([30, 35, 40, 45, 50], [31, 36, 41, 46, 51])
+        )
+        pcm_tank._increase_storage_temp_from_condenser_temp(42, NEXT_MARKET_SLOT)
+        assert pcm_tank._htf_temps_C[NEXT_MARKET_SLOT].tolist() == [32, 35, 40, 42, 42]
+        assert pcm_tank._pcm_temps_C[NEXT_MARKET_SLOT].tolist() == [32, 36, 41, 42, 42]
+        assert pcm_tank.get_htf_temp_C(NEXT_MARKET_SLOT) == 38.2
+
     def test_get_results_dict_returns_correct_values(self, pcm_tank):
         assert pcm_tank.get_results_dict(CURRENT_MARKET_SLOT) == {
             "soc": 50.0,
@@ -175,8 +187,10 @@ class TestPCMTankState:
             }
         )
 
-        assert pcm_tank._htf_temps_C == {CURRENT_MARKET_SLOT: [50] * 5}
-        assert pcm_tank._pcm_temps_C == {CURRENT_MARKET_SLOT: [50] * 5}
+        assert list(pcm_tank._htf_temps_C) == [CURRENT_MARKET_SLOT]
+        assert pcm_tank._htf_temps_C[CURRENT_MARKET_SLOT].tolist() == [50] * 5
+        assert list(pcm_tank._pcm_temps_C) == [CURRENT_MARKET_SLOT]
+        assert pcm_tank._pcm_temps_C[CURRENT_MARKET_SLOT].tolist() == [50] * 5
         assert pcm_tank._soc == {CURRENT_MARKET_SLOT: 0.5}
         assert pcm_tank._params.min_temp_C == 0.0
         assert pcm_tank._params.max_temp_C == 100
@@ -185,13 +199,13 @@ class TestPCMTankState:
 
     def test_event_market_cycle_applies_losses(self, pcm_tank):
         # Given
-        pcm_tank._htf_temps_C[CURRENT_MARKET_SLOT] = [40] * 5
-        pcm_tank._pcm_temps_C[CURRENT_MARKET_SLOT] = [50] * 5
+        pcm_tank._htf_temps_C[CURRENT_MARKET_SLOT] = np.array([40] * 5)
+        pcm_tank._pcm_temps_C[CURRENT_MARKET_SLOT] = np.array([50] * 5)
         pcm_tank._params.loss_per_day_percent = 96  # = 1% per market slot
 
         # When
         pcm_tank.event_market_cycle(NEXT_MARKET_SLOT)
 
         # Then
-        assert pcm_tank._pcm_temps_C[CURRENT_MARKET_SLOT] == [49.5] * 5
-        assert pcm_tank._htf_temps_C[CURRENT_MARKET_SLOT] == [40] * 5
+        assert pcm_tank._pcm_temps_C[CURRENT_MARKET_SLOT].tolist() == [49.5] * 5
+        assert pcm_tank._htf_temps_C[CURRENT_MARKET_SLOT].tolist() == [40] * 5
@@ -2,6 +2,7 @@
 import math
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 from gsy_framework.constants_limits import ConstSettings, GlobalConfig
 from gsy_framework.enums import AvailableMarketTypes
 from pendulum import UTC, duration, today
@@ -74,6 +75,19 @@ class TestSorTesPerformanceMaps:
         powers = [SorTesPerformanceMaps.get_power_discharging(t) for t in range(5, 26, 5)]
         assert all(powers[i] < powers[i + 1] for i in range(len(powers) - 1))
 
+    def test_performance_tables_are_shared_between_identical_maps(self):
+        table = SorTesPerformanceMaps.get_table(dict(SorTesPerformanceMaps.CHARGING_POWER_MAP))
+        assert table is SorTesPerformanceMaps.get_charging_table()
+        assert table is not SorTesPerformanceMaps.get_discharging_table()
+
+    def test_get_powers_evaluates_batches_of_temperatures(self):
+        temperatures = [0, 5, 12.5, 45, 50]
+        powers = SorTesPerformanceMaps.get_charging_table().get_powers(np.array(temperatures))
+        assert np.allclose(
+            powers, [SorTesPerformanceMaps.get_power_charging(t) for t in temperatures]
+        )
+        assert np.allclose(powers[1:4], [3.8, 3.4, 0.5])
+
 
 class TestSorTesTankMinimiseSwitchStrategy:
 
@@ -462,3 +462,40 @@ def test_charging_efficiency_applies_losses(area_test1):
     assert isclose(distribution[sessions[0].session_id], 9.5, rel_tol=1e-03)
     expected_energy = 20.0 + 9.5  # started at 20 kWh
     assert isclose(sessions[0].current_energy_kWh, expected_energy, rel_tol=1e-03)
+
+
+def test_active_sessions_are_looked_up_in_interval_index(area_test1):
+    # Given
+    now = DateTime.now(tz=TIME_ZONE).start_of("day")
+    long_session = EVChargingSession(plug_in_time=now, duration_minutes=600)
+    short_session = EVChargingSession(plug_in_time=now.add(hours=1), duration_minutes=60)
+    strategy = EVChargerStrategy(
+        maximum_power_rating_kW=10.0,
+        charging_sessions=[short_session, long_session],
+    )
+    strategy.owner = area_test1
+    strategy.area = area_test1
+    strategy.event_activate()
+    manager = strategy.state.ev_sessions_manager
+
+    # When/Then
+    assert manager.get_active_sessions(now.add(hours=1)) == [long_session, short_session]
+    assert manager.get_active_sessions(now.add(hours=2)) == [long_session]
+    assert manager.get_active_sessions(now.add(hours=10)) == []
+
+    late_session = EVChargingSession(plug_in_time=now.add(hours=12), duration_minutes=60)
+    manager.add_session(late_session)
+    assert manager.get_active_sessions(now.add(hours=12)) == [late_session]
+
+    strategy.area_reconfigure_event(
+        charging_sessions=[
+            long_session,
+            {"plug_in_time": now.add(hours=3).isoformat(), "duration_minutes": 30},
+        ]
+    )
+    assert manager.sessions is strategy.charging_sessions
+    assert manager.get_active_sessions(now.add(hours=1)) == [long_session]
+    assert manager.get_active_sessions(now.add(hours=12)) == []
+    active_sessions = manager.get_active_sessions(now.add(hours=3))
+    assert len(active_sessions) == 2
+    assert active_sessions[1].plug_in_time == now.add(hours=3)
@@ -34,6 +34,7 @@ from gsy_e.gsy_e_core.device_registry import DeviceRegistry
 from gsy_e.gsy_e_core.util import gsye_root_path
 from gsy_e.models.area import Area
 from gsy_e.models.config import create_simulation_config_from_global_config
+from gsy_e.models.strategy.energy_parameters.load import LoadHoursEnergyParameters
 from gsy_e.models.strategy.load_hours import LoadHoursStrategy
 from gsy_e.models.strategy.predefined_load import DefinedLoadStrategy
 
@@ -776,3 +777,19 @@ def test_event_offer_traded_calls_settlement_market_event_offer_traded(load_hour
     )
     load_hours_fixture.event_offer_traded(market_id="not existing", trade=trade)
     load_hours_fixture._settlement_market_strategy.event_offer_traded.assert_called_once()
+
+
+def test_energy_requirements_are_updated_for_all_time_slots_at_once():
+    energy_params = LoadHoursEnergyParameters(avg_power_W=400, hrs_of_day=[8, 9, 20])
+    energy_params.event_activate_energy(FakeArea())
+    time_slots = [TIME.start_of("day").add(hours=hour) for hour in range(24)]
+    energy_params.update_energy_requirements(time_slots)
+
+    slot_length = energy_params._area.config.slot_length
+    assert energy_params.energy_per_slot_Wh == 400 * slot_length.total_seconds() / 3600
+    for time_slot in time_slots:
+        expected_energy_Wh = (
+            energy_params.energy_per_slot_Wh if time_slot.hour in [8, 9, 20] else 0.0
+        )
+        assert energy_params.allowed_operating_hours(time_slot) is (time_slot.hour in [8, 9, 20])
+        assert energy_params.state.get_desired_energy_Wh(time_slot) == expected_energy_Wh
@@ -17,6 +17,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 # pylint: disable=missing-function-docstring,protected-access
+import math
 import os
 import uuid
 from typing import Dict  # NOQA
@@ -33,6 +34,8 @@ from parameterized import parameterized
 
 from gsy_e.gsy_e_core.util import gsye_root_path
 from gsy_e.models.config import create_simulation_config_from_global_config
+from gsy_e.models.strategy.energy_parameters.daily_profiles import gaussian_pv_daily_profile_kWh
+from gsy_e.models.strategy.energy_parameters.pv import PVEnergyParameters
 from gsy_e.models.strategy.predefined_pv import PVPredefinedStrategy, PVUserProfileStrategy
 from gsy_e.models.strategy.pv import PVStrategy
 
@@ -679,3 +682,30 @@ def test_set_energy_measurement_of_last_market(utils_mock, pv_strategy):
     pv_strategy.state.set_energy_measurement_kWh.assert_called_once_with(
         100, pv_strategy.area.current_market.time_slot
     )
+
+
+def test_produced_energy_forecasts_scale_the_shared_daily_profile():
+    slot_length = pendulum.duration(minutes=15)
+    time_slots = [
+        pendulum.datetime(2024, 6, 1) + slot_length * slot_index for slot_index in range(2 * 96)
+    ]
+    small_pv = PVEnergyParameters(panel_count=1, capacity_kW=2)
+    large_pv = PVEnergyParameters(panel_count=3, capacity_kW=5)
+    small_pv.set_produced_energy_forecasts(time_slots, slot_length)
+    large_pv.set_produced_energy_forecasts(time_slots, slot_length)
+
+    assert gaussian_pv_daily_profile_kWh(slot_length) is gaussian_pv_daily_profile_kWh(
+        pendulum.duration(minutes=15)
+    )
+    for time_slot in time_slots:
+        minutes = time_slot.hour * 60 + time_slot.minute
+        power_kW = (
+            math.exp(-((((round(minutes / 5, 0)) - 147.2) / 38.60) ** 2))
+            if 8 * 60 <= minutes <= 16.5 * 60
+            else 0
+        )
+        for pv, capacity_kW, panel_count in ((small_pv, 2, 1), (large_pv, 5, 3)):
+            assert math.isclose(
+                pv._state.get_energy_production_forecast_kWh(time_slot),
+                round(capacity_kW * power_kW * 0.25, 4) * panel_count,
+            )
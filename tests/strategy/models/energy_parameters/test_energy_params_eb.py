@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock
 
 import pendulum
 import pytest
@@ -43,22 +43,16 @@ class TestConsumptionStandardProfileEnergyParameters:
             market_slot=market_slot,
             product_type=product_type)
 
-        assert state_mock.decrement_energy_requirement.call_count == 4
-
-        area_name = "Load"
-        # We want to make sure that all the expected calls to the state class are correctly issued
-        calls = [
-            call(purchased_energy_Wh=50000, area_name=area_name,
-                 time_slot=pendulum.datetime(2022, 2, 1, 12, 0)),
-            call(purchased_energy_Wh=50000, area_name=area_name,
-                 time_slot=pendulum.datetime(2022, 2, 1, 12, 15)),
-            call(purchased_energy_Wh=50000, area_name=area_name,
-                 time_slot=pendulum.datetime(2022, 2, 1, 12, 30)),
-            call(purchased_energy_Wh=50000, area_name=area_name,
-                 time_slot=pendulum.datetime(2022, 2, 1, 12, 45)),
-        ]
-
-        state_mock.decrement_energy_requirement.assert_has_calls(calls)
+        # All the slots of the trade are decremented with one call to the state class
+        state_mock.decrement_energy_requirement_profile.assert_called_once_with(
+            purchased_energy_profile_Wh={
+                pendulum.datetime(2022, 2, 1, 12, 0): 50000,
+                pendulum.datetime(2022, 2, 1, 12, 15): 50000,
+                pendulum.datetime(2022, 2, 1, 12, 30): 50000,
+                pendulum.datetime(2022, 2, 1, 12, 45): 50000,
+            },
+            area_name="Load",
+        )
 
 
 @pytest.fixture(name="pv")
@@ -88,19 +82,13 @@ class TestProductionStandardProfileEnergyParameters:
             market_slot=market_slot,
             product_type=product_type)
 
-        assert state_mock.decrement_available_energy.call_count == 4
-
-        area_name = "PV"
-        # We want to make sure that all the expected calls to the state class are correctly issued
-        calls = [
-            call(sold_energy_kWh=50, area_name=area_name,
-                 time_slot=pendulum.datetime(2022, 2, 1, 12, 0)),
-            call(sold_energy_kWh=50, area_name=area_name,
-                 time_slot=pendulum.datetime(2022, 2, 1, 12, 15)),
-            call(sold_energy_kWh=50, area_name=area_name,
-                 time_slot=pendulum.datetime(2022, 2, 1, 12, 30)),
-            call(sold_energy_kWh=50, area_name=area_name,
-                 time_slot=pendulum.datetime(2022, 2, 1, 12, 45))
-        ]
-
-        state_mock.decrement_available_energy.assert_has_calls(calls)
+        # All the slots of the trade are decremented with one call to the state class
+        state_mock.decrement_available_energy_profile.assert_called_once_with(
+            sold_energy_profile_kWh={
+                pendulum.datetime(2022, 2, 1, 12, 0): 50,
+                pendulum.datetime(2022, 2, 1, 12, 15): 50,
+                pendulum.datetime(2022, 2, 1, 12, 30): 50,
+                pendulum.datetime(2022, 2, 1, 12, 45): 50,
+            },
+            area_name="PV",
+        )
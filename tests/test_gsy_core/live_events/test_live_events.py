@@ -133,12 +133,35 @@ class TestLiveEvents:
             "eventType": "delete_area",
             "area_uuid": self.area1.uuid
         }
+        self.strategy_load.event_area_deleted = Mock()
 
         self.live_events.add_event(event_dict)
         self.live_events.handle_all_events(self.area_grid)
 
         assert len(self.area_house1.children) == 1
         assert all(c.uuid != self.area1.uuid for c in self.area_house1.children)
+        self.strategy_load.event_area_deleted.assert_called_once_with()
+
+    def test_bulk_live_events_are_applied_in_order_via_uuid_lookups(self):
+        self.live_events.add_event({"eventType": "delete_area", "area_uuid": self.area1.uuid})
+        self.live_events.add_event({"eventType": "delete_area", "area_uuid": self.area2.uuid})
+        self.live_events.add_event({
+            "eventType": "create_area",
+            "parent_uuid": self.area_house1.uuid,
+            "area_representation": {"type": "LoadHours", "name": "new_load"}})
+        self.live_events.add_event({"eventType": "delete_area", "area_uuid": self.area3.uuid})
+        self.live_events.handle_all_events(self.area_grid)
+
+        assert [c.name for c in self.area_house1.children] == ["new_load"]
+        assert [c.name for c in self.area_house2.children] == ["smart meter"]
+        new_load = self.area_house1.children[0]
+        assert self.live_events._area_index[new_load.uuid] is new_load
+        assert self.area1.uuid not in self.live_events._area_index
+
+        # Areas created by a previous batch can be found by the following batches
+        self.live_events.add_event({"eventType": "delete_area", "area_uuid": new_load.uuid})
+        self.live_events.handle_all_events(self.area_grid)
+        assert len(self.area_house1.children) == 0
 
     def test_update_area_event(self):
         """The UpdateAreaEvent tries to update an area when the passed area is valid."""
@@ -0,0 +1,64 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+# pylint: disable=protected-access
+import json
+
+import pytest
+
+from gsy_e.gsy_e_core.benchmark import (
+    BenchmarkCase, _aggregate_tick_profile, _configure_market_type, compare_benchmark_reports)
+
+
+def _report(wall_time_per_tick_ms, peak_rss_mb, houses=10):
+    case = BenchmarkCase(houses=houses, market_type="two-sided")
+    return {"results": [{"case": {"name": case.name},
+                         "wall_time_per_tick_ms": wall_time_per_tick_ms,
+                         "peak_rss_mb": peak_rss_mb}]}
+
+
+class TestBenchmark:
+
+    @staticmethod
+    def test_case_name_is_stable():
+        assert BenchmarkCase(houses=100, market_type="forward", slots=8).name == (
+            "forward-100-houses-8-slots")
+
+    @staticmethod
+    def test_compare_benchmark_reports_returns_relative_changes():
+        comparison = compare_benchmark_reports(_report(10.0, 200.0), _report(12.0, 100.0))
+        assert comparison == {"two-sided-10-houses-4-slots": {
+            "wall_time_per_tick_ms": pytest.approx(0.2), "peak_rss_mb": pytest.approx(-0.5)}}
+
+    @staticmethod
+    def test_compare_benchmark_reports_skips_cases_missing_from_baseline():
+        assert compare_benchmark_reports(_report(10.0, 200.0), _report(12.0, 100.0, 20)) == {}
+
+    @staticmethod
+    def test_aggregate_tick_profile_sums_slot_summaries(tmp_path):
+        profile_path = tmp_path / "tick_profile.jsonl"
+        slot_summary = {"phases": {"tick_and_dispatch": {"total_s": 1.5}},
+                        "markets": {"Market": 0.5}}
+        profile_path.write_text(json.dumps(slot_summary) + "\n" + json.dumps(slot_summary) + "\n")
+        assert _aggregate_tick_profile(str(profile_path)) == {
+            "phases": {"tick_and_dispatch": 3.0}, "markets": {"Market": 1.0}}
+
+    @staticmethod
+    def test_configure_market_type_rejects_unknown_types():
+        with pytest.raises(ValueError):
+            _configure_market_type("balancing")
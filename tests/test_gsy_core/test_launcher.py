@@ -0,0 +1,55 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+# pylint: disable=protected-access
+from unittest.mock import MagicMock, patch
+
+from gsy_e.gsy_e_core.launcher import PREFORKED_WORKER_PRELOAD_MODULES, Launcher
+
+
+class TestLauncher:
+
+    @staticmethod
+    @patch("gsy_e.gsy_e_core.launcher.Popen")
+    def test_start_worker_starts_new_interpreter_if_preforked_workers_are_disabled(popen_mock):
+        launcher = Launcher(use_preforked_workers=False)
+        assert launcher._worker_context is None
+        worker = launcher._start_worker()
+        popen_mock.assert_called_once()
+        assert worker is popen_mock.return_value
+
+    @staticmethod
+    @patch("gsy_e.gsy_e_core.launcher.Popen")
+    @patch("gsy_e.gsy_e_core.launcher.multiprocessing.get_context")
+    def test_start_worker_forks_from_preloaded_fork_server(get_context_mock, popen_mock):
+        launcher = Launcher(use_preforked_workers=True)
+        context = get_context_mock.return_value
+        get_context_mock.assert_called_once_with("forkserver")
+        context.set_forkserver_preload.assert_called_once_with(PREFORKED_WORKER_PRELOAD_MODULES)
+
+        worker = launcher._start_worker()
+
+        popen_mock.assert_not_called()
+        assert worker is context.Process.return_value
+        worker.start.assert_called_once()
+
+    @staticmethod
+    def test_is_worker_running_supports_processes():
+        process = MagicMock()
+        process.is_alive.return_value = False
+        assert Launcher._is_worker_running(process) is False
@@ -0,0 +1,62 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from gsy_e.gsy_e_core.random_streams import RandomStreams
+
+
+class TestRandomStreams:
+
+    @staticmethod
+    def test_streams_are_reproducible_and_independent_of_call_order():
+        streams = RandomStreams(seed=1)
+        first_house = [streams.get("Grid/House 1").random() for _ in range(3)]
+        streams.get("Grid/House 2").random()
+
+        other_streams = RandomStreams(seed=1)
+        other_streams.get("Grid/House 2").random()
+        assert [other_streams.get("Grid/House 1").random() for _ in range(3)] == first_house
+
+    @staticmethod
+    def test_set_seed_restarts_the_streams():
+        streams = RandomStreams(seed=1)
+        value = streams.get("Grid").random()
+        assert streams.get("Grid").random() != value
+        streams.set_seed(1)
+        assert streams.get("Grid").random() == value
+        streams.set_seed(2)
+        assert streams.get("Grid").random() != value
+
+    @staticmethod
+    def test_shuffled_returns_a_permutation_without_modifying_the_input():
+        streams = RandomStreams(seed=3)
+        items = list(range(20))
+        shuffled_items = streams.shuffled("Grid", items)
+        assert items == list(range(20))
+        assert sorted(shuffled_items) == items
+        assert shuffled_items != items
+
+    @staticmethod
+    def test_state_can_be_restored():
+        streams = RandomStreams(seed=5)
+        streams.get("Grid").random()
+        state = streams.get_state()
+        expected = [streams.get("Grid").random() for _ in range(3)]
+
+        restored_streams = RandomStreams()
+        restored_streams.set_state(state)
+        assert [restored_streams.get("Grid").random() for _ in range(3)] == expected
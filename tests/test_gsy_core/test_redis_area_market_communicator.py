@@ -111,3 +111,54 @@ class TestExternalConnectionCommunicator:
         enabled_communicator.publish_aggregator_commands_responses_events()
         enabled_communicator.aggregator.publish_all_commands_responses.assert_called_once()
         enabled_communicator.aggregator.publish_all_events.assert_called_once()
+
+
+class TestAggregatorHandler:
+
+    @staticmethod
+    @patch("gsy_e.gsy_e_core.redis_connections.aggregator.global_objects")
+    def test_trade_events_refresh_grid_tree_once_per_publish(global_objects_mock):
+        # pylint: disable=protected-access
+        aggregator_handler = AggregatorHandler(Mock(spec=Redis))
+        aggregator_handler.set_aggregator_device_mapping({"aggr": ["device1", "device2"]})
+        aggregator_handler._create_grid_tree_event_dict = Mock(return_value={"grid_tree": {}})
+        aggregator_handler._publish_all_events_from_one_type = Mock()
+
+        aggregator_handler.add_batch_trade_event("device1", {"trade_id": "t1"})
+        aggregator_handler.add_batch_trade_event("device2", {"trade_id": "t2"})
+        aggregator_handler._create_grid_tree_event_dict.assert_not_called()
+
+        aggregator_handler.publish_all_events(Mock())
+        global_objects_mock.external_global_stats.refresh_if_stale.assert_called_once()
+        aggregator_handler._create_grid_tree_event_dict.assert_called_once_with("aggr")
+        assert aggregator_handler.batch_trade_events["aggr"] == {
+            "trade_list": [{"trade_id": "t1"}, {"trade_id": "t2"}],
+            "grid_tree": {},
+        }
+
+    @staticmethod
+    def test_grid_tree_view_only_contains_owned_devices():
+        # pylint: disable=protected-access
+        aggregator_handler = AggregatorHandler(Mock(spec=Redis))
+        aggregator_handler.set_aggregator_device_mapping({"aggr1": ["d1"], "aggr2": ["d2", "d3"]})
+        grid_tree = {"root": {"area_name": "root", "last_market_fee": 1, "children": {
+            "h1": {"area_name": "h1", "children": {
+                "d1": {"area_name": "d1", "asset_info": 1},
+                "d2": {"area_name": "d2", "asset_info": 2}}},
+            "h2": {"area_name": "h2", "children": {
+                "d3": {"area_name": "d3", "asset_info": 3}}}}}}
+        aggregator_handler._update_anonymized_grid_tree(grid_tree, 1)
+
+        view = aggregator_handler._create_grid_tree_view(
+            grid_tree, aggregator_handler._anonymized_grid_tree,
+            aggregator_handler._get_owned_paths("aggr1"))
+        assert view == {"root": {"area_name": "root", "last_market_fee": 1, "children": {
+            "h1": {"area_name": "h1", "children": {
+                "d1": {"area_name": "d1", "asset_info": 1},
+                "d2": {"area_name": "d2"}}},
+            "h2": {"area_name": "h2", "children": {"d3": {"area_name": "d3"}}}}}}
+        # Subtrees without owned devices are shared with the anonymized tree
+        assert (view["root"]["children"]["h2"] is
+                aggregator_handler._anonymized_grid_tree["root"]["children"]["h2"])
+        # The input tree is not modified
+        assert grid_tree["root"]["children"]["h1"]["children"]["d2"]["asset_info"] == 2
@@ -22,6 +22,8 @@ class TestRqJobHandler:
         self.original_sertsvr = gsy_e.constants.SEND_EVENTS_RESPONSES_TO_SDK_VIA_RQ
         self.original_connect_to_profiles_db = gsy_e.constants.CONNECT_TO_PROFILES_DB
         self.original_config_id = gsy_e.constants.CONFIGURATION_ID
+        self.original_batch_external_trade_events = gsy_e.constants.BATCH_EXTERNAL_TRADE_EVENTS
+        self.original_batch_heat_pump_fleet = gsy_e.constants.BATCH_HEAT_PUMP_FLEET
         self.original_start_date = GlobalConfig.start_date
         self.original_slot_length = GlobalConfig.slot_length
 
@@ -34,6 +36,8 @@ class TestRqJobHandler:
         gsy_e.constants.SEND_EVENTS_RESPONSES_TO_SDK_VIA_RQ = self.original_sertsvr
         gsy_e.constants.CONNECT_TO_PROFILES_DB = self.original_connect_to_profiles_db
         gsy_e.constants.CONFIGURATION_ID = self.original_config_id
+        gsy_e.constants.BATCH_EXTERNAL_TRADE_EVENTS = self.original_batch_external_trade_events
+        gsy_e.constants.BATCH_HEAT_PUMP_FLEET = self.original_batch_heat_pump_fleet
         ConstSettings.SCMSettings.MARKET_ALGORITHM = CoefficientAlgorithm.STATIC.value
         ConstSettings.SCMSettings.INTRACOMMUNITY_BASE_RATE_EUR = None
         ConstSettings.SCMSettings.GRID_FEES_REDUCTION = 0.28
@@ -97,6 +101,28 @@ class TestRqJobHandler:
         assert ConstSettings.MASettings.BID_OFFER_MATCH_TYPE == 2
         assert ConstSettings.SCMSettings.SELF_CONSUMPTION_TYPE == 1
 
+    @staticmethod
+    @patch("gsy_e.gsy_e_core.rq_job_handler.run_simulation", Mock())
+    def test_batch_external_trade_events_is_set_from_the_settings():
+        settings = {
+            "type": ConfigurationType.COLLABORATION.value,
+            "batch_external_trade_events": True,
+        }
+        scenario = {"configuration_uuid": "config_uuid"}
+        launch_simulation_from_rq_job(scenario, settings, None, {}, {}, {}, "id")
+        assert gsy_e.constants.BATCH_EXTERNAL_TRADE_EVENTS is True
+
+    @staticmethod
+    @patch("gsy_e.gsy_e_core.rq_job_handler.run_simulation", Mock())
+    def test_batch_heat_pump_fleet_is_set_from_the_settings():
+        settings = {
+            "type": ConfigurationType.COLLABORATION.value,
+            "batch_heat_pump_fleet": True,
+        }
+        scenario = {"configuration_uuid": "config_uuid"}
+        launch_simulation_from_rq_job(scenario, settings, None, {}, {}, {}, "id")
+        assert gsy_e.constants.BATCH_HEAT_PUMP_FLEET is True
+
     @staticmethod
     @patch("gsy_e.gsy_e_core.rq_job_handler.run_simulation")
     def test_past_market_slots_handles_settings_correctly(run_sim_mock: Mock):
@@ -0,0 +1,94 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+# pylint: disable=protected-access
+import csv
+from unittest.mock import MagicMock, Mock, patch
+
+from gsy_framework.constants_limits import TIME_ZONE, GlobalConfig
+from pendulum import duration, today
+
+from gsy_e.gsy_e_core.simulation.sweep import (
+    SimulationSweepRunner, SweepConfiguration, write_sweep_results_csv)
+from gsy_e.models.config import SimulationConfig
+
+
+class TestSweepConfiguration:
+
+    @staticmethod
+    def _create_area_tree():
+        load = MagicMock(children=[], strategy=MagicMock())
+        load.name = "Load"
+        house = MagicMock(children=[load], strategy=None)
+        house.name = "House 1"
+        grid = MagicMock(children=[house], strategy=None)
+        grid.name = "Grid"
+        return grid, house, load
+
+    def test_apply_sets_fees_on_markets_and_params_on_named_areas(self):
+        grid, house, load = self._create_area_tree()
+        simulation = MagicMock(area=grid)
+        configuration = SweepConfiguration(
+            name="run", seed=3, grid_fee_constant=2.0,
+            area_params={"Load": {"final_buying_rate": 28}})
+
+        configuration.apply(simulation)
+
+        simulation._setup._set_random_seed.assert_called_once_with(3)
+        grid.area_reconfigure_event.assert_called_once_with(grid_fee_constant=2.0)
+        house.area_reconfigure_event.assert_called_once_with(grid_fee_constant=2.0)
+        load.area_reconfigure_event.assert_called_once_with(final_buying_rate=28)
+
+    @staticmethod
+    def test_as_dict_flattens_area_params():
+        configuration = SweepConfiguration(
+            name="run", seed=3, area_params={"Load": {"final_buying_rate": 28}})
+        assert configuration.as_dict() == {
+            "name": "run", "seed": 3, "grid_fee_constant": None, "Load.final_buying_rate": 28}
+
+
+class TestSimulationSweepRunner:
+
+    @staticmethod
+    def teardown_method() -> None:
+        GlobalConfig.sim_duration = duration(days=GlobalConfig.DURATION_D)
+        GlobalConfig.slot_length = duration(minutes=GlobalConfig.SLOT_LENGTH_M)
+        GlobalConfig.tick_length = duration(seconds=GlobalConfig.TICK_LENGTH_S)
+
+    @staticmethod
+    @patch("gsy_e.gsy_e_core.simulation.external_events.SimulationExternalEvents", Mock())
+    def test_run_returns_one_row_per_configuration(tmp_path):
+        simulation_config = SimulationConfig(duration(hours=2),
+                                             duration(minutes=60),
+                                             duration(seconds=60),
+                                             start_date=today(tz=TIME_ZONE),
+                                             external_connection_enabled=False)
+        runner = SimulationSweepRunner(
+            "default_2a", simulation_config, max_workers=2,
+            result_extractor=lambda sim: {"slot": sim.progress_info.current_slot_number})
+        configurations = [SweepConfiguration(name=f"seed_{seed}", seed=seed) for seed in (1, 2)]
+
+        rows = runner.run(configurations)
+
+        assert [row["name"] for row in rows] == ["seed_1", "seed_2"]
+        assert all(row["slot"] == 1 and "error" not in row for row in rows)
+
+        csv_path = tmp_path / "sweep.csv"
+        write_sweep_results_csv(rows, str(csv_path))
+        with open(csv_path, encoding="utf-8") as csv_file:
+            assert [row["name"] for row in csv.DictReader(csv_file)] == ["seed_1", "seed_2"]
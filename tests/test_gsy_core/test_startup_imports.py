@@ -0,0 +1,42 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+class TestStartupImports:
+
+    @staticmethod
+    @pytest.mark.parametrize("heavy_module", ["sympy", "plotly"])
+    def test_cli_does_not_import_heavy_modules(heavy_module):
+        # Run in a new interpreter, the modules might have been imported by other tests
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; import gsy_e.gsy_e_core.cli; "
+                f"print({heavy_module!r} in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
@@ -0,0 +1,95 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import json
+
+from pendulum import datetime
+
+from gsy_e.gsy_e_core.tick_profiler import (
+    AREA_CATEGORY, MARKET_CATEGORY, STRATEGY_CATEGORY, TickProfiler, market_profile_key)
+from gsy_e.models.area import Area
+from gsy_e.models.market.one_sided import OneSidedMarket
+
+
+class TestTickProfiler:
+
+    @staticmethod
+    def test_disabled_profiler_records_nothing():
+        profiler = TickProfiler()
+        with profiler.phase("tick_and_dispatch"):
+            pass
+        profiler.end_tick()
+        assert profiler.end_slot(0, "2024-01-01T00:00") is None
+
+    @staticmethod
+    def test_slot_summary_contains_phase_and_attributed_times(tmp_path):
+        summary_path = tmp_path / "tick_profile.jsonl"
+        profiler = TickProfiler()
+        profiler.enable(str(summary_path))
+
+        profiler.add("phases", "market_cycle", 2.0)
+        for tick_seconds in (1.0, 3.0):
+            profiler.start_tick()
+            profiler.add("phases", "tick_and_dispatch", tick_seconds)
+            profiler.add(AREA_CATEGORY, "H1 Load", tick_seconds / 2)
+            profiler.add(STRATEGY_CATEGORY, "LoadHoursStrategy", tick_seconds / 2)
+            profiler.add(MARKET_CATEGORY, "Market", 0.1)
+            profiler.end_tick()
+        summary = profiler.end_slot(3, "2024-01-01T00:45")
+
+        assert summary["slot"] == 3
+        assert summary["ticks"] == 2
+        assert summary["phases"]["tick_and_dispatch"] == {
+            "total_s": 4.0, "mean_tick_s": 2.0, "max_tick_s": 3.0}
+        assert summary["phases"]["market_cycle"]["total_s"] == 2.0
+        assert summary[AREA_CATEGORY] == {"H1 Load": 2.0}
+        assert summary[STRATEGY_CATEGORY] == {"LoadHoursStrategy": 2.0}
+        assert summary[MARKET_CATEGORY]["Market"] == 0.2
+        assert json.loads(summary_path.read_text().splitlines()[0]) == summary
+
+    @staticmethod
+    def test_attributed_keys_are_limited_to_the_most_expensive_ones():
+        profiler = TickProfiler(max_attributed_keys=2)
+        profiler.enable()
+        for index, seconds in enumerate((1.0, 3.0, 2.0)):
+            profiler.add(AREA_CATEGORY, f"area {index}", seconds)
+        assert profiler.end_slot(0, "")[AREA_CATEGORY] == {"area 1": 3.0, "area 2": 2.0}
+
+    @staticmethod
+    def test_markets_are_profiled_per_area_path_and_slot():
+        houses = [Area("House"), Area("House")]
+        Area("Grid", children=[Area("Street 1", children=[houses[0]]),
+                               Area("Street 2", children=[houses[1]])])
+        slots = [datetime(2024, 1, 1, 0, 0), datetime(2024, 1, 1, 0, 15)]
+        markets = []
+        for house in houses:
+            for slot in slots:
+                market = OneSidedMarket(name=house.name, time_slot=slot)
+                market.owner = house
+                markets.append(market)
+
+        keys = [market_profile_key(market) for market in markets]
+        assert len(set(keys)) == 4
+        assert keys[0].startswith("Grid/Street 1/House:")
+
+        profiler = TickProfiler()
+        profiler.enable()
+        for market in markets:
+            with profiler.measure_market(market):
+                pass
+        assert set(profiler.end_slot(0, "")[MARKET_CATEGORY]) == set(keys)
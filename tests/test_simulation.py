@@ -15,16 +15,21 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
+import os
 from unittest.mock import MagicMock, Mock, patch
 
+import pytest
 from gsy_framework.constants_limits import TIME_ZONE, GlobalConfig
 from gsy_framework.kafka_communication.kafka_producer import (DisabledKafkaConnection,
                                                               KafkaConnection)
 from gsy_framework.sim_results.all_results import ResultsHandler
 from pendulum import duration, today
 
+import gsy_e.constants
 from gsy_e.gsy_e_core.sim_results.endpoint_buffer import SimulationEndpointBuffer
 from gsy_e.gsy_e_core.simulation import Simulation
+from gsy_e.gsy_e_core.simulation.checkpoint import (CHECKPOINT_MAGIC, CheckpointException,
+                                                    dump_checkpoint, load_checkpoint)
 from gsy_e.models.config import SimulationConfig
 
 
@@ -88,3 +93,84 @@ class TestSimulation:
 
         simulation._results.endpoint_buffer.prepare_results_for_publish.assert_not_called()
         simulation._results.kafka_connection.publish.assert_not_called()
+
+
+class TestSimulationCheckpoint:
+    # pylint: disable=protected-access
+
+    @staticmethod
+    def setup_method() -> None:
+        gsy_e.constants.RETAIN_PAST_MARKET_STRATEGIES_STATE = True
+
+    @staticmethod
+    def teardown_method() -> None:
+        gsy_e.constants.RETAIN_PAST_MARKET_STRATEGIES_STATE = False
+        GlobalConfig.sim_duration = duration(days=GlobalConfig.DURATION_D)
+        GlobalConfig.slot_length = duration(minutes=GlobalConfig.SLOT_LENGTH_M)
+        GlobalConfig.tick_length = duration(seconds=GlobalConfig.TICK_LENGTH_S)
+
+    @staticmethod
+    def _create_simulation(**kwargs) -> Simulation:
+        simulation_config = SimulationConfig(duration(hours=4),
+                                             duration(minutes=60),
+                                             duration(seconds=60),
+                                             market_maker_rate=30,
+                                             start_date=today(tz=TIME_ZONE),
+                                             external_connection_enabled=False)
+        return Simulation("default_2a", simulation_config, None, 1234, no_export=True, **kwargs)
+
+    @classmethod
+    def _collect_trades(cls, area) -> list:
+        trades = [(area.name, str(market.time_slot), trade.seller.name, trade.buyer.name,
+                   round(trade.traded_energy, 6), round(trade.trade_price, 6))
+                  for market in area.past_markets for trade in market.trades]
+        for child in area.children:
+            trades.extend(cls._collect_trades(child))
+        return sorted(trades)
+
+    @patch("gsy_e.gsy_e_core.simulation.external_events.SimulationExternalEvents", Mock())
+    def test_resumed_run_reproduces_results_of_uninterrupted_run(self, tmp_path):
+        simulation = self._create_simulation(
+            checkpoint_path=str(tmp_path), checkpoint_interval_slots=2)
+        simulation.run()
+        expected_trades = self._collect_trades(simulation.area)
+        checkpoint_file = simulation._checkpoints.file_path_for_slot(1)
+        assert os.path.isfile(checkpoint_file)
+        assert expected_trades
+
+        resumed_simulation = self._create_simulation()
+        initial_slot = resumed_simulation.restore_checkpoint(checkpoint_file)
+        assert initial_slot == 2
+        resumed_simulation.run(initial_slot=initial_slot)
+
+        assert self._collect_trades(resumed_simulation.area) == expected_trades
+
+    @patch("gsy_e.gsy_e_core.simulation.simulation.NonBlockingConsole")
+    def test_simulation_runs_without_interactive_console(self, console_mock):
+        simulation = self._create_simulation(interactive_console=False)
+        simulation.run()
+        console_mock.assert_not_called()
+        assert simulation.simulation_id is None
+        assert simulation.progress_info.current_slot_number > 0
+
+    def test_restored_checkpoint_area_is_used_by_the_external_events(self, tmp_path):
+        simulation = self._create_simulation(
+            checkpoint_path=str(tmp_path), checkpoint_interval_slots=2)
+        simulation.run()
+
+        resumed_simulation = self._create_simulation()
+        discarded_area = resumed_simulation.area
+        resumed_simulation.restore_checkpoint(simulation._checkpoints.file_path_for_slot(1))
+        assert resumed_simulation.area is not discarded_area
+        redis_connection = resumed_simulation._external_events.redis_connection
+        assert redis_connection._area is resumed_simulation.area
+
+    @patch("gsy_e.gsy_e_core.simulation.external_events.SimulationExternalEvents", Mock())
+    def test_load_checkpoint_rejects_unknown_format_version(self):
+        simulation = self._create_simulation()
+        data = bytearray(dump_checkpoint(simulation, 0))
+        data[len(CHECKPOINT_MAGIC) + 1] += 1
+        with pytest.raises(CheckpointException):
+            load_checkpoint(bytes(data), simulation)
+        with pytest.raises(CheckpointException):
+            load_checkpoint(b"NOTACKPT" + bytes(data[len(CHECKPOINT_MAGIC):]), simulation)
@@ -117,6 +117,22 @@ class TestConsumptionState(TestProsumptionInterface):
             )
         assert "Energy requirement for device test_area fell below zero " in str(error.value)
 
+    def test_decrement_energy_requirement_profile_respects_subtraction(self):
+        time_slot, consumption_state = self._setup_default_test_consumption_state()
+        next_time_slot = time_slot.add(minutes=15)
+        consumption_state.set_desired_energy(energy=2, time_slot=next_time_slot)
+        consumption_state.decrement_energy_requirement_profile(
+            purchased_energy_profile_Wh={time_slot: 0.3, next_time_slot: 0.5},
+            area_name="test_area",
+        )
+        assert isclose(consumption_state.get_energy_requirement_Wh(time_slot), 0.7)
+        assert isclose(consumption_state.get_energy_requirement_Wh(next_time_slot), 1.5)
+        with pytest.raises(AssertionError) as error:
+            consumption_state.decrement_energy_requirement_profile(
+                purchased_energy_profile_Wh={time_slot: 1.2}, area_name="test_area"
+            )
+        assert "Energy requirement for device test_area fell below zero " in str(error.value)
+
     def test_delete_past_state_values_market_slot_not_in_past(self):
         past_time_slot, consumption_state = self._setup_default_test_consumption_state()
         current_time_slot = past_time_slot.add(minutes=15)
@@ -91,6 +91,21 @@ class TestProductionState(TestProsumptionInterface):
             initial_available_energy - 2 * sold_energy
         )
 
+    def test_decrement_available_energy_profile_respects_subtraction(self):
+        time_slot, production_state = self._setup_default_test_production_state()
+        next_time_slot = time_slot.add(minutes=15)
+        production_state.set_available_energy(energy_kWh=2, time_slot=next_time_slot)
+        production_state.decrement_available_energy_profile(
+            sold_energy_profile_kWh={time_slot: 0.3, next_time_slot: 0.5}, area_name="test_area"
+        )
+        assert isclose(production_state.get_available_energy_kWh(time_slot), 0.7)
+        assert isclose(production_state.get_available_energy_kWh(next_time_slot), 1.5)
+        with pytest.raises(AssertionError) as error:
+            production_state.decrement_available_energy_profile(
+                sold_energy_profile_kWh={time_slot: 1.2}, area_name="test_area"
+            )
+        assert "Available energy for device test_area fell below zero " in str(error.value)
+
     def test_decrement_energy_requirement_sell_more_than_possible_raise_error(self):
         time_slot, production_state = self._setup_default_test_production_state()
         sold_energy = 1.2